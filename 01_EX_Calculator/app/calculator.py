@@ -1,3 +1,18 @@
+import math
+import mmap
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from math import nan
+from numbers import Number
+from operator import add, sub, mul, truediv
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, the batch functions fall back to plain Python
+    numpy = None
+
 def sum_numbers(num_1, num_2):
     return num_1 +num_2
 
@@ -8,4 +23,224 @@ def multiply_numbers(num_1, num_2):
     return num_1 * num_2
 
 def divide_numbers(num_1, num_2):
-    return num_1/num_2
\ No newline at end of file
+    return num_1/num_2
+
+
+#
+# Batch variants
+#
+# The batch functions take two equally long sequences, or one sequence and one
+# plain number, and compute the element-wise result in a single pass.
+# NumPy arrays are handed to the matching ufunc and give back an ndarray.
+# Anything else (lists, array.array, buffer-protocol objects, iterables)
+# is processed with map() over the operator functions and gives back a list.
+#
+DIVIDE_BY_ZERO_POLICIES = ("raise", "nan", "mask")
+
+def _is_ndarray(value):
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+def _as_values(values):
+    if isinstance(values, (list, tuple, array)):
+        return values
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return values if hasattr(values, "__len__") else list(values)
+    if view.ndim != 1:
+        raise ValueError("Batch operands must be one-dimensional.")
+    return view.tolist()
+
+def _as_ndarray(values):
+    if _is_ndarray(values):
+        return values
+    # asarray would wrap a generator (or a set) in a 0-d object array
+    values = numpy.asarray(_as_values(values))
+    if values.ndim == 0:
+        raise TypeError("Batch operands must be sequences or plain numbers.")
+    return values
+
+def _operands(num_1, num_2):
+    scalar_1 = isinstance(num_1, Number)
+    scalar_2 = isinstance(num_2, Number)
+    if scalar_1 and scalar_2:
+        raise TypeError("At least one operand must be a sequence.")
+    if _is_ndarray(num_1) or _is_ndarray(num_2):
+        values_1 = num_1 if scalar_1 else _as_ndarray(num_1)
+        values_2 = num_2 if scalar_2 else _as_ndarray(num_2)
+        if numpy.ndim(values_1) > 1 or numpy.ndim(values_2) > 1:
+            raise ValueError("Batch operands must be one-dimensional.")
+        if numpy.ndim(values_1) and numpy.ndim(values_2) and len(values_1) != len(values_2):
+            raise ValueError("Batch operands must have the same length.")
+        return values_1, values_2
+    values_1 = None if scalar_1 else _as_values(num_1)
+    values_2 = None if scalar_2 else _as_values(num_2)
+    if values_1 is not None and values_2 is not None and len(values_1) != len(values_2):
+        raise ValueError("Batch operands must have the same length.")
+    size = len(values_2) if values_1 is None else len(values_1)
+    if values_1 is None:
+        values_1 = repeat(num_1, size)
+    if values_2 is None:
+        values_2 = repeat(num_2, size)
+    return values_1, values_2
+
+def _apply(operator_func, ufunc_name, num_1, num_2):
+    values_1, values_2 = _operands(num_1, num_2)
+    if _is_ndarray(values_1) or _is_ndarray(values_2):
+        return getattr(numpy, ufunc_name)(values_1, values_2)
+    return list(map(operator_func, values_1, values_2))
+
+def sum_arrays(num_1, num_2):
+    return _apply(add, "add", num_1, num_2)
+
+def subtract_arrays(num_1, num_2):
+    return _apply(sub, "subtract", num_1, num_2)
+
+def multiply_arrays(num_1, num_2):
+    return _apply(mul, "multiply", num_1, num_2)
+
+def _divide_or_nan(num_1, num_2):
+    return num_1 / num_2 if num_2 else nan
+
+def _divide_ndarrays(values_1, values_2, on_zero):
+    zero = numpy.asarray(values_2) == 0
+    if on_zero == "raise" and zero.any():
+        index = int(numpy.flatnonzero(zero)[0]) if zero.ndim else 0
+        raise ZeroDivisionError(f"Division by zero at index {index}.")
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        result = numpy.true_divide(values_1, values_2)
+    result[numpy.broadcast_to(zero, result.shape)] = nan
+    if on_zero == "mask":
+        return result, numpy.broadcast_to(zero, result.shape).copy()
+    return result
+
+def divide_arrays(num_1, num_2, on_zero="raise"):
+    """
+    Element-wise division with a selectable divide-by-zero policy.
+
+    "raise": raise ZeroDivisionError naming the first index with a zero divisor
+    "nan":   put NaN where the divisor is zero
+    "mask":  return (values, mask) where mask[i] is True if the divisor was zero
+             (values[i] is NaN there)
+    """
+    if on_zero not in DIVIDE_BY_ZERO_POLICIES:
+        raise ValueError(f"on_zero must be one of {DIVIDE_BY_ZERO_POLICIES}.")
+    values_1, values_2 = _operands(num_1, num_2)
+    if _is_ndarray(values_1) or _is_ndarray(values_2):
+        return _divide_ndarrays(values_1, values_2, on_zero)
+    # Kept as lists so the slow path can read the operands a second time
+    dividends = values_1 if isinstance(values_1, list) else list(values_1)
+    divisors = values_2 if isinstance(values_2, list) else list(values_2)
+    try:
+        result = list(map(truediv, dividends, divisors))
+    except ZeroDivisionError:
+        # Slow path, only taken when the batch actually contains a zero divisor
+        if on_zero == "raise":
+            raise ZeroDivisionError(f"Division by zero at index {divisors.index(0)}.") from None
+        result = list(map(_divide_or_nan, dividends, divisors))
+        if on_zero == "mask":
+            return result, [divisor == 0 for divisor in divisors]
+        return result
+    if on_zero == "mask":
+        return result, [False] * len(result)
+    return result
+
+
+#
+# Streaming reductions
+#
+# stream_sum, stream_product and stream_mean take any iterable of numbers or
+# a buffer (array.array, NumPy array, memoryview). Buffers are read with their
+# own item format, so bytes are values 0-255; a file of raw float64 values has
+# to be opened with memory_map_doubles. The input is consumed in chunks of
+# chunk_size values, so memory use does not grow with the length of the stream.
+#
+# Each chunk is summed with math.fsum (correctly rounded) and the chunk totals
+# are combined in input order with Neumaier's compensated summation.
+# With workers=N the chunks are reduced on a pool of N processes; results are
+# still merged in input order, so the answer does not depend on scheduling.
+#
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+def memory_map_doubles(path):
+    """Memory-map a file of native float64 values for the stream functions."""
+    with open(path, "rb") as file:
+        if not file.seek(0, 2):
+            return memoryview(b"").cast('d')
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast('d')
+
+def _chunks(values, chunk_size):
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    try:
+        view = memoryview(values)
+    except TypeError:
+        iterator = iter(values)
+        while chunk := list(islice(iterator, chunk_size)):
+            yield chunk
+        return
+    if view.format == 'c':
+        raise TypeError("Streams of characters cannot be reduced; cast the buffer to a numeric format.")
+    if view.ndim != 1:
+        raise ValueError("Streams must be one-dimensional.")
+    for start in range(0, len(view), chunk_size):
+        yield view[start:start + chunk_size]
+
+def _sum_chunk(chunk):
+    return math.fsum(chunk), len(chunk)
+
+def _product_chunk(chunk):
+    return math.prod(chunk), len(chunk)
+
+def _reduce_buffer_chunk(chunk_func, data, format):
+    # Buffer chunks travel to worker processes as raw bytes, which pickle
+    # far faster than a list of floats
+    return chunk_func(memoryview(data).cast(format))
+
+def _reduce_chunks(chunk_func, values, chunk_size, workers):
+    chunks = _chunks(values, chunk_size)
+    if not workers:
+        yield from map(chunk_func, chunks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # At most two chunks per worker in flight keeps memory bounded
+        pending = deque()
+        for chunk in chunks:
+            if isinstance(chunk, memoryview):
+                pending.append(pool.submit(_reduce_buffer_chunk, chunk_func, chunk.tobytes(), chunk.format[-1]))
+            else:
+                pending.append(pool.submit(chunk_func, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def _compensated_sum(values, chunk_size, workers):
+    total = 0.0
+    compensation = 0.0
+    count = 0
+    for partial, size in _reduce_chunks(_sum_chunk, values, chunk_size, workers):
+        running = total + partial
+        if abs(total) >= abs(partial):
+            compensation += (total - running) + partial
+        else:
+            compensation += (partial - running) + total
+        total = running
+        count += size
+    return total + compensation, count
+
+def stream_sum(values, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    return _compensated_sum(values, chunk_size, workers)[0]
+
+def stream_product(values, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    product = 1
+    for partial, _ in _reduce_chunks(_product_chunk, values, chunk_size, workers):
+        product *= partial
+    return product
+
+def stream_mean(values, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    total, count = _compensated_sum(values, chunk_size, workers)
+    if count == 0:
+        raise ValueError("Cannot take the mean of an empty stream.")
+    return total / count
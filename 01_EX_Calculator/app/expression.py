@@ -0,0 +1,207 @@
+"""
+Compiled arithmetic expressions built on the calculator primitives.
+
+A formula such as "(a + b) * (a + b) / 2" is parsed once into a Plan: a flat
+list of steps where each step applies one of the four calculator operations
+to variables, constants or the result of an earlier step. While compiling,
+constant sub-expressions are folded and repeated sub-expressions are computed
+only once. Plans are kept in a bounded LRU cache keyed by the formula text.
+"""
+import ast
+from collections import OrderedDict
+
+from app.calculator import (
+    sum_numbers, subtract_numbers, multiply_numbers, divide_numbers,
+    sum_arrays, subtract_arrays, multiply_arrays, divide_arrays,
+)
+
+_OPERATORS = {ast.Add: "add", ast.Sub: "subtract", ast.Mult: "multiply", ast.Div: "divide"}
+_SCALAR_FUNCTIONS = {
+    "add": sum_numbers,
+    "subtract": subtract_numbers,
+    "multiply": multiply_numbers,
+    "divide": divide_numbers,
+}
+_BATCH_FUNCTIONS = {
+    "add": sum_arrays,
+    "subtract": subtract_arrays,
+    "multiply": multiply_arrays,
+    "divide": divide_arrays,
+}
+_COMMUTATIVE = {"add", "multiply"}
+
+# Operands are ("const", value), ("var", name) or ("step", index)
+
+
+class _Compiler:
+    def __init__(self):
+        self.steps = []
+        self.variables = []
+        self._seen = {}
+
+    def compile(self, node):
+        if isinstance(node, ast.Expression):
+            return self.compile(node.body)
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return ("const", node.value)
+        if isinstance(node, ast.Name):
+            if node.id not in self.variables:
+                self.variables.append(node.id)
+            return ("var", node.id)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.UAdd):
+            return self.compile(node.operand)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            return self._step("multiply", ("const", -1), self.compile(node.operand))
+        if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+            return self._step(_OPERATORS[type(node.op)], self.compile(node.left), self.compile(node.right))
+        raise ValueError(f"Unsupported expression element: {ast.dump(node)}")
+
+    def _step(self, operation, left, right):
+        # Constant folding (a constant division by zero is left for run time)
+        if left[0] == "const" and right[0] == "const":
+            if not (operation == "divide" and right[1] == 0):
+                return ("const", _SCALAR_FUNCTIONS[operation](left[1], right[1]))
+        if operation in _COMMUTATIVE and repr(right) < repr(left):
+            left, right = right, left
+        # Common subexpression elimination
+        key = (operation, _operand_key(left), _operand_key(right))
+        if key not in self._seen:
+            self._seen[key] = len(self.steps)
+            self.steps.append((operation, left, right))
+        return ("step", self._seen[key])
+
+
+def _operand_key(operand):
+    # Constants 1 and 1.0 (or 0.0 and -0.0) compare equal but give results
+    # of a different type or sign, so they must not share a step
+    if operand[0] == "const":
+        return ("const", type(operand[1]), repr(operand[1]))
+    return operand
+
+
+class Plan:
+    """
+    A compiled formula. Use evaluate() for a single set of bindings and
+    evaluate_batch() for columns of bindings.
+    """
+
+    def __init__(self, formula, variables, steps, result):
+        self.formula = formula
+        self.variables = tuple(variables)
+        self.steps = tuple(steps)
+        self.result = result
+
+    def __repr__(self):
+        return f"Plan({self.formula!r}, steps={len(self.steps)})"
+
+    def _bindings(self, bindings):
+        missing = [name for name in self.variables if name not in bindings]
+        if missing:
+            raise ValueError(f"Missing binding for variable(s): {', '.join(missing)}")
+
+    def evaluate(self, /, **bindings):
+        self._bindings(bindings)
+        results = []
+
+        def resolve(operand):
+            kind, value = operand
+            if kind == "const":
+                return value
+            if kind == "var":
+                return bindings[value]
+            return results[value]
+
+        for operation, left, right in self.steps:
+            results.append(_SCALAR_FUNCTIONS[operation](resolve(left), resolve(right)))
+        return resolve(self.result)
+
+    def evaluate_batch(self, bindings, on_zero="raise"):
+        """
+        Evaluate the plan over columns of bindings.
+
+        :param bindings: mapping of variable name to an equally long sequence
+        :param on_zero: "raise" or "nan", see calculator.divide_arrays
+        :return: list (or NumPy array) with one result per row
+        """
+        if on_zero not in ("raise", "nan"):
+            raise ValueError("on_zero must be 'raise' or 'nan' for expression batches.")
+        self._bindings(bindings)
+        size = len(next(iter(bindings.values()))) if bindings else 1
+        results = []
+
+        def resolve(operand):
+            kind, value = operand
+            if kind == "const":
+                return value
+            if kind == "var":
+                return bindings[value]
+            return results[value]
+
+        for operation, left, right in self.steps:
+            left_value, right_value = resolve(left), resolve(right)
+            if left[0] == "const" and right[0] == "const":
+                # Only an unfolded constant division by zero ends up here
+                left_value = [left_value] * size
+            if operation == "divide":
+                results.append(divide_arrays(left_value, right_value, on_zero=on_zero))
+            else:
+                results.append(_BATCH_FUNCTIONS[operation](left_value, right_value))
+        if self.result[0] == "const":
+            return [self.result[1]] * size
+        return resolve(self.result)
+
+
+def parse_expression(formula):
+    """Parse and optimise a formula into a new Plan (bypasses the cache)."""
+    try:
+        tree = ast.parse(formula, mode="eval")
+    except SyntaxError as error:
+        raise ValueError(f"Invalid expression: {formula!r}") from error
+    compiler = _Compiler()
+    result = compiler.compile(tree)
+    return Plan(formula, compiler.variables, compiler.steps, result)
+
+
+class PlanCache:
+    """Bounded LRU cache of compiled plans with hit and miss counters."""
+
+    def __init__(self, maxsize=256):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._plans = OrderedDict()
+
+    def __len__(self):
+        return len(self._plans)
+
+    def get(self, formula):
+        plan = self._plans.get(formula)
+        if plan is not None:
+            self.hits += 1
+            self._plans.move_to_end(formula)
+            return plan
+        self.misses += 1
+        plan = parse_expression(formula)
+        self._plans[formula] = plan
+        if len(self._plans) > self.maxsize:
+            self._plans.popitem(last=False)
+        return plan
+
+    def clear(self):
+        self._plans.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+plan_cache = PlanCache()
+
+
+def compile_expression(formula, cache=None):
+    """Return the cached Plan for formula, compiling it on first use."""
+    return (plan_cache if cache is None else cache).get(formula)
+
+
+def evaluate_expression(formula, /, **bindings):
+    return compile_expression(formula).evaluate(**bindings)
@@ -0,0 +1,42 @@
+"""
+Throughput of the batch arithmetic functions against a scalar loop.
+
+Operands are NumPy arrays when NumPy is installed, array('d') otherwise.
+Run from the exercise folder:  python -m benchmarks.bench_batch_calculator [max_exponent]
+"""
+import random
+import sys
+import time
+from array import array
+
+from app.calculator import *
+from app.calculator import numpy
+
+
+def _elements_per_second(func, size):
+    start = time.perf_counter()
+    func()
+    return size / (time.perf_counter() - start)
+
+
+def main(max_exponent=7):
+    print(f"{'elements':>10} {'operation':>9} {'scalar/s':>14} {'batch/s':>14} {'speedup':>8}")
+    for exponent in range(3, max_exponent + 1):
+        size = 10 ** exponent
+        num_1 = array('d', (random.uniform(-1e6, 1e6) for _ in range(size)))
+        num_2 = array('d', (random.uniform(1, 1e6) for _ in range(size)))
+        if numpy is not None:
+            num_1, num_2 = numpy.asarray(num_1), numpy.asarray(num_2)
+        for name, scalar_func, batch_func in [
+            ("sum", sum_numbers, sum_arrays),
+            ("subtract", subtract_numbers, subtract_arrays),
+            ("multiply", multiply_numbers, multiply_arrays),
+            ("divide", divide_numbers, divide_arrays),
+        ]:
+            scalar = _elements_per_second(lambda: [scalar_func(a, b) for a, b in zip(num_1, num_2)], size)
+            batch = _elements_per_second(lambda: batch_func(num_1, num_2), size)
+            print(f"{size:>10} {name:>9} {scalar:>14,.0f} {batch:>14,.0f} {batch / scalar:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
@@ -0,0 +1,40 @@
+"""
+Compiled plans against re-parsing the formula for every binding.
+
+Run from the exercise folder:  python -m benchmarks.bench_expression [rows]
+"""
+import random
+import sys
+import time
+
+from app.expression import compile_expression, parse_expression, plan_cache
+
+FORMULA = "(price * quantity - discount) * (1 + vat / 100) + (price * quantity - discount) / 10"
+
+
+def _rows_per_second(func, rows):
+    start = time.perf_counter()
+    func()
+    return rows / (time.perf_counter() - start)
+
+
+def main(rows=100_000):
+    columns = {
+        "price": [random.uniform(1, 1000) for _ in range(rows)],
+        "quantity": [random.randint(1, 20) for _ in range(rows)],
+        "discount": [random.uniform(0, 50) for _ in range(rows)],
+        "vat": [25.0] * rows,
+    }
+    records = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    results = {
+        "re-parse per row": _rows_per_second(lambda: [parse_expression(FORMULA).evaluate(**r) for r in records], rows),
+        "cached plan per row": _rows_per_second(lambda: [compile_expression(FORMULA).evaluate(**r) for r in records], rows),
+        "cached plan, batch": _rows_per_second(lambda: compile_expression(FORMULA).evaluate_batch(columns), rows),
+    }
+    for name, speed in results.items():
+        print(f"{name:>22}: {speed:>14,.0f} rows/s")
+    print(f"plan cache: {plan_cache.hits} hits, {plan_cache.misses} misses")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,47 @@
+"""
+Throughput of the streaming reductions on a memory-mapped float64 file,
+compared with chaining sum_numbers and with math.fsum on a list in memory.
+
+Run from the exercise folder:  python -m benchmarks.bench_stream_calculator [elements]
+"""
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+
+from app.calculator import memory_map_doubles, stream_sum, sum_numbers
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def _chained_sum(values):
+    total = 0.0
+    for value in values:
+        total = sum_numbers(total, value)
+    return total
+
+
+def main(elements=10_000_000):
+    values = array('d', (random.uniform(-1e6, 1e6) for _ in range(elements)))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "values.f64")
+        with open(path, "wb") as file:
+            values.tofile(file)
+        exact, _ = _timed(lambda: math.fsum(values))
+        runs = [("chained sum_numbers", lambda: _chained_sum(values))]
+        runs += [(f"stream_sum, workers={workers}", lambda w=workers: stream_sum(memory_map_doubles(path), workers=w))
+                 for workers in (None, 2, 4)]
+        for name, func in runs:
+            result, seconds = _timed(func)
+            print(f"{name:>24}: {elements / seconds:>14,.0f} values/s, error vs fsum {abs(result - exact):.3g}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,124 @@
+from app.calculator import *
+from array import array
+import math
+
+import pytest
+
+#
+# Element-wise results match the scalar functions
+#
+@pytest.mark.parametrize("batch_func, scalar_func", [
+    (sum_arrays, sum_numbers),
+    (subtract_arrays, subtract_numbers),
+    (multiply_arrays, multiply_numbers),
+    (divide_arrays, divide_numbers),
+])
+def test_batch_matches_scalar(batch_func, scalar_func):
+    num_1 = [4, 15, -4, 10, 2.5]
+    num_2 = [13, 21, 5, 4, -0.5]
+    expected = [scalar_func(a, b) for a, b in zip(num_1, num_2)]
+    assert list(batch_func(num_1, num_2)) == expected
+
+def test_batch_accepts_buffer_protocol_sequences():
+    num_1 = array('d', [1.0, 2.0, 3.0])
+    num_2 = memoryview(array('q', [10, 20, 30]))
+    assert list(sum_arrays(num_1, num_2)) == [11.0, 22.0, 33.0]
+
+def test_batch_accepts_generators():
+    assert list(multiply_arrays((x for x in range(4)), [2, 2, 2, 2])) == [0, 2, 4, 6]
+
+def test_batch_broadcasts_a_scalar_operand():
+    assert list(subtract_arrays([10, 20, 30], 5)) == [5, 15, 25]
+    assert list(divide_arrays(60, [2, 3, 4])) == [30, 20, 15]
+
+def test_batch_keeps_integer_results_like_scalar():
+    result = sum_arrays([4, 5], [13, 21])
+    assert result == [17, 26]
+    assert all(isinstance(value, int) for value in result)
+
+#
+# Negative testing
+#
+def test_batch_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        sum_arrays([1, 2, 3], [1, 2])
+
+def test_batch_two_scalars_raises():
+    with pytest.raises(TypeError):
+        sum_arrays(1, 2)
+
+def test_batch_two_dimensional_buffer_raises():
+    matrix = memoryview(bytes(4)).cast('B', (2, 2))
+    with pytest.raises(ValueError):
+        sum_arrays(matrix, [1, 2])
+
+#
+# Divide-by-zero policies
+#
+def test_divide_by_zero_raise_names_index():
+    with pytest.raises(ZeroDivisionError, match="index 2"):
+        divide_arrays([1, 2, 3, 4], [1, 1, 0, 0])
+
+def test_divide_by_zero_scalar_divisor_raises():
+    with pytest.raises(ZeroDivisionError, match="index 0"):
+        divide_arrays([1, 2], 0)
+
+def test_divide_by_zero_nan():
+    result = divide_arrays([1, 2, 3], [1, 0, 3], on_zero="nan")
+    assert result[0] == 1 and math.isnan(result[1]) and result[2] == 1
+
+def test_divide_by_zero_mask():
+    values, mask = divide_arrays([1, 2, 3], [1, 0, 3], on_zero="mask")
+    assert mask == [False, True, False]
+    assert values[0] == 1 and math.isnan(values[1]) and values[2] == 1
+
+def test_divide_mask_without_zeros():
+    values, mask = divide_arrays([4, 9], [2, 3], on_zero="mask")
+    assert list(values) == [2, 3]
+    assert mask == [False, False]
+
+def test_divide_by_zero_with_generators():
+    with pytest.raises(ZeroDivisionError, match="index 1"):
+        divide_arrays((x for x in [1, 2, 3]), (y for y in [1, 0, 2]))
+    values = divide_arrays((x for x in [1, 2, 3]), [1, 0, 2], on_zero="nan")
+    assert values[0] == 1 and math.isnan(values[1]) and values[2] == 1.5
+    values, mask = divide_arrays(iter([1, 2, 3]), 0, on_zero="mask")
+    assert mask == [True, True, True]
+    assert len(values) == 3 and all(math.isnan(value) for value in values)
+    values, mask = divide_arrays(6, (y for y in [3, 0]), on_zero="mask")
+    assert values[0] == 2 and math.isnan(values[1]) and mask == [False, True]
+
+def test_divide_unknown_policy_raises():
+    with pytest.raises(ValueError):
+        divide_arrays([1], [1], on_zero="ignore")
+
+#
+# NumPy arrays (only when NumPy is installed)
+#
+def test_batch_numpy_arrays_return_ndarray():
+    numpy = pytest.importorskip("numpy")
+    result = multiply_arrays(numpy.array([1.0, 2.0, 3.0]), 2)
+    assert isinstance(result, numpy.ndarray)
+    assert result.tolist() == [2.0, 4.0, 6.0]
+
+def test_divide_numpy_policies():
+    numpy = pytest.importorskip("numpy")
+    num_1 = numpy.array([1.0, 2.0, 3.0])
+    num_2 = numpy.array([1.0, 0.0, 3.0])
+    with pytest.raises(ZeroDivisionError, match="index 1"):
+        divide_arrays(num_1, num_2)
+    assert numpy.isnan(divide_arrays(num_1, num_2, on_zero="nan")[1])
+    values, mask = divide_arrays(num_1, num_2, on_zero="mask")
+    assert mask.tolist() == [False, True, False]
+    assert values[0] == 1.0 and values[2] == 1.0
+
+def test_numpy_array_with_generator_operand():
+    numpy = pytest.importorskip("numpy")
+    result = sum_arrays(numpy.array([1.0, 2.0, 3.0]), (x for x in [10, 20, 30]))
+    assert result.tolist() == [11.0, 22.0, 33.0]
+    with pytest.raises(ValueError, match="same length"):
+        sum_arrays(numpy.array([1.0, 2.0]), (x for x in [10, 20, 30]))
+    values, mask = divide_arrays((x for x in [1, 2]), numpy.array([0.0, 4.0]), on_zero="mask")
+    assert mask.tolist() == [True, False] and values[1] == 0.5
+    with pytest.raises(TypeError):
+        sum_arrays(numpy.array([1.0, 2.0]), {1, 2})
@@ -0,0 +1,103 @@
+from app.expression import *
+import math
+
+import pytest
+
+#
+# Positive testing
+#
+@pytest.mark.parametrize("formula, bindings, expected", [
+    ("a + b", {"a": 4, "b": 13}, 17),
+    ("a - b * 2", {"a": 10, "b": 3}, 4),
+    ("(a + b) / c", {"a": 3, "b": 7, "c": 4}, 2.5),
+    ("-a + 5", {"a": 2}, 3),
+    ("+a", {"a": 2}, 2),
+    ("2 * 3 + 1", {}, 7),
+])
+def test_evaluate(formula, bindings, expected):
+    assert parse_expression(formula).evaluate(**bindings) == expected
+
+def test_constants_are_folded():
+    plan = parse_expression("x * (2 * 3 + 4)")
+    assert plan.steps == (("multiply", ("const", 10), ("var", "x")),)
+
+def test_common_subexpressions_are_computed_once():
+    plan = parse_expression("(a + b) * (a + b) + (b + a)")
+    assert len(plan.steps) == 3
+    assert plan.evaluate(a=1, b=2) == 12
+
+def test_equal_constants_of_another_type_are_not_shared():
+    plan = parse_expression("(x + 1) * (x + 1.0)")
+    assert len(plan.steps) == 3
+    result = plan.evaluate(x=2)
+    assert result == 9 and type(result) is float
+    assert type(parse_expression("(x + 1) + (x + 1.0) * 0").evaluate(x=2)) is float
+    assert type(parse_expression("x + 1").evaluate(x=2)) is int
+    assert len(parse_expression("(x * 0.0) + (x * -0.0)").steps) == 3
+
+def test_constant_division_by_zero_is_not_folded():
+    plan = parse_expression("x + 1 / 0")
+    with pytest.raises(ZeroDivisionError):
+        plan.evaluate(x=1)
+
+def test_evaluate_batch_matches_scalar():
+    plan = parse_expression("(a + b) * (a - b) / c")
+    columns = {"a": [1, 2, 3, 4], "b": [4, 3, 2, 1], "c": [1, 2, 4, 8]}
+    expected = [plan.evaluate(a=a, b=b, c=c) for a, b, c in zip(*columns.values())]
+    assert plan.evaluate_batch(columns) == expected
+
+def test_evaluate_batch_division_by_zero_policies():
+    plan = parse_expression("a / b")
+    with pytest.raises(ZeroDivisionError):
+        plan.evaluate_batch({"a": [1, 2], "b": [1, 0]})
+    result = plan.evaluate_batch({"a": [1, 2], "b": [1, 0]}, on_zero="nan")
+    assert result[0] == 1 and math.isnan(result[1])
+
+def test_evaluate_batch_constant_and_variable_results():
+    assert parse_expression("2 + 2").evaluate_batch({"a": [1, 2, 3]}) == [4, 4, 4]
+    assert parse_expression("a").evaluate_batch({"a": [1, 2, 3]}) == [1, 2, 3]
+
+#
+# Negative testing
+#
+@pytest.mark.parametrize("formula", ["a ** 2", "f(a)", "a +", "a < b", "'text'", "True + a"])
+def test_unsupported_expressions_raise(formula):
+    with pytest.raises(ValueError):
+        parse_expression(formula)
+
+def test_missing_binding_raises():
+    with pytest.raises(ValueError, match="b"):
+        parse_expression("a + b").evaluate(a=1)
+
+#
+# Plan cache
+#
+def test_cache_counts_hits_and_misses():
+    cache = PlanCache(maxsize=2)
+    first = compile_expression("a + 1", cache)
+    assert compile_expression("a + 1", cache) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_cache_evicts_least_recently_used():
+    cache = PlanCache(maxsize=2)
+    cache.get("a + 1")
+    cache.get("a + 2")
+    cache.get("a + 1")
+    cache.get("a + 3")  # evicts "a + 2"
+    assert len(cache) == 2
+    cache.get("a + 2")
+    assert cache.misses == 4
+
+def test_cache_rejects_zero_size():
+    with pytest.raises(ValueError):
+        PlanCache(maxsize=0)
+
+def test_variables_may_be_named_like_parameters():
+    assert evaluate_expression("formula * self", formula=3, self=4) == 12
+    assert parse_expression("self - formula").evaluate(self=5, formula=2) == 3
+
+def test_evaluate_expression_uses_module_cache():
+    plan_cache.clear()
+    assert evaluate_expression("x * x", x=3) == 9
+    assert evaluate_expression("x * x", x=4) == 16
+    assert (plan_cache.hits, plan_cache.misses) == (1, 1)
@@ -0,0 +1,77 @@
+from app.calculator import *
+from array import array
+import math
+import random
+
+import pytest
+
+random.seed(1)
+VALUES = [random.uniform(-1e6, 1e6) for _ in range(10_000)]
+
+#
+# Results against math.fsum
+#
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000, DEFAULT_CHUNK_SIZE])
+def test_stream_sum_matches_fsum(chunk_size):
+    assert stream_sum(iter(VALUES), chunk_size=chunk_size) == pytest.approx(math.fsum(VALUES), rel=1e-15)
+
+def test_stream_sum_is_exact_for_cancelling_chunks():
+    values = [1e16, 1.0, -1e16] * 1000
+    assert sum(values) != math.fsum(values)
+    assert stream_sum(values, chunk_size=3) == math.fsum(values)
+
+def test_stream_sum_of_buffer():
+    assert stream_sum(array('d', VALUES), chunk_size=999) == pytest.approx(math.fsum(VALUES), rel=1e-15)
+
+def test_stream_sum_of_memory_mapped_file(tmp_path):
+    path = tmp_path / "values.f64"
+    path.write_bytes(array('d', VALUES).tobytes())
+    assert stream_sum(memory_map_doubles(path), chunk_size=512) == pytest.approx(math.fsum(VALUES), rel=1e-15)
+
+def test_stream_mean_matches_fsum():
+    assert stream_mean(VALUES, chunk_size=333) == pytest.approx(math.fsum(VALUES) / len(VALUES), rel=1e-12)
+
+def test_stream_product():
+    assert stream_product(range(1, 11), chunk_size=3) == math.factorial(10)
+
+def test_stream_with_process_pool_matches_serial():
+    serial = stream_sum(VALUES, chunk_size=500)
+    assert stream_sum(VALUES, chunk_size=500, workers=2) == serial
+    assert stream_mean(array('d', VALUES), chunk_size=500, workers=2) == stream_mean(VALUES, chunk_size=500)
+
+#
+# Edge cases
+#
+def test_stream_sum_of_empty_stream_is_0(tmp_path):
+    path = tmp_path / "empty.f64"
+    path.write_bytes(b"")
+    assert stream_sum(memory_map_doubles(path)) == 0
+    assert stream_product([]) == 1
+
+def test_stream_mean_of_empty_stream_raises():
+    with pytest.raises(ValueError):
+        stream_mean([])
+
+def test_stream_invalid_chunk_size_raises():
+    with pytest.raises(ValueError):
+        stream_sum([1, 2], chunk_size=0)
+
+#
+# Byte-sized buffers are read by their own format, not as float64
+#
+@pytest.mark.parametrize("typecode, values", [('B', [1] * 16), ('b', [-3, 5, 7, -1, 2]), ('B', [255, 0, 1])])
+def test_stream_of_byte_sized_arrays(typecode, values):
+    buffer = array(typecode, values)
+    assert stream_sum(buffer) == sum(values)
+    assert stream_mean(buffer, chunk_size=2) == pytest.approx(sum(values) / len(values))
+    assert stream_sum(bytes(array('B', [1] * 8))) == 8
+
+def test_stream_of_byte_sized_numpy_arrays():
+    numpy = pytest.importorskip("numpy")
+    assert stream_sum(numpy.ones(16, dtype=numpy.uint8)) == 16
+    assert stream_mean(numpy.array([-4, 2, 5], dtype=numpy.int8)) == 1
+    assert stream_sum(numpy.ones(16, dtype=numpy.uint8), chunk_size=4, workers=2) == 16
+
+def test_stream_of_characters_raises():
+    with pytest.raises(TypeError):
+        stream_sum(memoryview(b"ab").cast('c'))
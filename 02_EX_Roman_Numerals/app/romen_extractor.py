@@ -0,0 +1,39 @@
+# Streaming extraction of Roman numerals from large text files
+import mmap
+import re
+
+from app.romen_numerals import roman_to_decimal
+
+# A run of numeral letters that is not part of a longer word or number.
+# Bytes >= 0x80 count as word characters so UTF-8 words are not split.
+_CANDIDATE = re.compile(rb"(?<![A-Za-z0-9_\x80-\xff])[IVXLCDM]+(?![A-Za-z0-9_\x80-\xff])")
+
+
+def scan_numerals(buffer, min_length: int = 1):
+    """
+    Lazily yield (offset, text, value) for every valid Roman numeral in a
+    bytes-like buffer. Candidates rejected by roman_to_decimal are skipped.
+    min_length can be raised to skip short words such as the pronoun "I".
+    """
+    for match in _CANDIDATE.finditer(buffer):
+        text = match.group().decode('ascii')
+        if len(text) < min_length:
+            continue
+        try:
+            value = roman_to_decimal(text)
+        except ValueError:
+            continue
+        yield match.start(), text, value
+
+
+def extract_numerals(path, min_length: int = 1):
+    """
+    Lazily yield (byte offset, text, value) for every valid Roman numeral in
+    the file at path. The file is memory-mapped, so memory use does not
+    depend on its size.
+    """
+    with open(path, 'rb') as file:
+        if file.seek(0, 2) == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from scan_numerals(mapped, min_length)
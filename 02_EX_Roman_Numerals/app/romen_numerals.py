@@ -1,29 +1,78 @@
-# Roman numeral to decimal conversion
+# Roman numeral to decimal conversion (and back)
+
+ROMAN_VALUES = {
+    'I': 1,
+    'V': 5,
+    'X': 10,
+    'L': 50,
+    'C': 100,
+    'D': 500,
+    'M': 1000
+}
+# Rules for valid subtractive combinations
+SUBTRACTIVES = {
+    'I': ['V', 'X'],
+    'X': ['L', 'C'],
+    'C': ['D', 'M']
+}
+# Symbols used when writing a number, largest first
+_NUMERAL_PARTS = [
+    (1000, 'M'), (900, 'CM'), (500, 'D'), (400, 'CD'),
+    (100, 'C'), (90, 'XC'), (50, 'L'), (40, 'XL'),
+    (10, 'X'), (9, 'IX'), (5, 'V'), (4, 'IV'), (1, 'I')
+]
+
+
+def _to_roman(number: int) -> str:
+    parts = []
+    for value, symbols in _NUMERAL_PARTS:
+        count, number = divmod(number, value)
+        parts.append(symbols * count)
+    return ''.join(parts)
+
+
+# Every canonical numeral from I to MMMCMXCIX, built once at import.
+# _ENCODE_TABLE[n] is the numeral for n (index 0 is unused).
+_ENCODE_TABLE = [''] + [_to_roman(number) for number in range(1, 4000)]
+_DECODE_TABLE = {roman: number for number, roman in enumerate(_ENCODE_TABLE) if number}
+
+
+def decimal_to_roman(number: int) -> str:
+    if isinstance(number, bool) or not isinstance(number, int):
+        raise TypeError("Number must be an integer.")
+    if not 1 <= number <= 3999:
+        raise ValueError("Number must be between 1 and 3999.")
+    return _ENCODE_TABLE[number]
+
+
+def decimals_to_romans(numbers) -> list:
+    return list(map(decimal_to_roman, numbers))
+
+
+def romans_to_decimals(numerals) -> list:
+    return list(map(roman_to_decimal, numerals))
+
 
 def roman_to_decimal(roman: str) -> int:
-    roman_values = {
-        'I': 1,
-        'V': 5,
-        'X': 10,
-        'L': 50,
-        'C': 100,
-        'D': 500,
-        'M': 1000
-    }
-    # Rules for valid subtractive combinations
-    subtractives = {
-        'I': ['V', 'X'],
-        'X': ['L', 'C'],
-        'C': ['D', 'M']
-    }
+    # Valid canonical numerals resolve with a single lookup. Anything else
+    # goes through the rule-by-rule parser, which either accepts it or
+    # raises the same ValueError as before.
+    if isinstance(roman, str):
+        value = _DECODE_TABLE.get(roman)
+        if value is not None:
+            return value
+    return _parse_roman(roman)
+
+
+def _parse_roman(roman: str) -> int:
     total = 0
     prev_value = 0
     repeat_count = 1
     last_char = ''
     for i, char in enumerate(roman):
-        if char not in roman_values:
+        if char not in ROMAN_VALUES:
             raise ValueError(f"Invalid Roman numeral character: {char}")
-        value = roman_values[char]
+        value = ROMAN_VALUES[char]
         # Check for repeats
         if char == last_char:
             repeat_count += 1
@@ -35,7 +84,7 @@ def roman_to_decimal(roman: str) -> int:
             repeat_count = 1
         # Subtractive notation
         if prev_value and value > prev_value:
-            if last_char not in subtractives or char not in subtractives[last_char]:
+            if last_char not in SUBTRACTIVES or char not in SUBTRACTIVES[last_char]:
                 raise ValueError(f"Invalid subtractive combination: {last_char}{char}")
             total += value - 2 * prev_value  # Remove prev_value added last time, then subtract
         else:
@@ -0,0 +1,50 @@
+"""
+Memory-mapped regex extraction against splitting the text into tokens and
+calling roman_to_decimal on each one.
+
+Run from the exercise folder:  python -m benchmarks.bench_romen_extractor [megabytes]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from app.romen_extractor import extract_numerals
+from app.romen_numerals import decimal_to_roman, roman_to_decimal
+
+WORDS = ["the", "court", "held", "that", "Article", "clause", "section", "and", "of", "Chapter"]
+
+
+def _per_token(path):
+    found = 0
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            for token in line.split():
+                try:
+                    roman_to_decimal(token.strip(".,;:()"))
+                    found += 1
+                except ValueError:
+                    pass
+    return found
+
+
+def main(megabytes=50):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            while file.tell() < megabytes * 1_000_000:
+                words = random.choices(WORDS, k=1000)
+                words[::25] = [decimal_to_roman(random.randint(1, 3999)) for _ in words[::25]]
+                file.write(" ".join(words) + ".\n")
+        size = os.path.getsize(path) / 1_000_000
+        for name, func in [("per token", lambda: _per_token(path)),
+                           ("extract_numerals", lambda: sum(1 for _ in extract_numerals(path)))]:
+            start = time.perf_counter()
+            found = func()
+            seconds = time.perf_counter() - start
+            print(f"{name:>17}: {size / seconds:>8,.1f} MB/s, {found} numerals")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
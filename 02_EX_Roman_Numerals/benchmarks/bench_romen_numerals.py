@@ -0,0 +1,38 @@
+"""
+Table lookup in roman_to_decimal against the rule-by-rule parser, and
+decimal_to_roman against building each numeral symbol by symbol.
+
+The rule parser is the original implementation with its dicts hoisted to
+module level, so the real speed-up over the old code is a little larger.
+Run from the exercise folder:  python -m benchmarks.bench_romen_numerals [rounds]
+"""
+import random
+import sys
+import time
+
+from app.romen_numerals import _DECODE_TABLE, _parse_roman, _to_roman, decimal_to_roman, roman_to_decimal
+
+
+def _numerals_per_second(func, numerals):
+    start = time.perf_counter()
+    for numeral in numerals:
+        func(numeral)
+    return len(numerals) / (time.perf_counter() - start)
+
+
+def main(rounds=100):
+    numerals = list(_DECODE_TABLE) * rounds
+    random.shuffle(numerals)
+    parser = _numerals_per_second(_parse_roman, numerals)
+    table = _numerals_per_second(roman_to_decimal, numerals)
+    print(f"rule parser: {parser:>14,.0f} numerals/s")
+    print(f"table:       {table:>14,.0f} numerals/s ({table / parser:.1f}x)")
+    numbers = [roman_to_decimal(numeral) for numeral in numerals]
+    builder = _numerals_per_second(_to_roman, numbers)
+    encoder = _numerals_per_second(decimal_to_roman, numbers)
+    print(f"symbol by symbol encode: {builder:>14,.0f} numbers/s")
+    print(f"table encode:            {encoder:>14,.0f} numbers/s ({encoder / builder:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,40 @@
+from app.romen_extractor import extract_numerals, scan_numerals
+import pytest
+
+TEXT = "Chapter XIV. See clause IV, section MCMXC and appendix IIII or VX.\nI agree with LIVE and MIX. (CD) XLII"
+
+def test_scan_finds_valid_numerals_with_offsets():
+    found = list(scan_numerals(TEXT.encode()))
+    assert [(text, value) for _, text, value in found] == [
+        ('XIV', 14), ('IV', 4), ('MCMXC', 1990), ('I', 1), ('MIX', 1009), ('CD', 400), ('XLII', 42),
+    ]
+    for offset, text, _ in found:
+        assert TEXT.encode()[offset:offset + len(text)] == text.encode()
+
+def test_scan_skips_invalid_candidates():
+    texts = [text for _, text, _ in scan_numerals(b"IIII VX IC MMMM X")]
+    assert texts == ['X']
+
+def test_scan_ignores_letters_inside_words():
+    assert list(scan_numerals(b"CIVIC DIM LIVED XI2 X_1")) == []
+    assert list(scan_numerals("ÉCLI".encode())) == []
+
+def test_scan_min_length_skips_short_words():
+    assert [text for _, text, _ in scan_numerals(b"I saw part II", min_length=2)] == ['II']
+
+def test_extract_from_file(tmp_path):
+    path = tmp_path / "corpus.txt"
+    path.write_bytes(TEXT.encode())
+    assert list(extract_numerals(path)) == list(scan_numerals(TEXT.encode()))
+
+def test_extract_from_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert list(extract_numerals(path)) == []
+
+def test_extract_is_lazy(tmp_path):
+    path = tmp_path / "corpus.txt"
+    path.write_bytes(b"X " * 100_000)
+    records = extract_numerals(path)
+    assert next(records) == (0, 'X', 10)
+    assert next(records) == (2, 'X', 10)
@@ -1,4 +1,4 @@
-from app.romen_numerals import roman_to_decimal
+from app.romen_numerals import roman_to_decimal, decimal_to_roman, decimals_to_romans, romans_to_decimals
 import pytest
 
 #
@@ -123,3 +123,63 @@ def test_exceeds_maximum():
 #
 def test_roman_to_decimal_returns_int():
     assert isinstance(roman_to_decimal('X'), int)
+
+#
+# Lookup table
+#
+def test_lookup_table_matches_rule_parser_for_every_canonical_numeral():
+    from app.romen_numerals import _DECODE_TABLE, _parse_roman
+    assert len(_DECODE_TABLE) == 3999
+    for roman, value in _DECODE_TABLE.items():
+        assert _parse_roman(roman) == value
+
+def test_non_canonical_numeral_still_uses_rule_parser():
+    # Accepted by the original rules even though it is not canonical
+    assert roman_to_decimal('IIX') == 10
+
+@pytest.mark.parametrize("roman, message", [
+    ('IIII', "I cannot be repeated more than 3 times."),
+    ('VV', "V cannot be repeated."),
+    ('IC', "Invalid subtractive combination: IC"),
+    ('MMMCMXCIXI', "Value exceeds maximum representable Roman numeral (3999)."),
+    ('XA', "Invalid Roman numeral character: A"),
+])
+def test_invalid_numerals_keep_their_error_messages(roman, message):
+    with pytest.raises(ValueError) as error:
+        roman_to_decimal(roman)
+    assert str(error.value) == message
+
+#
+# Decimal to Roman
+#
+@pytest.mark.parametrize("number, expected", [
+    (1, 'I'),
+    (4, 'IV'),
+    (9, 'IX'),
+    (14, 'XIV'),
+    (94, 'XCIV'),
+    (1867, 'MDCCCLXVII'),
+    (3999, 'MMMCMXCIX'),
+])
+def test_decimal_to_roman(number, expected):
+    assert decimal_to_roman(number) == expected
+
+@pytest.mark.parametrize("number", [0, -1, 4000])
+def test_decimal_to_roman_out_of_range(number):
+    with pytest.raises(ValueError):
+        decimal_to_roman(number)
+
+@pytest.mark.parametrize("number", [1.0, "1", True, None])
+def test_decimal_to_roman_requires_int(number):
+    with pytest.raises(TypeError):
+        decimal_to_roman(number)
+
+def test_round_trip_over_full_domain():
+    numbers = list(range(1, 4000))
+    assert romans_to_decimals(decimals_to_romans(numbers)) == numbers
+
+def test_batch_conversion_raises_on_invalid_element():
+    with pytest.raises(ValueError):
+        romans_to_decimals(['X', 'IIII'])
+    with pytest.raises(ValueError):
+        decimals_to_romans([1, 0])
@@ -0,0 +1,97 @@
+# Bloom filter index of breached passwords, stored in a memory-mapped file
+import hashlib
+import math
+import mmap
+import struct
+
+# magic, number of bits, number of hash functions, number of items
+_HEADER = struct.Struct("<8sQQQ")
+_MAGIC = b"PWBLOOM1"
+
+
+def _positions(word: bytes, num_bits: int, num_hashes: int):
+	# Double hashing: bit i is h1 + i * h2, from one 128-bit BLAKE2 digest
+	digest = hashlib.blake2b(word, digest_size=16).digest()
+	h1 = int.from_bytes(digest[:8], "little")
+	h2 = int.from_bytes(digest[8:], "little") | 1
+	return [(h1 + i * h2) % num_bits for i in range(num_hashes)]
+
+
+def bloom_parameters(items: int, false_positive_rate: float):
+	"""
+	Return (number of bits, number of hash functions) for a filter holding
+	items entries at the given false positive rate.
+	"""
+	if not 0 < false_positive_rate < 1:
+		raise ValueError("False positive rate must be between 0 and 1.")
+	items = max(items, 1)
+	num_bits = math.ceil(-items * math.log(false_positive_rate) / math.log(2) ** 2)
+	num_hashes = max(1, round(num_bits / items * math.log(2)))
+	return num_bits, num_hashes
+
+
+def _read_words(wordlist_path):
+	with open(wordlist_path, "rb") as wordlist:
+		for line in wordlist:
+			word = line.rstrip(b"\r\n")
+			if word:
+				yield word
+
+
+def build_bloom_index(wordlist_path, index_path, false_positive_rate=0.001, expected_items=None):
+	"""
+	Build an index file from a wordlist with one UTF-8 password per line.
+	If expected_items is not given the wordlist is read twice, once to count.
+	:return: int, number of words added
+	"""
+	if expected_items is None:
+		expected_items = sum(1 for _ in _read_words(wordlist_path))
+	num_bits, num_hashes = bloom_parameters(expected_items, false_positive_rate)
+	with open(index_path, "w+b") as index:
+		index.truncate(_HEADER.size + (num_bits + 7) // 8)
+		with mmap.mmap(index.fileno(), 0) as bits:
+			offset = _HEADER.size
+			added = 0
+			for word in _read_words(wordlist_path):
+				for position in _positions(word, num_bits, num_hashes):
+					bits[offset + (position >> 3)] |= 1 << (position & 7)
+				added += 1
+			bits[:_HEADER.size] = _HEADER.pack(_MAGIC, num_bits, num_hashes, added)
+	return added
+
+
+class BloomIndex:
+	"""
+	Read-only view of an index file. `password in index` is True for every
+	password in the wordlist and, rarely, for others (false positives).
+	"""
+
+	def __init__(self, index_path):
+		with open(index_path, "rb") as index:
+			self._bits = mmap.mmap(index.fileno(), 0, access=mmap.ACCESS_READ)
+		if len(self._bits) < _HEADER.size:
+			self._bits.close()
+			raise ValueError("Not a Bloom filter index file.")
+		magic, self.num_bits, self.num_hashes, self.items = _HEADER.unpack_from(self._bits)
+		if magic != _MAGIC or len(self._bits) < _HEADER.size + (self.num_bits + 7) // 8:
+			self._bits.close()
+			raise ValueError("Not a Bloom filter index file.")
+
+	def __contains__(self, password) -> bool:
+		if not isinstance(password, str):
+			return False
+		bits = self._bits
+		offset = _HEADER.size
+		for position in _positions(password.encode("utf-8"), self.num_bits, self.num_hashes):
+			if not bits[offset + (position >> 3)] & (1 << (position & 7)):
+				return False
+		return True
+
+	def close(self):
+		self._bits.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc_info):
+		self.close()
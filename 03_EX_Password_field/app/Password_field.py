@@ -1,12 +1,135 @@
+import base64
+import hashlib
+import hmac
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+# scrypt cost settings. Memory use per hash is about 128 * n * r bytes.
+COST_SETTINGS = {
+	"interactive": {"n": 2**14, "r": 8, "p": 1},   # ~16 MB
+	"moderate": {"n": 2**15, "r": 8, "p": 1},      # ~32 MB
+	"sensitive": {"n": 2**17, "r": 8, "p": 1},     # ~128 MB
+}
+DEFAULT_COST = "interactive"
+SALT_BYTES = 16
+HASH_BYTES = 32
+# Stored hashes asking for more than the largest setting are rejected unhashed
+MAX_COST = {key: max(setting[key] for setting in COST_SETTINGS.values()) for key in ("n", "r", "p")}
+
+
 class PasswordField:
-	def __init__(self, password: str):
+	def __init__(self, password: str, breached_passwords=None):
+		"""
+		:param breached_passwords: optional container of known-breached
+			passwords, typically a Bloom_filter.BloomIndex
+		"""
 		if not isinstance(password, str):
 			raise TypeError("Password must be a string.")
 		if len(password) < 6:
 			raise ValueError("Password must be at least 6 characters long.")
 		if len(password) > 10:
 			raise ValueError("Password must be at most 10 characters long.")
+		if breached_passwords is not None and password in breached_passwords:
+			raise ValueError("Password appears in a list of breached passwords.")
 		self.password = password
 
 	def get_password(self):
 		return self.password
+
+
+	def get_password_hash(self, cost=DEFAULT_COST):
+		return hash_password(self.password, cost)
+
+	def matches_hash(self, encoded: str) -> bool:
+		return verify_password(self.password, encoded)
+
+
+def _cost_parameters(cost):
+	if isinstance(cost, str):
+		if cost not in COST_SETTINGS:
+			raise ValueError(f"Cost must be one of {list(COST_SETTINGS)} or a dict with n, r and p.")
+		cost = COST_SETTINGS[cost]
+	n, r, p = cost["n"], cost["r"], cost["p"]
+	_check_cost(n, r, p)
+	return n, r, p
+
+
+def _check_cost(n, r, p):
+	if not (0 < n <= MAX_COST["n"] and 0 < r <= MAX_COST["r"] and 0 < p <= MAX_COST["p"]):
+		raise ValueError("Password hash cost is out of range.")
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+	return hashlib.scrypt(
+		password.encode("utf-8"), salt=salt, n=n, r=r, p=p,
+		maxmem=2 * 128 * n * r * p + 2**20, dklen=HASH_BYTES,
+	)
+
+
+def _b64(data: bytes) -> str:
+	return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def _unb64(text: str) -> bytes:
+	return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def hash_password(password: str, cost=DEFAULT_COST) -> str:
+	"""
+	Hash a password with scrypt and a random salt.
+	:param cost: a name from COST_SETTINGS or a dict with n, r and p
+	:return: str, "scrypt$n$r$p$salt$hash" with base64 salt and hash
+	"""
+	n, r, p = _cost_parameters(cost)
+	salt = os.urandom(SALT_BYTES)
+	digest = _scrypt(password, salt, n, r, p)
+	return f"scrypt${n}${r}${p}${_b64(salt)}${_b64(digest)}"
+
+
+def verify_password(password: str, encoded: str) -> bool:
+	try:
+		algorithm, n, r, p, salt, digest = encoded.split("$")
+		n, r, p = int(n), int(r), int(p)
+		salt, digest = _unb64(salt), _unb64(digest)
+	except (AttributeError, ValueError):
+		raise ValueError("Invalid password hash.")
+	if algorithm != "scrypt":
+		raise ValueError(f"Unsupported password hash algorithm: {algorithm}")
+	_check_cost(n, r, p)
+	return hmac.compare_digest(_scrypt(password, salt, n, r, p), digest)
+
+
+def _verify_pair(pair):
+	return verify_password(*pair)
+
+
+def _map_in_order(func, items, workers):
+	if not workers:
+		yield from map(func, items)
+		return
+	with ProcessPoolExecutor(max_workers=workers) as pool:
+		# A bounded number of jobs in flight keeps memory flat for huge batches
+		pending = deque()
+		for item in items:
+			pending.append(pool.submit(func, item))
+			if len(pending) >= 4 * workers:
+				yield pending.popleft().result()
+		while pending:
+			yield pending.popleft().result()
+
+
+def hash_passwords(passwords, cost=DEFAULT_COST, workers=None):
+	"""
+	Lazily hash many passwords, in input order.
+	:param workers: number of worker processes, None hashes in this process
+	"""
+	_cost_parameters(cost)  # fail fast on an unknown cost setting
+	return _map_in_order(partial(hash_password, cost=cost), passwords, workers)
+
+
+def verify_passwords(pairs, workers=None):
+	"""Lazily verify many (password, encoded hash) pairs, in input order."""
+	return _map_in_order(_verify_pair, pairs, workers)
+
@@ -0,0 +1,36 @@
+"""
+Bloom filter index build time, file size, lookup latency and measured false
+positive rate.
+
+Run from the exercise folder:  python -m benchmarks.bench_Bloom_filter [words]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from app.Bloom_filter import BloomIndex, build_bloom_index
+
+
+def main(words=1_000_000, false_positive_rate=0.001):
+	with tempfile.TemporaryDirectory() as directory:
+		wordlist = os.path.join(directory, "breached.txt")
+		index_path = os.path.join(directory, "breached.bloom")
+		with open(wordlist, "w") as file:
+			file.writelines(f"leak{i:09d}\n" for i in range(words))
+		start = time.perf_counter()
+		build_bloom_index(wordlist, index_path, false_positive_rate, expected_items=words)
+		build_seconds = time.perf_counter() - start
+		print(f"build:       {build_seconds:.1f} s ({words / build_seconds:,.0f} words/s)")
+		print(f"file size:   {os.path.getsize(index_path) / 2**20:.2f} MiB for {words:,} words")
+		with BloomIndex(index_path) as index:
+			for name, candidates in [("hit", [f"leak{i:09d}" for i in range(0, words, max(1, words // 100_000))]),
+			                         ("miss", [f"safe{i:09d}" for i in range(100_000)])]:
+				start = time.perf_counter()
+				found = sum(candidate in index for candidate in candidates)
+				latency = (time.perf_counter() - start) / len(candidates)
+				print(f"lookup {name:<4}: {latency * 1e6:.2f} µs, {found / len(candidates):.4%} reported present")
+
+
+if __name__ == "__main__":
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
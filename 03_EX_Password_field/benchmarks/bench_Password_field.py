@@ -0,0 +1,32 @@
+"""
+scrypt hashes per second per core for each cost setting, in one process
+and on a process pool with one worker per core.
+
+Run from the exercise folder:  python -m benchmarks.bench_Password_field [passwords]
+"""
+import os
+import sys
+import time
+
+from app.Password_field import COST_SETTINGS, hash_passwords
+
+
+def _hashes_per_second(passwords, cost, workers):
+	start = time.perf_counter()
+	for _ in hash_passwords(passwords, cost, workers=workers):
+		pass
+	return len(passwords) / (time.perf_counter() - start)
+
+
+def main(count=50):
+	cores = os.cpu_count() or 1
+	passwords = [f"pass{i:05d}" for i in range(count)]
+	print(f"{'cost':>12} {'1 core':>12} {f'{cores} cores':>12} {'per core':>12}")
+	for name in COST_SETTINGS:
+		single = _hashes_per_second(passwords, name, None)
+		pooled = _hashes_per_second(passwords, name, cores)
+		print(f"{name:>12} {single:>10,.1f}/s {pooled:>10,.1f}/s {pooled / cores:>10,.1f}/s")
+
+
+if __name__ == "__main__":
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
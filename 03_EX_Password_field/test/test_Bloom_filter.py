@@ -0,0 +1,55 @@
+import pytest
+from app.Bloom_filter import BloomIndex, bloom_parameters, build_bloom_index
+from app.Password_field import PasswordField
+
+BREACHED = ["123456", "password", "qwerty123", "iloveyou", "æøåæøå"]
+
+
+@pytest.fixture
+def index(tmp_path):
+	wordlist = tmp_path / "breached.txt"
+	wordlist.write_text("\n".join(BREACHED + [""]) + "\r\n", encoding="utf-8")
+	index_path = tmp_path / "breached.bloom"
+	assert build_bloom_index(wordlist, index_path, false_positive_rate=0.01) == len(BREACHED)
+	with BloomIndex(index_path) as bloom:
+		yield bloom
+
+
+def test_index_contains_every_breached_password(index):
+	for password in BREACHED:
+		assert password in index
+
+def test_index_rarely_contains_other_passwords(index):
+	misses = sum(f"other{i}" in index for i in range(1000))
+	assert misses < 50
+
+def test_index_non_string_is_not_contained(index):
+	assert 123456 not in index
+
+def test_password_field_rejects_breached_password(index):
+	with pytest.raises(ValueError):
+		PasswordField("qwerty123", breached_passwords=index)
+
+def test_password_field_accepts_unbreached_password(index):
+	assert PasswordField("Zq8!rT2m", breached_passwords=index).get_password() == "Zq8!rT2m"
+
+def test_password_field_length_checked_before_breach_list(index):
+	with pytest.raises(ValueError, match="at least 6"):
+		PasswordField("abc", breached_passwords=index)
+
+def test_index_size_follows_false_positive_rate():
+	bits_1, hashes_1 = bloom_parameters(1_000_000, 0.01)
+	bits_2, hashes_2 = bloom_parameters(1_000_000, 0.001)
+	assert 9_000_000 < bits_1 < 10_000_000 and hashes_1 == 7
+	assert bits_2 > bits_1 and hashes_2 == 10
+
+@pytest.mark.parametrize("rate", [0, 1, -0.5])
+def test_invalid_false_positive_rate(rate):
+	with pytest.raises(ValueError):
+		bloom_parameters(100, rate)
+
+def test_open_invalid_index_file(tmp_path):
+	path = tmp_path / "not_an_index"
+	path.write_bytes(b"x" * 100)
+	with pytest.raises(ValueError):
+		BloomIndex(path)
@@ -1,5 +1,5 @@
 import pytest
-from app.Password_field import PasswordField
+from app.Password_field import PasswordField, COST_SETTINGS, hash_password, verify_password, hash_passwords, verify_passwords
 
 # Equivalence partitions:
 # - Invalid: <6 chars, >10 chars, non-string
@@ -66,3 +66,66 @@ def test_password_final_cases(password, expected):
 	else:
 		with pytest.raises((ValueError, TypeError)):
 			PasswordField(password)
+
+# Hashing (a cheap scrypt cost keeps the tests fast)
+FAST_COST = {"n": 2**4, "r": 1, "p": 1}
+
+def test_hash_verifies_and_hides_password():
+	encoded = hash_password("abcdef", FAST_COST)
+	assert "abcdef" not in encoded
+	assert encoded.startswith("scrypt$16$1$1$")
+	assert verify_password("abcdef", encoded)
+	assert not verify_password("abcdeg", encoded)
+
+def test_hash_is_salted():
+	assert hash_password("abcdef", FAST_COST) != hash_password("abcdef", FAST_COST)
+
+def test_password_field_hash_methods():
+	pf = PasswordField("abcd1234")
+	encoded = pf.get_password_hash(FAST_COST)
+	assert pf.matches_hash(encoded)
+	assert not PasswordField("abcd1235").matches_hash(encoded)
+
+def test_default_cost_setting():
+	encoded = PasswordField("abcdef").get_password_hash()
+	n, r, p = (int(part) for part in encoded.split("$")[1:4])
+	assert {"n": n, "r": r, "p": p} == COST_SETTINGS["interactive"]
+
+@pytest.mark.parametrize("encoded", ["", "scrypt$16$1$1$salt", "scrypt$x$1$1$c2FsdA$aGFzaA", None])
+def test_verify_invalid_hash_raises(encoded):
+	with pytest.raises(ValueError):
+		verify_password("abcdef", encoded)
+
+def test_verify_unknown_algorithm_raises():
+	encoded = hash_password("abcdef", FAST_COST).replace("scrypt", "md5", 1)
+	with pytest.raises(ValueError):
+		verify_password("abcdef", encoded)
+
+@pytest.mark.parametrize("n, r, p", [(2**30, 8, 1), (2**4, 2**20, 1), (2**4, 1, 2**20), (0, 1, 1)])
+def test_verify_cost_out_of_range_raises(n, r, p):
+	encoded = hash_password("abcdef", FAST_COST).replace("scrypt$16$1$1$", f"scrypt${n}${r}${p}$", 1)
+	with pytest.raises(ValueError):
+		verify_password("abcdef", encoded)
+
+def test_custom_cost_round_trip():
+	encoded = hash_password("abcdef", {"n": 2**5, "r": 2, "p": 1})
+	assert encoded.startswith("scrypt$32$2$1$")
+	assert verify_password("abcdef", encoded)
+
+@pytest.mark.parametrize("cost", [{"n": 2**18, "r": 8, "p": 1}, {"n": 2**14, "r": 16, "p": 1}, {"n": 2**4, "r": 1, "p": 0}])
+def test_custom_cost_out_of_range_raises(cost):
+	with pytest.raises(ValueError):
+		hash_password("abcdef", cost)
+	with pytest.raises(ValueError):
+		list(hash_passwords(["abcdef"], cost))
+
+def test_unknown_cost_name_raises():
+	with pytest.raises(ValueError):
+		hash_password("abcdef", "extreme")
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_bulk_hash_and_verify_keep_order(workers):
+	passwords = [f"secret{i}" for i in range(20)]
+	hashes = list(hash_passwords(passwords, FAST_COST, workers=workers))
+	assert list(verify_passwords(zip(passwords, hashes), workers=workers)) == [True] * 20
+	assert list(verify_passwords(zip(reversed(passwords), hashes))) == [False] * 20
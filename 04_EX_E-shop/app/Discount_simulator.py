@@ -0,0 +1,94 @@
+# "What-if" revenue simulation for alternative discount thresholds
+import math
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+
+from app.Discount_tiers import DiscountTierTable
+
+
+def _last_ore_within(limit_kr):
+	"""The largest whole øre amount x with x / 100 <= limit_kr, as the tier table compares."""
+	# Floor, not round: 99.995 kr must not admit 100.00 kr. limit_kr * 100
+	# can land just below a whole øre (0.29 * 100 is 28.999...), hence the nudge.
+	ore = math.floor(limit_kr * 100)
+	if (ore + 1) / 100 <= limit_kr:
+		return ore + 1
+	if ore / 100 > limit_kr:
+		return ore - 1
+	return ore
+
+
+class DiscountSimulator:
+	"""
+	Answers "what would revenue have been with these tiers?" for an order
+	history without repricing every order.
+
+	The history is reduced once to a sorted histogram of distinct amounts
+	(in øre) with prefix sums of order counts and amounts. The orders in a
+	tier are then found with two binary searches, so one configuration costs
+	O(tiers * log n).
+
+	The discount is computed on each tier's total, so it can differ from
+	repricing order by order (which rounds every final price) by at most
+	half an øre per order.
+	"""
+
+	def __init__(self, amounts_ore):
+		histogram = Counter(amounts_ore)
+		if histogram and min(histogram) < 0:
+			raise ValueError("Amount cannot be negative")
+		self._amounts = sorted(histogram)
+		counts = [histogram[amount] for amount in self._amounts]
+		self._count_prefix = [0, *accumulate(counts)]
+		self._sum_prefix = [0, *accumulate(amount * count for amount, count in zip(self._amounts, counts))]
+
+	@classmethod
+	def from_kr(cls, amounts_kr):
+		return cls(round(amount * 100) for amount in amounts_kr)
+
+	@property
+	def orders(self):
+		return self._count_prefix[-1]
+
+	@property
+	def revenue_before_ore(self):
+		return self._sum_prefix[-1]
+
+	def simulate(self, table):
+		"""
+		:param table: DiscountTierTable with the candidate thresholds and percentages
+		:return: dict with revenue before and after discount (øre), the discount
+			granted, and (orders, amount_ore, discount_ore) per tier
+		"""
+		tiers = []
+		total_discount = 0.0
+		start = 0
+		for limit, percent in zip(table.limits + (None,), table.percents):
+			end = len(self._amounts) if limit is None else bisect_right(self._amounts, _last_ore_within(limit))
+			end = max(end, start)
+			orders = self._count_prefix[end] - self._count_prefix[start]
+			amount = self._sum_prefix[end] - self._sum_prefix[start]
+			discount = amount * percent / 100
+			tiers.append((orders, amount, discount))
+			total_discount += discount
+			start = end
+		return {
+			"revenue_before_ore": self.revenue_before_ore,
+			"discount_ore": total_discount,
+			"revenue_after_ore": self.revenue_before_ore - total_discount,
+			"tiers": tiers,
+		}
+
+	def sweep(self, configurations):
+		"""
+		Simulate many configurations, each a DiscountTierTable or a
+		(tiers, above_percent) pair.
+		:return: list of simulate() results, in the same order
+		"""
+		results = []
+		for configuration in configurations:
+			if not isinstance(configuration, DiscountTierTable):
+				configuration = DiscountTierTable(*configuration)
+			results.append(self.simulate(configuration))
+		return results
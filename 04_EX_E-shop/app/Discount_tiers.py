@@ -0,0 +1,125 @@
+# Configurable discount tiers per customer segment for the e-shop
+import bisect
+import json
+import os
+import threading
+
+
+class DiscountTierTable:
+	"""
+	A compiled tier table. tiers is a list of (upper_limit_kr, percent)
+	pairs: an amount up to and including upper_limit_kr gets percent.
+	Amounts above the last limit get above_percent.
+	"""
+
+	def __init__(self, tiers, above_percent):
+		tiers = sorted((float(limit), float(percent)) for limit, percent in tiers)
+		limits = [limit for limit, _ in tiers]
+		if len(set(limits)) != len(limits):
+			raise ValueError("Tier limits must be unique.")
+		if any(not 0 <= percent <= 100 for _, percent in tiers) or not 0 <= above_percent <= 100:
+			raise ValueError("Discount percentages must be between 0 and 100.")
+		self._limits = tuple(limits)
+		self._percents = tuple(percent for _, percent in tiers) + (float(above_percent),)
+
+	def __len__(self):
+		return len(self._percents)
+
+	@property
+	def limits(self):
+		"""Upper limits in kroner, ascending."""
+		return self._limits
+
+	@property
+	def percents(self):
+		"""Discount per tier; one more entry than limits (the last is above_percent)."""
+		return self._percents
+
+	def discount(self, amount_kr):
+		"""
+		:param amount_kr: float, purchase amount in kroner (accuracy 0.01)
+		:return: float, discount percentage
+		"""
+		if amount_kr < 0:
+			raise ValueError("Amount cannot be negative")
+		return self._percents[bisect.bisect_left(self._limits, amount_kr)]
+
+	def final_price(self, amount_kr):
+		"""
+		:return: tuple (final_price, discount_percent), rounded like calculate_final_price
+		"""
+		discount_percent = self.discount(amount_kr)
+		return round(amount_kr - amount_kr * (discount_percent / 100), 2), discount_percent
+
+
+# Same tiers as calculate_discount
+DEFAULT_TIERS = DiscountTierTable([(300, 0.0), (800, 5.0)], above_percent=10.0)
+
+
+def _table_from_config(config):
+	return DiscountTierTable(config["tiers"], config["above_percent"])
+
+
+class DiscountEngine:
+	"""
+	Discount lookup per customer segment. Unknown segments (and segment
+	None) use the default table.
+
+	Tables can be replaced while other threads are looking up discounts:
+	a new set of tables is compiled completely before it is swapped in,
+	so a lookup always sees either the old or the new tables.
+	"""
+
+	def __init__(self, tables=None, default=DEFAULT_TIERS):
+		self.default = default
+		self._tables = dict(tables or {})
+		self._lock = threading.Lock()
+		self._path = None
+		self._mtime = None
+
+	def segments(self):
+		return sorted(self._tables)
+
+	def table(self, segment=None):
+		return self._tables.get(segment, self.default)
+
+	def discount(self, amount_kr, segment=None):
+		return self._tables.get(segment, self.default).discount(amount_kr)
+
+	def final_price(self, amount_kr, segment=None):
+		return self._tables.get(segment, self.default).final_price(amount_kr)
+
+	def load(self, segment, tiers, above_percent):
+		"""Replace (or add) the tier table of a single segment."""
+		table = DiscountTierTable(tiers, above_percent)
+		with self._lock:
+			tables = dict(self._tables)
+			tables[segment] = table
+			self._tables = tables
+
+	def load_file(self, path):
+		"""
+		Replace all segment tables from a JSON file shaped like
+		{"segment": {"tiers": [[300, 0], [800, 5]], "above_percent": 10}}.
+		If any table is invalid nothing is replaced.
+		"""
+		mtime = os.stat(path).st_mtime_ns
+		with open(path, encoding="utf-8") as file:
+			config = json.load(file)
+		try:
+			tables = {segment: _table_from_config(table) for segment, table in config.items()}
+		except (KeyError, TypeError, ValueError) as error:
+			raise ValueError(f"Invalid discount tier file {path}: {error}") from error
+		with self._lock:
+			self._tables = tables
+			self._path, self._mtime = path, mtime
+
+	def reload_if_changed(self):
+		"""
+		Reload the last loaded file if it changed on disk.
+		:return: bool, True if the tables were reloaded
+		"""
+		if self._path is None or os.stat(self._path).st_mtime_ns == self._mtime:
+			return False
+		self.load_file(self._path)
+		return True
@@ -1,4 +1,11 @@
 # Payment discount calculation for e-shop
+from array import array
+
+try:
+	import numpy
+except ImportError:  # NumPy is optional, the columnar functions fall back to plain Python
+	numpy = None
+
 def calculate_discount(amount_kr):
 	"""
 	Calculate the discount percentage based on the purchase amount.
@@ -26,3 +33,53 @@ def calculate_final_price(amount_kr):
 	discount_amount = amount_kr * (discount_percent / 100)
 	final_price = round(amount_kr - discount_amount, 2)
 	return final_price, discount_percent
+
+
+# Columnar pricing on whole integer øre (1 kr = 100 øre).
+# The thresholds are the same as calculate_discount: up to and including
+# 300 kr no discount, up to and including 800 kr 5%, above that 10%.
+# Final prices are rounded half up to the nearest øre.
+FIRST_THRESHOLD_ORE = 300_00
+SECOND_THRESHOLD_ORE = 800_00
+
+def kr_to_ore(amounts_kr):
+	"""
+	Convert kroner amounts (accuracy 0.01) to whole øre.
+	:return: array('q') of øre
+	"""
+	return array('q', [round(amount * 100) for amount in amounts_kr])
+
+def calculate_final_prices_ore(amounts_ore):
+	"""
+	Calculate final prices and discount percentages for a batch of orders.
+	:param amounts_ore: sequence of int amounts in øre, or an int64 NumPy array
+	:return: tuple (final_prices_ore, discount_percents) as array('q') and
+		array('b'), or as NumPy arrays when given a NumPy array
+	"""
+	if numpy is not None and isinstance(amounts_ore, numpy.ndarray):
+		return _calculate_final_prices_ndarray(amounts_ore)
+	amounts = amounts_ore if isinstance(amounts_ore, array) else array('q', amounts_ore)
+	if amounts and min(amounts) < 0:
+		raise ValueError("Amount cannot be negative")
+	discounts = array('b', [
+		0 if amount <= FIRST_THRESHOLD_ORE else 5 if amount <= SECOND_THRESHOLD_ORE else 10
+		for amount in amounts
+	])
+	final_prices = array('q', [
+		(amount * (100 - discount) + 50) // 100
+		for amount, discount in zip(amounts, discounts)
+	])
+	return final_prices, discounts
+
+def _calculate_final_prices_ndarray(amounts_ore):
+	# astype would silently truncate 100.7 øre to 100; array('q') raises instead
+	if amounts_ore.dtype.kind not in "biu":
+		raise TypeError(f"Amounts in øre must be integers, got a {amounts_ore.dtype} array")
+	amounts = amounts_ore.astype(numpy.int64, copy=False)
+	if amounts.size and amounts.min() < 0:
+		raise ValueError("Amount cannot be negative")
+	discounts = numpy.full(amounts.shape, 10, dtype=numpy.int8)
+	discounts[amounts <= SECOND_THRESHOLD_ORE] = 5
+	discounts[amounts <= FIRST_THRESHOLD_ORE] = 0
+	final_prices = (amounts * (100 - discounts.astype(numpy.int64)) + 50) // 100
+	return final_prices, discounts
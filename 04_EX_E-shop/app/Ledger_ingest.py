@@ -0,0 +1,171 @@
+# Chunked, multi-process ingest of order ledgers with discount aggregation
+import csv
+import json
+import math
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from app.E_shop import calculate_final_price
+
+
+class LedgerReport:
+	"""
+	Aggregated result of running calculate_final_price over a ledger.
+	Money is summed in whole øre so merging partial reports is exact.
+	Tiers are keyed by discount percentage (0.0, 5.0, 10.0).
+	"""
+
+	def __init__(self):
+		self.orders = 0
+		self.rejected = 0
+		self.revenue_before_ore = 0
+		self.revenue_after_ore = 0
+		self.discount_by_tier_ore = {}
+		self.orders_by_tier = {}
+
+	def add(self, amount_kr):
+		final_price, discount_percent = calculate_final_price(amount_kr)
+		before = round(amount_kr * 100)
+		after = round(final_price * 100)
+		self.orders += 1
+		self.revenue_before_ore += before
+		self.revenue_after_ore += after
+		self.discount_by_tier_ore[discount_percent] = self.discount_by_tier_ore.get(discount_percent, 0) + before - after
+		self.orders_by_tier[discount_percent] = self.orders_by_tier.get(discount_percent, 0) + 1
+
+	def merge(self, other):
+		self.orders += other.orders
+		self.rejected += other.rejected
+		self.revenue_before_ore += other.revenue_before_ore
+		self.revenue_after_ore += other.revenue_after_ore
+		for tier, discount in other.discount_by_tier_ore.items():
+			self.discount_by_tier_ore[tier] = self.discount_by_tier_ore.get(tier, 0) + discount
+		for tier, count in other.orders_by_tier.items():
+			self.orders_by_tier[tier] = self.orders_by_tier.get(tier, 0) + count
+		return self
+
+	def as_dict(self):
+		return {
+			"orders": self.orders,
+			"rejected": self.rejected,
+			"revenue_before_kr": self.revenue_before_ore / 100,
+			"revenue_after_kr": self.revenue_after_ore / 100,
+			"discount_by_tier_kr": {tier: ore / 100 for tier, ore in sorted(self.discount_by_tier_ore.items())},
+			"orders_by_tier": dict(sorted(self.orders_by_tier.items())),
+		}
+
+
+def _amount_from_csv(line, amount_column):
+	return float(next(csv.reader([line]))[amount_column])
+
+def _amount_from_jsonl(line, _):
+	amount = json.loads(line)["amount"]
+	if isinstance(amount, bool) or not isinstance(amount, (int, float, str)):
+		raise ValueError(f"Amount must be a number, got {amount!r}")
+	return float(amount)
+
+_PARSERS = {"csv": _amount_from_csv, "jsonl": _amount_from_jsonl}
+
+
+def _check_utf8(line):
+	# The ledger is read with surrogateescape, so undecodable bytes show up
+	# here as lone surrogates instead of stopping the whole run
+	if not line.isascii():
+		try:
+			line.encode("utf-8")
+		except UnicodeEncodeError:
+			raise ValueError("Line is not valid UTF-8") from None
+
+
+def _process_chunk(file_format, amount_column, first_line, lines):
+	"""Return (LedgerReport, rejects) for one chunk; runs in a worker process."""
+	parse = _PARSERS[file_format]
+	report = LedgerReport()
+	rejects = []
+	for line_number, line in enumerate(lines, start=first_line):
+		if not line.strip():
+			continue
+		try:
+			_check_utf8(line)
+			amount = parse(line, amount_column)
+			if not math.isfinite(amount):
+				raise ValueError(f"Amount must be finite, got {amount}")
+			report.add(amount)
+		except (ValueError, KeyError, IndexError, TypeError) as error:
+			reason = str(error) if isinstance(error, ValueError) else f"Missing or malformed field: {error!r}"
+			rejects.append((line_number, reason, line.rstrip("\r\n")))
+		except OverflowError:
+			# A finite amount such as 1e308 overflows when converted to øre
+			rejects.append((line_number, "Amount is too large", line.rstrip("\r\n")))
+	report.rejected = len(rejects)
+	return report, rejects
+
+
+def _detect_format(path):
+	name = str(path).lower()
+	if name.endswith(".csv"):
+		return "csv"
+	if name.endswith((".jsonl", ".ndjson")):
+		return "jsonl"
+	raise ValueError(f"Cannot tell the ledger format of {path}; pass file_format='csv' or 'jsonl'.")
+
+
+def _chunks(file, first_line, chunk_size):
+	while lines := list(islice(file, chunk_size)):
+		yield first_line, lines
+		first_line += len(lines)
+
+
+def _map_chunks(file_format, amount_column, chunks, workers):
+	if workers <= 1:
+		for first_line, lines in chunks:
+			yield _process_chunk(file_format, amount_column, first_line, lines)
+		return
+	with ProcessPoolExecutor(max_workers=workers) as pool:
+		pending = deque()
+		for first_line, lines in chunks:
+			pending.append(pool.submit(_process_chunk, file_format, amount_column, first_line, lines))
+			if len(pending) >= 2 * workers:
+				yield pending.popleft().result()
+		while pending:
+			yield pending.popleft().result()
+
+
+def ingest_ledger(path, reject_path, workers=1, chunk_size=10_000, file_format=None, amount_field="amount"):
+	"""
+	Run calculate_final_price over every order in a CSV or JSONL ledger.
+
+	The file is read in chunks of chunk_size lines. With workers > 1 the
+	chunks are processed on a process pool with at most two chunks per
+	worker in flight, so memory stays bounded for any file size. CSV
+	ledgers need a header row and one order per line.
+
+	Rows that cannot be priced (malformed, missing or negative amounts,
+	bytes that are not UTF-8) are written to reject_path as CSV (line, reason, row) and counted in
+	the report instead of stopping the run.
+	:return: LedgerReport
+	"""
+	file_format = file_format or _detect_format(path)
+	if file_format not in _PARSERS:
+		raise ValueError("file_format must be 'csv' or 'jsonl'.")
+	report = LedgerReport()
+	# surrogateescape on both files: undecodable lines are rejected, and
+	# their original bytes are copied to the reject file unchanged
+	with open(path, encoding="utf-8", errors="surrogateescape", newline="") as ledger, \
+			open(reject_path, "w", encoding="utf-8", errors="surrogateescape", newline="") as reject_file:
+		rejects = csv.writer(reject_file)
+		rejects.writerow(["line", "reason", "row"])
+		amount_column = amount_field
+		first_line = 1
+		if file_format == "csv":
+			header = next(csv.reader([ledger.readline()]), [])
+			if amount_field not in header:
+				raise ValueError(f"Ledger header has no '{amount_field}' column.")
+			amount_column = header.index(amount_field)
+			first_line = 2
+		for partial, chunk_rejects in _map_chunks(file_format, amount_column, _chunks(ledger, first_line, chunk_size), workers):
+			report.merge(partial)
+			rejects.writerows(chunk_rejects)
+	return report
+
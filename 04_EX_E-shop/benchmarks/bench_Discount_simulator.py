@@ -0,0 +1,35 @@
+"""
+Sweep of discount threshold configurations over an order history, against
+repricing every order for each configuration.
+
+Run from the exercise folder:  python -m benchmarks.bench_Discount_simulator [orders] [configurations]
+"""
+import random
+import sys
+import time
+
+from app.Discount_simulator import DiscountSimulator
+from app.Discount_tiers import DiscountTierTable
+
+
+def main(orders=1_000_000, configurations=5_000):
+	amounts_kr = [random.randint(0, 200_000) / 100 for _ in range(orders)]
+	start = time.perf_counter()
+	simulator = DiscountSimulator.from_kr(amounts_kr)
+	print(f"histogram of {orders:,} orders built in {time.perf_counter() - start:.2f} s")
+	tables = [
+		DiscountTierTable([(first, 0), (first + gap, 5)], above_percent=10)
+		for first, gap in zip(random.choices(range(100, 600), k=configurations),
+		                      random.choices(range(100, 1000), k=configurations))
+	]
+	start = time.perf_counter()
+	simulator.sweep(tables)
+	seconds = time.perf_counter() - start
+	print(f"{configurations:,} configurations simulated in {seconds:.2f} s")
+	start = time.perf_counter()
+	sum(tables[0].final_price(amount)[0] for amount in amounts_kr)
+	print(f"repricing every order: {time.perf_counter() - start:.2f} s per configuration")
+
+
+if __name__ == "__main__":
+	main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,40 @@
+"""
+Discount lookup latency for tier tables with 5, 50 and 500 tiers, bisect
+lookup against a linear scan over the same tiers.
+
+Run from the exercise folder:  python -m benchmarks.bench_Discount_tiers [lookups]
+"""
+import random
+import sys
+import time
+
+from app.Discount_tiers import DiscountEngine
+
+
+def _linear_discount(tiers, above_percent, amount):
+	for limit, percent in tiers:
+		if amount <= limit:
+			return percent
+	return above_percent
+
+
+def _latency(func, amounts):
+	start = time.perf_counter()
+	for amount in amounts:
+		func(amount)
+	return (time.perf_counter() - start) / len(amounts) * 1e9
+
+
+def main(lookups=200_000):
+	engine = DiscountEngine()
+	for tier_count in (5, 50, 500):
+		tiers = [(limit * 100, min(limit * 0.1, 99)) for limit in range(1, tier_count)]
+		engine.load(f"tiers_{tier_count}", tiers, above_percent=99)
+		amounts = [random.uniform(0, tier_count * 100) for _ in range(lookups)]
+		bisect_ns = _latency(lambda amount: engine.discount(amount, f"tiers_{tier_count}"), amounts)
+		linear_ns = _latency(lambda amount: _linear_discount(tiers, 99, amount), amounts)
+		print(f"{tier_count:>4} tiers: bisect {bisect_ns:>7.0f} ns/lookup, linear scan {linear_ns:>7.0f} ns/lookup")
+
+
+if __name__ == "__main__":
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
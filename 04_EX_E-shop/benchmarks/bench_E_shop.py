@@ -0,0 +1,35 @@
+"""
+Columnar øre pricing against calling calculate_final_price per order.
+
+Run from the exercise folder:  python -m benchmarks.bench_E_shop [rows]
+"""
+import random
+import sys
+import time
+from array import array
+
+from app.E_shop import calculate_final_price, calculate_final_prices_ore, numpy
+
+
+def _rows_per_minute(func, rows):
+	start = time.perf_counter()
+	func()
+	return rows / (time.perf_counter() - start) * 60
+
+
+def main(rows=1_000_000):
+	amounts_ore = array('q', (random.randint(0, 2000_00) for _ in range(rows)))
+	amounts_kr = [amount / 100 for amount in amounts_ore]
+	runs = [
+		("scalar, per order", lambda: [calculate_final_price(amount) for amount in amounts_kr]),
+		("columnar, array('q')", lambda: calculate_final_prices_ore(amounts_ore)),
+	]
+	if numpy is not None:
+		amounts_ndarray = numpy.asarray(amounts_ore)
+		runs.append(("columnar, NumPy", lambda: calculate_final_prices_ore(amounts_ndarray)))
+	for name, func in runs:
+		print(f"{name:>21}: {_rows_per_minute(func, rows):>16,.0f} rows/min")
+
+
+if __name__ == "__main__":
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,32 @@
+"""
+Ledger ingest throughput at 1, 4 and 16 worker processes.
+
+Run from the exercise folder:  python -m benchmarks.bench_Ledger_ingest [rows]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from app.Ledger_ingest import ingest_ledger
+
+
+def main(rows=1_000_000):
+	with tempfile.TemporaryDirectory() as directory:
+		ledger = os.path.join(directory, "orders.csv")
+		with open(ledger, "w", encoding="utf-8") as file:
+			file.write("order_id,customer,amount\n")
+			for order_id in range(rows):
+				amount = "-1" if order_id % 1000 == 0 else f"{random.randint(0, 200_000) / 100:.2f}"
+				file.write(f"{order_id},customer{order_id % 5000},{amount}\n")
+		print(f"{os.path.getsize(ledger) / 1e6:.0f} MB ledger, {os.cpu_count()} cores")
+		for workers in (1, 4, 16):
+			start = time.perf_counter()
+			report = ingest_ledger(ledger, os.path.join(directory, "rejects.csv"), workers=workers)
+			seconds = time.perf_counter() - start
+			print(f"{workers:>2} workers: {rows / seconds:>12,.0f} rows/s ({report.rejected} rejected)")
+
+
+if __name__ == "__main__":
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,57 @@
+# Unit tests for the discount threshold simulator
+import random
+
+import pytest
+from app.Discount_simulator import DiscountSimulator
+from app.Discount_tiers import DEFAULT_TIERS, DiscountTierTable
+from app.E_shop import calculate_final_price
+
+AMOUNTS = [0, 100, 299.99, 300.00, 300.01, 799.99, 800.00, 800.01, 1500, 1500]
+
+
+def test_default_tiers_match_repricing_every_order():
+	result = DiscountSimulator.from_kr(AMOUNTS).simulate(DEFAULT_TIERS)
+	repriced_ore = sum(round(calculate_final_price(amount)[0] * 100) for amount in AMOUNTS)
+	assert [orders for orders, _, _ in result["tiers"]] == [4, 3, 3]
+	assert result["revenue_before_ore"] == round(sum(AMOUNTS) * 100)
+	assert abs(result["revenue_after_ore"] - repriced_ore) <= 0.5 * len(AMOUNTS)
+
+def test_random_history_matches_repricing():
+	random.seed(3)
+	amounts = [random.randint(0, 200_000) / 100 for _ in range(2000)]
+	simulator = DiscountSimulator.from_kr(amounts)
+	table = DiscountTierTable([(250, 0), (600, 7.5), (1200, 12)], above_percent=20)
+	result = simulator.simulate(table)
+	repriced_ore = sum(round(table.final_price(amount)[0] * 100) for amount in amounts)
+	assert simulator.orders == 2000
+	assert abs(result["revenue_after_ore"] - repriced_ore) <= 0.5 * len(amounts)
+
+def test_moving_a_threshold_changes_tier_counts():
+	simulator = DiscountSimulator.from_kr(AMOUNTS)
+	results = simulator.sweep([
+		([(300, 0), (800, 5)], 10),
+		([(200, 0), (800, 5)], 10),
+		([(300, 0), (1000, 5)], 10),
+	])
+	assert [[orders for orders, _, _ in result["tiers"]] for result in results] == [[4, 3, 3], [2, 5, 3], [4, 4, 2]]
+	assert results[1]["discount_ore"] > results[0]["discount_ore"] > results[2]["discount_ore"]
+
+@pytest.mark.parametrize("limit", [99.995, 99.999, 100, 0.29, 0.285, 1.15, 300.005])
+def test_fractional_limits_split_like_the_tier_table(limit):
+	amounts = [0.28, 0.29, 1.14, 1.15, 99.99, 100.00, 100.01, 300.00, 300.01]
+	table = DiscountTierTable([(limit, 0)], above_percent=10)
+	result = DiscountSimulator.from_kr(amounts).simulate(table)
+	assert result["tiers"][0][0] == sum(table.discount(amount) == 0 for amount in amounts)
+
+def test_thresholds_outside_history():
+	result = DiscountSimulator.from_kr(AMOUNTS).simulate(DiscountTierTable([(5000, 0)], above_percent=50))
+	assert result["tiers"] == [(len(AMOUNTS), round(sum(AMOUNTS) * 100), 0.0), (0, 0, 0.0)]
+	assert result["discount_ore"] == 0
+
+def test_empty_history():
+	result = DiscountSimulator([]).simulate(DEFAULT_TIERS)
+	assert result["revenue_after_ore"] == 0
+
+def test_negative_amount_raises_value_error():
+	with pytest.raises(ValueError, match="Amount cannot be negative"):
+		DiscountSimulator([100, -1])
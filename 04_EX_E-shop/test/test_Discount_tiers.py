@@ -0,0 +1,63 @@
+# Unit tests for configurable discount tiers
+import json
+import os
+
+import pytest
+from app.Discount_tiers import *
+from app.E_shop import calculate_discount, calculate_final_price
+
+@pytest.mark.parametrize("amount", [0, 0.01, 299.99, 300.00, 300.01, 799.99, 800.00, 800.01, 10_000])
+def test_default_tiers_match_calculate_discount(amount):
+	assert DEFAULT_TIERS.discount(amount) == calculate_discount(amount)
+	assert DEFAULT_TIERS.final_price(amount) == calculate_final_price(amount)
+
+def test_unsorted_tiers_are_sorted():
+	table = DiscountTierTable([(1000, 10), (100, 0), (500, 5)], above_percent=15)
+	assert [table.discount(amount) for amount in (100, 100.01, 500, 1000, 1000.01)] == [0, 5, 5, 10, 15]
+	assert len(table) == 4
+
+@pytest.mark.parametrize("tiers, above_percent", [
+	([(300, 0), (300, 5)], 10),     # duplicate limit
+	([(300, -1)], 10),              # negative percent
+	([(300, 0)], 101),              # above 100%
+])
+def test_invalid_tier_tables(tiers, above_percent):
+	with pytest.raises(ValueError):
+		DiscountTierTable(tiers, above_percent)
+
+def test_negative_amount_raises_value_error():
+	with pytest.raises(ValueError, match="Amount cannot be negative"):
+		DEFAULT_TIERS.discount(-1)
+
+def test_engine_segments_and_default():
+	engine = DiscountEngine()
+	engine.load("students", [(100, 0), (200, 15)], above_percent=20)
+	assert engine.discount(150, "students") == 15
+	assert engine.discount(150, "unknown") == 0
+	assert engine.discount(900) == 10
+	assert engine.segments() == ["students"]
+
+def _write_config(path, config, mtime):
+	path.write_text(json.dumps(config), encoding="utf-8")
+	os.utime(path, ns=(mtime, mtime))
+
+def test_engine_hot_reloads_changed_file(tmp_path):
+	path = tmp_path / "tiers.json"
+	_write_config(path, {"vip": {"tiers": [[100, 5]], "above_percent": 20}}, 1_000_000_000)
+	engine = DiscountEngine()
+	engine.load_file(path)
+	assert engine.discount(500, "vip") == 20
+	assert not engine.reload_if_changed()
+	_write_config(path, {"vip": {"tiers": [[100, 5]], "above_percent": 25}}, 2_000_000_000)
+	assert engine.reload_if_changed()
+	assert engine.discount(500, "vip") == 25
+
+def test_engine_keeps_old_tables_when_file_is_invalid(tmp_path):
+	path = tmp_path / "tiers.json"
+	_write_config(path, {"vip": {"tiers": [[100, 5]], "above_percent": 20}}, 1_000_000_000)
+	engine = DiscountEngine()
+	engine.load_file(path)
+	_write_config(path, {"vip": {"tiers": [[100, 5]]}}, 2_000_000_000)
+	with pytest.raises(ValueError):
+		engine.reload_if_changed()
+	assert engine.discount(500, "vip") == 20
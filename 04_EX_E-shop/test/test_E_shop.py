@@ -28,4 +28,48 @@ def test_negative_amount_raises_value_error(func, value):
 def test_calculate_final_price_zero():
 	final_price, discount = calculate_final_price(0)
 	assert discount == 0.0
-	assert final_price == 0.0
\ No newline at end of file
+	assert final_price == 0.0
+#columnar pricing in øre
+BOUNDARY_AMOUNTS = [0.0, 299.99, 300.00, 300.01, 799.99, 800.00, 800.01, 1234.56]
+
+def test_kr_to_ore():
+	assert list(kr_to_ore([0.0, 300.01, 799.99, 0.1])) == [0, 30001, 79999, 10]
+
+def test_final_prices_ore_match_scalar_at_boundaries():
+	final_prices, discounts = calculate_final_prices_ore(kr_to_ore(BOUNDARY_AMOUNTS))
+	for amount, final_ore, discount in zip(BOUNDARY_AMOUNTS, final_prices, discounts):
+		expected_final, expected_discount = calculate_final_price(amount)
+		assert discount == expected_discount
+		assert final_ore == round(expected_final * 100)
+
+def test_final_prices_ore_round_half_up():
+	# 300.10 kr - 5% = 285.095 kr
+	final_prices, _ = calculate_final_prices_ore([30010])
+	assert list(final_prices) == [28510]
+
+def test_final_prices_ore_empty_batch():
+	final_prices, discounts = calculate_final_prices_ore([])
+	assert len(final_prices) == 0 and len(discounts) == 0
+
+def test_final_prices_ore_negative_raises():
+	with pytest.raises(ValueError, match="Amount cannot be negative"):
+		calculate_final_prices_ore([100, -1])
+
+def test_final_prices_ore_numpy_matches_plain():
+	numpy = pytest.importorskip("numpy")
+	amounts = kr_to_ore(BOUNDARY_AMOUNTS)
+	final_prices, discounts = calculate_final_prices_ore(numpy.array(amounts, dtype=numpy.int64))
+	expected_prices, expected_discounts = calculate_final_prices_ore(amounts)
+	assert final_prices.tolist() == list(expected_prices)
+	assert discounts.tolist() == list(expected_discounts)
+	with pytest.raises(ValueError):
+		calculate_final_prices_ore(numpy.array([-1]))
+
+def test_final_prices_ore_reject_fractional_amounts():
+	numpy = pytest.importorskip("numpy")
+	with pytest.raises(TypeError):
+		calculate_final_prices_ore([100.7])
+	with pytest.raises(TypeError):
+		calculate_final_prices_ore(numpy.array([100.7]))
+	final_prices, _ = calculate_final_prices_ore(numpy.array([30010], dtype=numpy.int32))
+	assert final_prices.tolist() == [28510]
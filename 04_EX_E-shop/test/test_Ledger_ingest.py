@@ -0,0 +1,96 @@
+# Unit tests for the order ledger ingest pipeline
+import csv
+import json
+
+import pytest
+from app.E_shop import calculate_final_price
+from app.Ledger_ingest import LedgerReport, ingest_ledger
+
+AMOUNTS = [0, 299.99, 300.00, 300.01, 799.99, 800.00, 800.01, 1500]
+
+
+def _write_csv(path, rows):
+	with open(path, "w", newline="", encoding="utf-8") as file:
+		writer = csv.writer(file)
+		writer.writerow(["order_id", "amount"])
+		writer.writerows(rows)
+
+def _read_rejects(path):
+	with open(path, newline="", encoding="utf-8") as file:
+		return list(csv.DictReader(file))
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 3), (2, 3), (1, 10_000)])
+def test_csv_report_matches_calculate_final_price(tmp_path, workers, chunk_size):
+	ledger = tmp_path / "orders.csv"
+	_write_csv(ledger, [(i, amount) for i, amount in enumerate(AMOUNTS)])
+	report = ingest_ledger(ledger, tmp_path / "rejects.csv", workers=workers, chunk_size=chunk_size)
+	expected = LedgerReport()
+	for amount in AMOUNTS:
+		expected.add(amount)
+	assert report.as_dict() == expected.as_dict()
+	assert report.orders_by_tier == {0.0: 3, 5.0: 3, 10.0: 2}
+	assert report.revenue_before_ore == round(sum(AMOUNTS) * 100)
+	assert report.revenue_after_ore == sum(round(calculate_final_price(a)[0] * 100) for a in AMOUNTS)
+
+def test_invalid_rows_go_to_reject_file(tmp_path):
+	ledger = tmp_path / "orders.csv"
+	_write_csv(ledger, [(1, 100), (2, -50), (3, "abc"), (4,), (5, "nan"), (6, 900)])
+	reject_path = tmp_path / "rejects.csv"
+	report = ingest_ledger(ledger, reject_path, chunk_size=2)
+	assert report.orders == 2 and report.rejected == 4
+	rejects = _read_rejects(reject_path)
+	assert [row["line"] for row in rejects] == ["3", "4", "5", "6"]
+	assert rejects[0]["reason"] == "Amount cannot be negative"
+	assert rejects[0]["row"] == "2,-50"
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_undecodable_lines_go_to_reject_file(tmp_path, workers):
+	ledger = tmp_path / "orders.csv"
+	ledger.write_bytes(b"id,amount,note\n1,100,ok\n2,caf\xe9,x\n3,200,caf\xe9\n4,300,caf\xc3\xa9\n")
+	reject_path = tmp_path / "rejects.csv"
+	report = ingest_ledger(ledger, reject_path, workers=workers, chunk_size=2)
+	assert (report.orders, report.rejected) == (2, 2)
+	assert report.revenue_before_ore == 40000
+	rejects = reject_path.read_bytes().splitlines()
+	assert rejects[1:] == [b"3,Line is not valid UTF-8,\"2,caf\xe9,x\"", b"4,Line is not valid UTF-8,\"3,200,caf\xe9\""]
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_overflowing_amounts_go_to_reject_file(tmp_path, workers):
+	ledger = tmp_path / "orders.csv"
+	_write_csv(ledger, [(1, 100), (2, "1e308"), (3, 200)])
+	reject_path = tmp_path / "rejects.csv"
+	report = ingest_ledger(ledger, reject_path, workers=workers, chunk_size=2)
+	assert (report.orders, report.rejected) == (2, 1)
+	assert report.revenue_before_ore == 30000
+	assert [(row["line"], row["reason"]) for row in _read_rejects(reject_path)] == [("3", "Amount is too large")]
+
+def test_jsonl_ledger(tmp_path):
+	ledger = tmp_path / "orders.jsonl"
+	lines = [json.dumps({"amount": amount}) for amount in AMOUNTS] + ["", "{broken", json.dumps({"amount": None})]
+	ledger.write_text("\n".join(lines) + "\n", encoding="utf-8")
+	reject_path = tmp_path / "rejects.csv"
+	report = ingest_ledger(ledger, reject_path, workers=2, chunk_size=4)
+	assert report.orders == len(AMOUNTS)
+	assert [row["line"] for row in _read_rejects(reject_path)] == ["10", "11"]
+
+def test_merge_reports():
+	first, second = LedgerReport(), LedgerReport()
+	first.add(100)
+	second.add(900)
+	merged = first.merge(second).as_dict()
+	assert merged["orders"] == 2
+	assert merged["revenue_before_kr"] == 1000
+	assert merged["discount_by_tier_kr"] == {0.0: 0, 10.0: 90}
+
+def test_missing_amount_column_raises(tmp_path):
+	ledger = tmp_path / "orders.csv"
+	ledger.write_text("order_id,total\n1,100\n", encoding="utf-8")
+	with pytest.raises(ValueError):
+		ingest_ledger(ledger, tmp_path / "rejects.csv")
+
+def test_unknown_format_raises(tmp_path):
+	ledger = tmp_path / "orders.txt"
+	ledger.write_text("100\n", encoding="utf-8")
+	with pytest.raises(ValueError):
+		ingest_ledger(ledger, tmp_path / "rejects.csv")
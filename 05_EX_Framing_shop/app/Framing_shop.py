@@ -1,4 +1,11 @@
 # Picture framing price calculator
+try:
+	import numpy
+except ImportError:  # NumPy is optional, batch quotes fall back to plain Python
+	numpy = None
+
+MIN_WIDTH_CM, MAX_WIDTH_CM = 30, 100
+MIN_HEIGHT_CM, MAX_HEIGHT_CM = 30, 60
 def calculate_framing_price(width_cm, height_cm):
 	"""
 	Calculate the price of picture framing based on width and height in cm.
@@ -17,3 +24,84 @@ def calculate_framing_price(width_cm, height_cm):
 		return 3500
 	else:
 		return 3000
+
+
+def quote_framing_prices(sizes, grid=None):
+	"""
+	Price a batch of (width_cm, height_cm) pairs in one pass.
+	Invalid sizes do not raise; they are marked False in the mask and
+	priced 0.
+	:param sizes: sequence of (width, height) pairs or an (n, 2) NumPy array
+	:param grid: optional FramingPriceGrid used for on-grid sizes
+	:return: tuple (prices, valid); lists, or NumPy arrays for NumPy input
+	"""
+	if numpy is not None and isinstance(sizes, numpy.ndarray):
+		widths, heights = sizes[:, 0], sizes[:, 1]
+		valid = ((MIN_WIDTH_CM <= widths) & (widths <= MAX_WIDTH_CM)
+			& (MIN_HEIGHT_CM <= heights) & (heights <= MAX_HEIGHT_CM))
+		prices = numpy.where(valid, numpy.where(widths * heights > 1600, 3500, 3000), 0)
+		return prices, valid
+	if not isinstance(sizes, (list, tuple)):
+		sizes = list(sizes)  # read twice below, so a generator is consumed once
+	try:
+		valid = [
+			MIN_WIDTH_CM <= width <= MAX_WIDTH_CM and MIN_HEIGHT_CM <= height <= MAX_HEIGHT_CM
+			for width, height in sizes
+		]
+	except (TypeError, ValueError):
+		# Some element is not a pair of numbers: check them one by one and
+		# give the invalid ones a placeholder pair that is never priced
+		valid = [_is_valid_size(size) for size in sizes]
+		sizes = [size if ok else (0, 0) for size, ok in zip(sizes, valid)]
+	if grid is not None:
+		prices = [grid.lookup(width, height) if ok else 0 for (width, height), ok in zip(sizes, valid)]
+	else:
+		prices = [
+			(3500 if width * height > 1600 else 3000) if ok else 0
+			for (width, height), ok in zip(sizes, valid)
+		]
+	return prices, valid
+
+def _is_valid_size(size):
+	try:
+		width, height = size
+		return bool(MIN_WIDTH_CM <= width <= MAX_WIDTH_CM and MIN_HEIGHT_CM <= height <= MAX_HEIGHT_CM)
+	except (TypeError, ValueError):
+		return False
+
+
+class FramingPriceGrid:
+	"""
+	Precomputed prices for every valid size on a grid with the given
+	resolution in cm (1 gives 71 x 31 whole-cm sizes). Sizes on the grid
+	are a single dict lookup; other valid sizes fall back to
+	calculate_framing_price, which also raises for invalid sizes.
+	"""
+
+	def __init__(self, resolution=1):
+		if resolution <= 0:
+			raise ValueError("Resolution must be positive.")
+		width_steps = (MAX_WIDTH_CM - MIN_WIDTH_CM) / resolution
+		height_steps = (MAX_HEIGHT_CM - MIN_HEIGHT_CM) / resolution
+		if abs(width_steps - round(width_steps)) > 1e-9 or abs(height_steps - round(height_steps)) > 1e-9:
+			raise ValueError("Resolution must divide the width and height ranges evenly.")
+		self.resolution = resolution
+		# Sizes come from whole steps rounded like decimal literals, so 46.4
+		# is a key at resolution 0.1 (30 + 164 * 0.1 gives 46.400000000000006)
+		first_width, first_height = round(MIN_WIDTH_CM / resolution), round(MIN_HEIGHT_CM / resolution)
+		widths = [round(i * resolution, 10) for i in range(first_width, first_width + round(width_steps) + 1)]
+		heights = [round(j * resolution, 10) for j in range(first_height, first_height + round(height_steps) + 1)]
+		self._prices = {
+			(width, height): calculate_framing_price(width, height)
+			for width in widths
+			for height in heights
+		}
+
+	def __len__(self):
+		return len(self._prices)
+
+	def lookup(self, width_cm, height_cm):
+		price = self._prices.get((width_cm, height_cm))
+		if price is None:
+			return calculate_framing_price(width_cm, height_cm)
+		return price
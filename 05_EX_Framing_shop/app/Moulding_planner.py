@@ -0,0 +1,138 @@
+# Cutting plan for frame moulding (1-D cutting stock) over a batch of framing orders
+import time
+
+from app.Framing_shop import calculate_framing_price
+
+_EPSILON = 1e-9
+
+
+class MouldingPlan:
+	"""
+	bars is a list of bars, each a list of (order_index, piece_length_cm).
+	"""
+
+	def __init__(self, bars, bar_length_cm, kerf_cm):
+		self.bars = bars
+		self.bar_length_cm = bar_length_cm
+		self.kerf_cm = kerf_cm
+
+	@property
+	def bar_count(self):
+		return len(self.bars)
+
+	@property
+	def used_cm(self):
+		return sum(length for bar in self.bars for _, length in bar)
+
+	@property
+	def waste_cm(self):
+		return self.bar_count * self.bar_length_cm - self.used_cm
+
+	@property
+	def waste_ratio(self):
+		return self.waste_cm / (self.bar_count * self.bar_length_cm) if self.bars else 0.0
+
+
+class _FirstFitTree:
+	# Max segment tree over the remaining length of every bar (opened or not),
+	# so the leftmost bar a piece fits in is found in O(log n)
+	def __init__(self, bars, capacity):
+		self.size = 1
+		while self.size < bars:
+			self.size *= 2
+		self.tree = [capacity] * (2 * self.size)
+
+	def find(self, need):
+		if self.tree[1] + _EPSILON < need:
+			return -1
+		node = 1
+		while node < self.size:
+			node *= 2
+			if self.tree[node] + _EPSILON < need:
+				node += 1
+		return node - self.size
+
+	def consume(self, bar, amount):
+		node = bar + self.size
+		self.tree[node] -= amount
+		node //= 2
+		while node:
+			self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+			node //= 2
+
+
+def _pieces(orders):
+	# A frame is cut as two pieces of its width and two of its height,
+	# so each order consumes its perimeter in moulding
+	pieces = []
+	for index, (width, height) in enumerate(orders):
+		calculate_framing_price(width, height)  # raises ValueError for invalid sizes
+		pieces += [(index, width), (index, width), (index, height), (index, height)]
+	return pieces
+
+
+def _first_fit_decreasing(pieces, bar_length_cm, kerf_cm):
+	pieces = sorted(pieces, key=lambda piece: piece[1], reverse=True)
+	tree = _FirstFitTree(len(pieces), bar_length_cm)
+	bars = []
+	for piece in pieces:
+		need = piece[1] + kerf_cm
+		bar = tree.find(need)
+		if bar == len(bars):
+			bars.append([])
+		bars[bar].append(piece)
+		tree.consume(bar, need)
+	return bars
+
+
+def _improve(bars, bar_length_cm, kerf_cm, deadline):
+	# Try to empty the least-filled bar by moving its pieces into the free
+	# space of the others (best fit). Repeat while it works and time is left.
+	def free(bar):
+		return bar_length_cm - sum(length + kerf_cm for _, length in bar)
+
+	improved = True
+	while improved and time.perf_counter() < deadline:
+		improved = False
+		remaining = [free(bar) for bar in bars]
+		for candidate in sorted(range(len(bars)), key=remaining.__getitem__, reverse=True):
+			if time.perf_counter() >= deadline:
+				break
+			trial = list(remaining)
+			moves = []
+			for piece in sorted(bars[candidate], key=lambda piece: piece[1], reverse=True):
+				need = piece[1] + kerf_cm
+				fits = [bar for bar in range(len(bars)) if bar != candidate and trial[bar] + _EPSILON >= need]
+				if not fits:
+					break
+				target = min(fits, key=trial.__getitem__)
+				trial[target] -= need
+				moves.append((target, piece))
+			else:
+				for target, piece in moves:
+					bars[target].append(piece)
+				del bars[candidate]
+				improved = True
+				break
+	return bars
+
+
+def plan_moulding(orders, bar_length_cm, kerf_cm=0, time_budget=None):
+	"""
+	Plan how to cut the moulding for a batch of framing orders from bars of
+	bar_length_cm, using first-fit decreasing.
+	:param orders: sequence of (width_cm, height_cm), validated like calculate_framing_price
+	:param kerf_cm: material lost to each saw cut
+	:param time_budget: seconds for an optional pass that tries to empty
+		bars by moving their pieces into other bars; None skips it
+	:return: MouldingPlan
+	"""
+	if bar_length_cm <= 0 or kerf_cm < 0:
+		raise ValueError("Bar length must be positive and kerf cannot be negative.")
+	pieces = _pieces(orders)
+	if pieces and max(length for _, length in pieces) + kerf_cm > bar_length_cm + _EPSILON:
+		raise ValueError("Bar length is shorter than the longest piece.")
+	bars = _first_fit_decreasing(pieces, bar_length_cm, kerf_cm)
+	if time_budget:
+		bars = _improve(bars, bar_length_cm, kerf_cm, time.perf_counter() + time_budget)
+	return MouldingPlan(bars, bar_length_cm, kerf_cm)
@@ -0,0 +1,45 @@
+"""
+Batch quoting against calling calculate_framing_price per size.
+
+Run from the exercise folder:  python -m benchmarks.bench_Framing_shop [quotes]
+"""
+import random
+import sys
+import time
+
+from app.Framing_shop import FramingPriceGrid, calculate_framing_price, numpy, quote_framing_prices
+
+
+def _quotes_per_second(func, count):
+	start = time.perf_counter()
+	func()
+	return count / (time.perf_counter() - start)
+
+
+def _scalar(sizes):
+	prices = []
+	for width, height in sizes:
+		try:
+			prices.append(calculate_framing_price(width, height))
+		except ValueError:
+			prices.append(0)
+	return prices
+
+
+def main(count=1_000_000):
+	sizes = [(random.randint(25, 105), random.randint(25, 65)) for _ in range(count)]
+	grid = FramingPriceGrid()
+	runs = [
+		("scalar with try/except", lambda: _scalar(sizes)),
+		("batch", lambda: quote_framing_prices(sizes)),
+		("batch with grid", lambda: quote_framing_prices(sizes, grid=grid)),
+	]
+	if numpy is not None:
+		array = numpy.array(sizes)
+		runs.append(("batch, NumPy", lambda: quote_framing_prices(array)))
+	for name, func in runs:
+		print(f"{name:>23}: {_quotes_per_second(func, count):>14,.0f} quotes/s")
+
+
+if __name__ == "__main__":
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,31 @@
+"""
+Moulding cutting plans for a day's orders: first-fit decreasing alone and
+with a short improvement pass, against cutting order by order.
+
+Run from the exercise folder:  python -m benchmarks.bench_Moulding_planner [orders]
+"""
+import math
+import random
+import sys
+import time
+
+from app.Moulding_planner import plan_moulding
+
+BAR_LENGTH_CM = 290
+KERF_CM = 0.3
+
+
+def main(orders=1000):
+	batch = [(random.randint(30, 100), random.randint(30, 60)) for _ in range(orders)]
+	lower_bound = math.ceil(sum(2 * (w + h) for w, h in batch) / BAR_LENGTH_CM)
+	order_by_order = sum(plan_moulding([order], BAR_LENGTH_CM, KERF_CM).bar_count for order in batch)
+	print(f"{orders * 4} cuts, lower bound {lower_bound} bars, order by order {order_by_order} bars")
+	for name, time_budget in [("first-fit decreasing", None), ("with 0.5 s improvement", 0.5)]:
+		start = time.perf_counter()
+		plan = plan_moulding(batch, BAR_LENGTH_CM, KERF_CM, time_budget=time_budget)
+		seconds = time.perf_counter() - start
+		print(f"{name:>22}: {plan.bar_count} bars, waste {plan.waste_ratio:.2%}, {seconds * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
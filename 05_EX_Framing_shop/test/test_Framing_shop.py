@@ -1,6 +1,6 @@
 
 import pytest
-from app.Framing_shop import calculate_framing_price
+from app.Framing_shop import FramingPriceGrid, calculate_framing_price, quote_framing_prices
 
 # Valid cases: (width, height, expected_price)
 @pytest.mark.parametrize("width, height, expected_price", [
@@ -27,3 +27,55 @@ def test_calculate_framing_price_valid(width, height, expected_price):
 def test_calculate_framing_price_invalid(width, height):
 	with pytest.raises(ValueError):
 		calculate_framing_price(width, height)
+
+# Batch quotes
+
+SIZES = [(30, 30), (100, 60), (40, 40), (40, 41), (29, 40), (40, 61), (55.5, 30.5)]
+EXPECTED_VALID = [True, True, True, True, False, False, True]
+
+@pytest.mark.parametrize("grid", [None, FramingPriceGrid(), FramingPriceGrid(resolution=0.5)])
+def test_quote_batch_matches_scalar(grid):
+	prices, valid = quote_framing_prices(SIZES, grid=grid)
+	assert valid == EXPECTED_VALID
+	for (width, height), price, ok in zip(SIZES, prices, valid):
+		assert price == (calculate_framing_price(width, height) if ok else 0)
+
+@pytest.mark.parametrize("grid", [None, FramingPriceGrid()])
+def test_quote_batch_marks_non_numeric_sizes_invalid(grid):
+	sizes = [(40, 40), (None, 40), ("40", 40), (40,), None, (50, float("nan")), (100, 60)]
+	prices, valid = quote_framing_prices(sizes, grid=grid)
+	assert valid == [True, False, False, False, False, False, True]
+	assert prices == [3000, 0, 0, 0, 0, 0, 3500]
+
+@pytest.mark.parametrize("grid", [None, FramingPriceGrid()])
+def test_quote_batch_accepts_generators(grid):
+	assert quote_framing_prices(((30, 40) for _ in range(2)), grid=grid) == ([3000, 3000], [True, True])
+	prices, valid = quote_framing_prices((size for size in [(40, 41), None, (100, 60)]), grid=grid)
+	assert (prices, valid) == ([3500, 0, 3500], [True, False, True])
+
+def test_quote_numpy_batch_matches_plain():
+	numpy = pytest.importorskip("numpy")
+	prices, valid = quote_framing_prices(numpy.array(SIZES))
+	assert valid.tolist() == EXPECTED_VALID
+	assert prices.tolist() == quote_framing_prices(SIZES)[0]
+
+def test_grid_covers_whole_valid_range():
+	assert len(FramingPriceGrid()) == 71 * 31
+	assert len(FramingPriceGrid(resolution=10)) == 8 * 4
+
+def test_fractional_grid_prices_decimal_sizes_from_the_grid(monkeypatch):
+	grid = FramingPriceGrid(resolution=0.1)
+	sizes = [(46.4, 34.5), (30.3, 52.9), (99.9, 59.9), (40.0, 40.0), (40.1, 40.0)]
+	expected = [calculate_framing_price(width, height) for width, height in sizes]
+	monkeypatch.setattr("app.Framing_shop.calculate_framing_price", None)  # a miss would fail
+	assert [grid.lookup(width, height) for width, height in sizes] == expected
+
+@pytest.mark.parametrize("width, height", [(29, 40), (101, 40), (40, 29), (40, 61)])
+def test_grid_lookup_invalid_raises(width, height):
+	with pytest.raises(ValueError):
+		FramingPriceGrid().lookup(width, height)
+
+@pytest.mark.parametrize("resolution", [0, -1, 0.3, 7])
+def test_grid_invalid_resolution(resolution):
+	with pytest.raises(ValueError):
+		FramingPriceGrid(resolution=resolution)
@@ -0,0 +1,67 @@
+import math
+import random
+from collections import Counter
+
+import pytest
+from app.Moulding_planner import plan_moulding
+
+
+def _check_plan(plan, orders):
+	# Every order gets exactly two width pieces and two height pieces
+	cut = Counter(piece for bar in plan.bars for piece in bar)
+	expected = Counter()
+	for index, (width, height) in enumerate(orders):
+		expected[(index, width)] += 2
+		expected[(index, height)] += 2
+	assert cut == expected
+	for bar in plan.bars:
+		assert sum(length + plan.kerf_cm for _, length in bar) <= plan.bar_length_cm + 1e-9
+
+
+def test_single_frame_fits_one_bar():
+	plan = plan_moulding([(40, 30)], bar_length_cm=300)
+	assert plan.bar_count == 1
+	assert plan.used_cm == 140
+	assert plan.waste_cm == 160
+
+def test_perfect_packing_has_no_waste():
+	orders = [(50, 50)] * 6  # 24 pieces of 50 cm
+	plan = plan_moulding(orders, bar_length_cm=200)
+	_check_plan(plan, orders)
+	assert plan.bar_count == 6
+	assert plan.waste_ratio == 0
+
+def test_kerf_reduces_pieces_per_bar():
+	plan = plan_moulding([(50, 50)], bar_length_cm=200, kerf_cm=0.5)
+	assert plan.bar_count == 2
+
+@pytest.mark.parametrize("time_budget", [None, 0.2])
+def test_random_batch_is_valid_and_near_lower_bound(time_budget):
+	random.seed(7)
+	orders = [(random.randint(30, 100), random.randint(30, 60)) for _ in range(500)]
+	plan = plan_moulding(orders, bar_length_cm=290, kerf_cm=0.3, time_budget=time_budget)
+	_check_plan(plan, orders)
+	lower_bound = math.ceil(sum(2 * (w + h) for w, h in orders) / 290)
+	assert lower_bound <= plan.bar_count <= lower_bound * 1.1
+
+def test_improvement_pass_never_adds_bars():
+	random.seed(11)
+	orders = [(random.randint(30, 100), random.randint(30, 60)) for _ in range(200)]
+	first_fit = plan_moulding(orders, bar_length_cm=250)
+	improved = plan_moulding(orders, bar_length_cm=250, time_budget=0.2)
+	_check_plan(improved, orders)
+	assert improved.bar_count <= first_fit.bar_count
+
+def test_empty_batch():
+	plan = plan_moulding([], bar_length_cm=300)
+	assert plan.bar_count == 0 and plan.waste_ratio == 0.0
+
+@pytest.mark.parametrize("orders, bar_length_cm, kerf_cm", [
+	([(29, 40)], 300, 0),    # invalid frame size
+	([(100, 60)], 90, 0),    # piece longer than a bar
+	([(40, 40)], 0, 0),      # no bar length
+	([(40, 40)], 300, -1),   # negative kerf
+])
+def test_invalid_input_raises(orders, bar_length_cm, kerf_cm):
+	with pytest.raises(ValueError):
+		plan_moulding(orders, bar_length_cm, kerf_cm)
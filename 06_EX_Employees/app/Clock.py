@@ -0,0 +1,54 @@
+from contextlib import contextmanager
+from datetime import date, datetime
+
+
+class SystemClock:
+    """The real calendar date."""
+
+    def today(self):
+        return date.today()
+
+
+class FixedClock:
+    """Always returns the same date, e.g. the "as of" date of a batch run."""
+
+    def __init__(self, day):
+        if not isinstance(day, date):
+            raise TypeError("FixedClock needs a datetime.date.")
+        # A datetime is a date too, but the date checks subtract plain dates
+        self.day = day.date() if isinstance(day, datetime) else day
+
+    def today(self):
+        return self.day
+
+
+# One clock for the whole process. It is not thread-local: set_clock and
+# as_of in one thread change the date seen by every thread.
+_clock = SystemClock()
+
+
+def get_clock():
+    return _clock
+
+def set_clock(clock):
+    """Install clock for all date checks; returns the previous clock."""
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
+
+def today():
+    return _clock.today()
+
+
+@contextmanager
+def as_of(day=None):
+    """
+    Run a block against a single date: day, or today's date read once on
+    entry, so a batch that crosses midnight sees one consistent date.
+    Not thread-safe; the date changes for every thread in the process.
+    """
+    previous = set_clock(FixedClock(day or _clock.today()))
+    try:
+        yield _clock
+    finally:
+        set_clock(previous)
@@ -0,0 +1,163 @@
+from datetime import date
+
+from app import Clock
+from app.Employees import (
+    DATE_FORMAT, EDUCATION_LEVELS, SALARY_PER_EDUCATION_LEVEL,
+    validate_cpr, validate_name, validate_department, validate_base_salary,
+    validate_educational_level, parse_date_of_birth, parse_date_of_employment,
+    validate_country, seniority_discount, shipping_cost, parse_date,
+)
+
+
+def _unless_padded(text, ordinal):
+    # None when the getter can rebuild text from the ordinal, else text itself
+    return None if text == date.fromordinal(ordinal).strftime(DATE_FORMAT) else text
+
+
+class CompactEmployee:
+    """
+    Memory-compact Employee for large rosters.
+
+    Same validation, getters and calculations as Employee, but the instance
+    has no __dict__, dates are stored as date ordinals (parsed once, not on
+    every getDiscount call) and the educational level as a small int.
+    Date getters return the text that was set, like Employee. It is rebuilt
+    from the ordinal, and kept only when it differs from the zero-padded
+    dd/mm/yyyy form (e.g. "1/1/1990").
+    """
+    __slots__ = (
+        "_cpr", "_first_name", "_last_name", "_department", "_base_salary",
+        "_educational_level", "_birth_ordinal", "_employment_ordinal", "_country",
+        "_birth_text", "_employment_text",
+    )
+
+    def __init__(self, cpr, first_name, last_name, department, base_salary, educational_level, date_of_birth, date_of_employment, country):
+        self.set_cpr(cpr)
+        self.set_first_name(first_name)
+        self.set_last_name(last_name)
+        self.set_department(department)
+        self.set_base_salary(base_salary)
+        self.set_educational_level(educational_level)
+        self.set_date_of_birth(date_of_birth)
+        self.set_date_of_employment(date_of_employment)
+        self.set_country(country)
+
+    @classmethod
+    def from_employee(cls, employee):
+        return cls(
+            employee.get_cpr(), employee.get_first_name(), employee.get_last_name(),
+            employee.get_department(), employee.get_base_salary(),
+            employee.get_educational_level_number(), employee.get_date_of_birth(),
+            employee.get_date_of_employment(), employee.get_country(),
+        )
+
+    @classmethod
+    def from_validated(cls, cpr, first_name, last_name, department, base_salary, educational_level, birth_ordinal, employment_ordinal, country):
+        """
+        Build an instance from fields that were already validated, e.g. when
+        loading a stored roster. Dates are date ordinals. Skips all checks.
+        """
+        employee = cls.__new__(cls)
+        employee._cpr = cpr
+        employee._first_name = first_name
+        employee._last_name = last_name
+        employee._department = department
+        employee._base_salary = base_salary
+        employee._educational_level = educational_level
+        employee._birth_ordinal = birth_ordinal
+        employee._employment_ordinal = employment_ordinal
+        employee._country = country
+        employee._birth_text = employee._employment_text = None
+        return employee
+
+    # CPR
+    def get_cpr(self):
+        return self._cpr
+    def set_cpr(self, value):
+        self._cpr = validate_cpr(value)
+
+    # First name
+    def get_first_name(self):
+        return self._first_name
+    def set_first_name(self, value):
+        self._first_name = validate_name(value, "First name")
+
+    # Last name
+    def get_last_name(self):
+        return self._last_name
+    def set_last_name(self, value):
+        self._last_name = validate_name(value, "Last name")
+
+    # Department
+    def get_department(self):
+        return self._department
+    def set_department(self, value):
+        self._department = validate_department(value)
+
+    # Base salary
+    def get_base_salary(self):
+        return self._base_salary
+    def set_base_salary(self, value):
+        self._base_salary = validate_base_salary(value)
+
+    # Educational level
+    def get_educational_level(self):
+        return EDUCATION_LEVELS.get(self._educational_level, "unknown")
+    def get_educational_level_number(self):
+        return self._educational_level
+    def set_educational_level(self, value):
+        self._educational_level = int(validate_educational_level(value))
+
+    # Date of birth
+    def get_date_of_birth(self):
+        return self._birth_text or date.fromordinal(self._birth_ordinal).strftime(DATE_FORMAT)
+    def get_date_of_birth_ordinal(self):
+        return self._birth_ordinal
+    def set_date_of_birth(self, value):
+        self._birth_ordinal = parse_date_of_birth(value).toordinal()
+        self._birth_text = _unless_padded(value, self._birth_ordinal)
+
+    # Date of employment
+    def get_date_of_employment(self):
+        return self._employment_text or date.fromordinal(self._employment_ordinal).strftime(DATE_FORMAT)
+    def get_date_of_employment_ordinal(self):
+        return self._employment_ordinal
+    def set_date_of_employment(self, value):
+        self._employment_ordinal = parse_date_of_employment(value).toordinal()
+        self._employment_text = _unless_padded(value, self._employment_ordinal)
+
+    # Country
+    def get_country(self):
+        return self._country
+    def set_country(self, value):
+        self._country = validate_country(value)
+
+    # Actual salary
+    def getSalary(self):
+        return self._base_salary + (self._educational_level * SALARY_PER_EDUCATION_LEVEL)
+
+    # Discount
+    def getDiscount(self):
+        return seniority_discount(self._employment_ordinal, Clock.today().toordinal())
+
+    # Shipping costs
+    def getShippingCosts(self):
+        return shipping_cost(self._country)
+
+
+def validated_fields(employee):
+    """
+    Fields of an Employee or CompactEmployee as a tuple in the order of
+    CompactEmployee.from_validated (dates as date ordinals).
+    """
+    if isinstance(employee, CompactEmployee):
+        birth = employee.get_date_of_birth_ordinal()
+        employment = employee.get_date_of_employment_ordinal()
+    else:
+        birth = parse_date(employee.get_date_of_birth()).toordinal()
+        employment = parse_date(employee.get_date_of_employment()).toordinal()
+    return (
+        employee.get_cpr(), employee.get_first_name(), employee.get_last_name(),
+        employee.get_department(), employee.get_base_salary(),
+        employee.get_educational_level_number(), birth, employment, employee.get_country(),
+    )
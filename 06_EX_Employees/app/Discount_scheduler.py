@@ -0,0 +1,84 @@
+from heapq import heappop, heappush
+from itertools import count
+
+from app import Clock
+from app.Employees import Employee, parse_date, seniority_discount
+
+
+class DiscountScheduler:
+    """
+    Seniority discounts cached per employee and updated only on anniversaries.
+
+    A discount changes only when another full 365 days of employment have
+    passed. The scheduler keeps a heap of (next change ordinal, version,
+    key) entries. advance_to() pops just the employees whose discount
+    changes by the given day. discount() is a dict lookup and equals
+    Employee.getDiscount() for the scheduler's current day. A changed date
+    of employment bumps the employee's version, which leaves older heap
+    entries stale.
+    """
+
+    def __init__(self, employees=(), today=None):
+        self._today = (today or Clock.today()).toordinal()
+        self._entries = {}   # id(employee) -> [employee, employment ordinal, discount, version]
+        self._heap = []
+        self._versions = count()
+        for employee in employees:
+            self.add(employee)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def today(self):
+        return self._today
+
+    def _schedule(self, key, employment_ordinal):
+        entry = self._entries[key]
+        entry[1] = employment_ordinal
+        entry[2] = seniority_discount(employment_ordinal, self._today)
+        entry[3] = next(self._versions)
+        years = (self._today - employment_ordinal) // 365
+        heappush(self._heap, (employment_ordinal + 365 * (years + 1), entry[3], key))
+
+    def add(self, employee):
+        if not isinstance(employee, Employee):
+            raise TypeError("DiscountScheduler tracks Employee objects.")
+        key = id(employee)
+        if key in self._entries:
+            raise ValueError("Employee is already scheduled.")
+        self._entries[key] = [employee, None, None, None]
+        self._schedule(key, parse_date(employee.get_date_of_employment()).toordinal())
+        employee.add_listener(self._on_change)
+
+    def remove(self, employee):
+        if self._entries.pop(id(employee), None) is None:
+            raise ValueError("Employee is not scheduled.")
+        employee.remove_listener(self._on_change)
+
+    def _on_change(self, employee, field, old, new):
+        if field == "date_of_employment" and old != new:
+            self._schedule(id(employee), parse_date(new).toordinal())
+
+    def discount(self, employee):
+        return self._entries[id(employee)][2]
+
+    def advance_to(self, day):
+        """
+        Move the scheduler to day (a date, not before the current day) and
+        return the employees whose discount changed.
+        """
+        day = day.toordinal()
+        if day < self._today:
+            raise ValueError("The scheduler cannot move back in time.")
+        self._today = day
+        changed = []
+        heap = self._heap
+        while heap and heap[0][0] <= day:
+            _, version, key = heappop(heap)
+            entry = self._entries.get(key)
+            if entry is None or entry[3] != version:
+                continue  # removed, or its date of employment changed
+            self._schedule(key, entry[1])
+            changed.append(entry[0])
+        return changed
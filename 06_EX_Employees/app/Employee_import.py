@@ -0,0 +1,179 @@
+import csv
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from app import Clock
+from app.Employee_table import EmployeeTable
+from app.Employees import (
+    validate_cpr, validate_name, validate_department, validate_base_salary,
+    validate_educational_level, parse_date_of_birth, parse_date_of_employment,
+    validate_country,
+)
+
+FIELDS = [
+    "cpr", "first_name", "last_name", "department", "base_salary",
+    "educational_level", "date_of_birth", "date_of_employment", "country",
+]
+
+
+_CHECKS = [
+    ("cpr", validate_cpr),
+    ("first_name", lambda value: validate_name(value, "First name")),
+    ("last_name", lambda value: validate_name(value, "Last name")),
+    ("department", validate_department),
+    ("base_salary", validate_base_salary),
+    ("educational_level", lambda value: int(validate_educational_level(value))),
+    ("date_of_birth", lambda value: parse_date_of_birth(value).toordinal()),
+    ("date_of_employment", lambda value: parse_date_of_employment(value).toordinal()),
+    ("country", validate_country),
+]
+
+
+def validate_record(record):
+    """
+    Check every field of one record (a dict keyed by FIELDS) and collect all
+    problems instead of stopping at the first one.
+    :return: tuple (fields, errors); fields is ready for
+        EmployeeTable.append_validated, errors is a list of (field, message)
+    """
+    fields = []
+    errors = []
+    for name, check in _CHECKS:
+        if name not in record:
+            errors.append((name, "Missing field."))
+            continue
+        try:
+            fields.append(check(record[name]))
+        except ValueError as error:
+            errors.append((name, str(error)))
+    return fields, errors
+
+
+def _csv_number(value, convert):
+    try:
+        return convert(value)
+    except ValueError:
+        return value  # left as text, so the field check reports it
+
+def _csv_salary(value):
+    return int(value) if value.strip().isdigit() else float(value)
+
+def _check_utf8(text):
+    # The source is read with surrogateescape, so undecodable bytes show up
+    # here as lone surrogates instead of stopping the whole import
+    if not text.isascii():
+        try:
+            text.encode("utf-8")
+        except UnicodeEncodeError:
+            raise ValueError("Row is not valid UTF-8.") from None
+
+def _parse_csv(values, header):
+    for value in values:
+        _check_utf8(value)
+    if len(values) != len(header):
+        raise ValueError(f"Expected {len(header)} columns, got {len(values)}.")
+    record = dict(zip(header, values))
+    # CSV has no types, so the numeric columns are converted before the checks
+    record["base_salary"] = _csv_number(record["base_salary"], _csv_salary)
+    record["educational_level"] = _csv_number(record["educational_level"], int)
+    return record
+
+def _parse_jsonl(line, _):
+    _check_utf8(line)
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError("Each line must be a JSON object.")
+    return record
+
+# A CSV chunk goes through a single csv.reader; JSONL lines are parsed one by one
+_PARSERS = {"csv": (_parse_csv, csv.reader), "jsonl": (_parse_jsonl, iter)}
+
+
+def _validate_chunk(file_format, header, first_row, lines, day):
+    """Return (valid field tuples, errors) for one chunk; runs in a worker process."""
+    # Worker processes do not share the parent's clock, so the date is passed in
+    with Clock.as_of(day):
+        return _validate_lines(file_format, header, first_row, lines)
+
+
+def _validate_lines(file_format, header, first_row, lines):
+    parse, split = _PARSERS[file_format]
+    valid = []
+    errors = []
+    for row, line in enumerate(split(lines), start=first_row):
+        if not line or (isinstance(line, str) and not line.strip()):
+            continue
+        try:
+            record = parse(line, header)
+        except ValueError as error:
+            errors.append((row, "row", str(error)))
+            continue
+        fields, field_errors = validate_record(record)
+        if field_errors:
+            errors.extend((row, field, message) for field, message in field_errors)
+        else:
+            valid.append(fields)
+    return valid, errors
+
+
+def _chunks(file, chunk_size):
+    first_row = 1
+    while lines := list(islice(file, chunk_size)):
+        yield first_row, lines
+        first_row += len(lines)
+
+
+def _map_chunks(file_format, header, chunks, workers, day):
+    if workers <= 1:
+        for first_row, lines in chunks:
+            yield _validate_chunk(file_format, header, first_row, lines, day)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for first_row, lines in chunks:
+            pending.append(pool.submit(_validate_chunk, file_format, header, first_row, lines, day))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def import_employees(path, error_path, roster=None, workers=1, chunk_size=5_000, file_format=None):
+    """
+    Import employees from a CSV (header row with the FIELDS names) or JSONL
+    file into a roster.
+
+    Rows are validated in chunks, on a process pool when workers > 1, and
+    valid rows are appended to roster (a new EmployeeTable by default) in
+    file order. All rows are checked against one date, Clock.today() read
+    when the import starts, in the worker processes too. Every problem is
+    written to error_path as CSV (row, field, message); a bad row, including
+    one that is not valid UTF-8, never stops the import.
+    :return: tuple (roster, imported, rejected)
+    """
+    if file_format is None:
+        file_format = "csv" if str(path).lower().endswith(".csv") else "jsonl"
+    if file_format not in _PARSERS:
+        raise ValueError("file_format must be 'csv' or 'jsonl'.")
+    roster = EmployeeTable() if roster is None else roster
+    day = Clock.today()
+    imported = rejected = 0
+    with open(path, encoding="utf-8", errors="surrogateescape", newline="") as source, \
+            open(error_path, "w", encoding="utf-8", newline="") as error_file:
+        report = csv.writer(error_file)
+        report.writerow(["row", "field", "message"])
+        header = None
+        if file_format == "csv":
+            header = next(csv.reader([source.readline()]), [])
+            missing = [field for field in FIELDS if field not in header]
+            if missing:
+                raise ValueError(f"CSV header is missing {missing}.")
+        for valid, errors in _map_chunks(file_format, header, _chunks(source, chunk_size), workers, day):
+            for fields in valid:
+                roster.append_validated(*fields)
+            imported += len(valid)
+            rejected += len({row for row, _, _ in errors})
+            report.writerows(errors)
+    return roster, imported, rejected
@@ -0,0 +1,109 @@
+import sqlite3
+from itertools import islice
+
+from app.Compact_employee import CompactEmployee, validated_fields
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS employees (
+    cpr TEXT PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    department TEXT NOT NULL,
+    base_salary REAL NOT NULL,
+    educational_level INTEGER NOT NULL,
+    birth_ordinal INTEGER NOT NULL,
+    employment_ordinal INTEGER NOT NULL,
+    country TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS employees_department ON employees (department);
+CREATE INDEX IF NOT EXISTS employees_country ON employees (country);
+"""
+_COLUMNS = (
+    "cpr, first_name, last_name, department, base_salary, educational_level, "
+    "birth_ordinal, employment_ordinal, country"
+)
+_UPSERT = (
+    f"INSERT INTO employees ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (cpr) DO UPDATE SET "
+    "first_name = excluded.first_name, last_name = excluded.last_name, "
+    "department = excluded.department, base_salary = excluded.base_salary, "
+    "educational_level = excluded.educational_level, birth_ordinal = excluded.birth_ordinal, "
+    "employment_ordinal = excluded.employment_ordinal, country = excluded.country"
+)
+
+
+class EmployeeStore:
+    """
+    Employees persisted in an SQLite database (WAL journal).
+
+    CPR is the primary key, and department and country are indexed. Writes
+    are upserts batched into one transaction per batch. Reads stream from
+    the cursor in fetchmany batches and yield CompactEmployee objects
+    without validating them again. Values written through the store have
+    already passed the Employee checks.
+    """
+
+    def __init__(self, path, batch_size=50_000):
+        self.batch_size = batch_size
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+
+    # Writes
+    def upsert(self, employees):
+        """Insert or replace (by CPR) Employee/CompactEmployee objects; returns the number written."""
+        return self.upsert_rows(map(validated_fields, employees))
+
+    def upsert_rows(self, rows):
+        """
+        Insert or replace validated field tuples in the order of
+        EmployeeTable.append_validated (dates as ordinals).
+        """
+        written = 0
+        rows = iter(rows)
+        while batch := list(islice(rows, self.batch_size)):
+            with self._connection:  # one transaction per batch
+                self._connection.executemany(_UPSERT, batch)
+            written += len(batch)
+        return written
+
+    def delete(self, cpr):
+        with self._connection:
+            return self._connection.execute("DELETE FROM employees WHERE cpr = ?", (cpr,)).rowcount == 1
+
+    # Reads
+    def _stream(self, sql, parameters=()):
+        cursor = self._connection.execute(sql, parameters)
+        try:
+            while rows := cursor.fetchmany(self.batch_size):
+                for row in rows:
+                    yield CompactEmployee.from_validated(*row)
+        finally:
+            cursor.close()
+
+    def get(self, cpr):
+        return next(self._stream(f"SELECT {_COLUMNS} FROM employees WHERE cpr = ?", (cpr,)), None)
+
+    def load(self, department=None, country=None):
+        """Lazily yield the stored employees (optionally filtered), ordered by CPR."""
+        conditions = []
+        parameters = []
+        for column, value in (("department", department), ("country", country)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._stream(f"SELECT {_COLUMNS} FROM employees{where} ORDER BY cpr", parameters)
@@ -0,0 +1,177 @@
+from array import array
+from itertools import compress, repeat
+from operator import add, mul
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, the column passes fall back to plain Python
+    numpy = None
+
+from app import Clock
+from app.Compact_employee import CompactEmployee, validated_fields
+from app.Employees import (
+    DEPARTMENTS, SALARY_PER_EDUCATION_LEVEL, shipping_cost,
+)
+
+_DEPARTMENT_CODES = {department: code for code, department in enumerate(DEPARTMENTS)}
+_TYPED_COLUMNS = ("department", "base_salary", "educational_level", "birth_ordinal", "employment_ordinal", "country")
+
+
+def _view(column):
+    # Zero-copy NumPy view of an array column. It pins the array's buffer
+    # (appends raise BufferError), so views never outlive the method call.
+    return numpy.frombuffer(column, dtype=column.typecode)
+
+def _from_numpy(typecode, values):
+    column = array(typecode)
+    column.frombytes(values.astype(typecode, copy=False).tobytes())
+    return column
+
+
+class EmployeeTable:
+    """
+    A roster stored as typed columns instead of one object per employee.
+
+    Salary, seniority discount and shipping cost are computed for the whole
+    table in single passes over the columns and give the same values as the
+    per-object Employee methods. Departments and countries are stored as
+    small integer codes. Columns are array-module arrays, so appends stay
+    cheap; with NumPy installed the passes run vectorised on zero-copy
+    views of them.
+    """
+
+    def __init__(self):
+        self.cpr = []
+        self.first_name = []
+        self.last_name = []
+        self.department = array('b')
+        self.base_salary = array('d')
+        self.educational_level = array('b')
+        self.birth_ordinal = array('l')
+        self.employment_ordinal = array('l')
+        self.country = array('h')
+        self._countries = []
+        self._country_codes = {}
+
+    @classmethod
+    def from_employees(cls, employees):
+        table = cls()
+        for employee in employees:
+            table.append(employee)
+        return table
+
+    def __len__(self):
+        return len(self.cpr)
+
+    def _country_code(self, country):
+        code = self._country_codes.get(country)
+        if code is None:
+            code = self._country_codes[country] = len(self._countries)
+            self._countries.append(country)
+        return code
+
+    def append(self, employee):
+        """Append an Employee or CompactEmployee (already validated)."""
+        self.append_validated(*validated_fields(employee))
+
+    def append_validated(self, cpr, first_name, last_name, department, base_salary, educational_level, birth_ordinal, employment_ordinal, country):
+        """Append one row of already validated fields; dates are date ordinals."""
+        self.cpr.append(cpr)
+        self.first_name.append(first_name)
+        self.last_name.append(last_name)
+        self.department.append(_DEPARTMENT_CODES[department])
+        self.base_salary.append(base_salary)
+        self.educational_level.append(educational_level)
+        self.birth_ordinal.append(birth_ordinal)
+        self.employment_ordinal.append(employment_ordinal)
+        self.country.append(self._country_code(country))
+
+    def row(self, index):
+        return CompactEmployee.from_validated(
+            self.cpr[index], self.first_name[index], self.last_name[index],
+            DEPARTMENTS[self.department[index]], self.base_salary[index],
+            self.educational_level[index], self.birth_ordinal[index],
+            self.employment_ordinal[index], self._countries[self.country[index]],
+        )
+
+    def __iter__(self):
+        return map(self.row, range(len(self)))
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.take(range(len(self))[key])
+        return self.row(key)
+
+    # Selection
+    def take(self, indices):
+        """New table with the given rows, in the given order."""
+        indices = list(indices)
+        table = EmployeeTable()
+        for name in ("cpr", "first_name", "last_name"):
+            column = getattr(self, name)
+            setattr(table, name, [column[i] for i in indices])
+        if numpy is not None:
+            positions = numpy.array(indices, dtype=numpy.intp)
+            for name in _TYPED_COLUMNS:
+                column = getattr(self, name)
+                setattr(table, name, _from_numpy(column.typecode, _view(column)[positions]))
+        else:
+            for name in _TYPED_COLUMNS:
+                column = getattr(self, name)
+                setattr(table, name, array(column.typecode, [column[i] for i in indices]))
+        table._countries = list(self._countries)
+        table._country_codes = dict(self._country_codes)
+        return table
+
+    def filter(self, mask):
+        """New table with the rows where mask is true."""
+        return self.take(compress(range(len(self)), mask))
+
+    def where(self, department=None, country=None, educational_level=None):
+        """
+        Boolean mask of rows matching all the given column values.
+        """
+        if numpy is not None:
+            return self._where_numpy(department, country, educational_level)
+        mask = [True] * len(self)
+        if department is not None:
+            code = _DEPARTMENT_CODES.get(department, -1)
+            mask = [ok and value == code for ok, value in zip(mask, self.department)]
+        if country is not None:
+            code = self._country_codes.get(country, -1)
+            mask = [ok and value == code for ok, value in zip(mask, self.country)]
+        if educational_level is not None:
+            mask = [ok and value == educational_level for ok, value in zip(mask, self.educational_level)]
+        return mask
+
+    def _where_numpy(self, department, country, educational_level):
+        mask = numpy.ones(len(self), dtype=bool)
+        if department is not None:
+            mask &= _view(self.department) == _DEPARTMENT_CODES.get(department, -1)
+        if country is not None:
+            mask &= _view(self.country) == self._country_codes.get(country, -1)
+        if educational_level is not None:
+            mask &= _view(self.educational_level) == educational_level
+        return mask.tolist()
+
+    # Column-wise calculations
+    def salaries(self):
+        """getSalary for every row: base salary + 1220 per educational level."""
+        if numpy is not None:
+            levels = _view(self.educational_level).astype(numpy.float64)
+            return _from_numpy('d', _view(self.base_salary) + levels * SALARY_PER_EDUCATION_LEVEL)
+        return array('d', map(add, self.base_salary, map(mul, self.educational_level, repeat(SALARY_PER_EDUCATION_LEVEL))))
+
+    def discounts(self, today=None):
+        """getDiscount for every row, as of today (a date) or the clock's date."""
+        today_ordinal = (today or Clock.today()).toordinal()
+        if numpy is not None:
+            return _from_numpy('d', (today_ordinal - _view(self.employment_ordinal)) // 365 * 0.5)
+        return array('d', [(today_ordinal - employed) // 365 * 0.5 for employed in self.employment_ordinal])
+
+    def shipping_costs(self):
+        """getShippingCosts for every row."""
+        cost_by_code = [shipping_cost(country) for country in self._countries]
+        if numpy is not None:
+            return _from_numpy('h', numpy.array(cost_by_code, dtype=numpy.int16)[_view(self.country)])
+        return array('h', map(cost_by_code.__getitem__, self.country))
@@ -1,6 +1,99 @@
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+
+from app import Clock
+
+DATE_FORMAT = "%d/%m/%Y"
+DEPARTMENTS = ['HR', 'Finance', 'IT', 'Sales', 'General Services']
+EDUCATION_LEVELS = {0: "none", 1: "primary", 2: "secondary", 3: "tertiary"}
+SALARY_PER_EDUCATION_LEVEL = 1220
+NORDIC_FREE = ["Denmark", "Norway", "Sweden"]
+NORDIC_HALF = ["Iceland", "Finland"]
+
+
+@lru_cache(maxsize=32768)
+def parse_date(value):
+    """
+    Parse a dd/mm/yyyy string to a date. A roster holds few distinct dates,
+    so results are cached; the common zero-padded form skips strptime.
+    """
+    if len(value) == 10 and value[2] == value[5] == '/' and value.isascii():
+        day, month, year = value[:2], value[3:5], value[6:]
+        if day.isdigit() and month.isdigit() and year.isdigit():
+            return date(int(year), int(month), int(day))
+    return datetime.strptime(value, DATE_FORMAT).date()
+
+
+# Validation rules, shared by Employee and the other roster representations.
+# Each returns the validated value or raises ValueError.
+def validate_cpr(value):
+    if isinstance(value, str) and value.isdigit() and len(value) == 10:
+        return value
+    raise ValueError("CPR must be a string of 10 digits.")
+
+def validate_name(value, label):
+    # Letters, spaces and dashes only; str.isalpha() does the per-character check in C
+    if isinstance(value, str) and 1 <= len(value) <= 30:
+        letters = value.replace(' ', '').replace('-', '')
+        if not letters or letters.isalpha():
+            return value
+    raise ValueError(f"{label} must be 1-30 alphabetic characters, spaces or dashes.")
+
+def validate_department(value):
+    if value in DEPARTMENTS:
+        return value
+    raise ValueError(f"Department must be one of {DEPARTMENTS}.")
+
+def validate_base_salary(value):
+    if isinstance(value, (int, float)) and 20000 <= value <= 100000:
+        return value
+    raise ValueError("Base salary must be between 20000 and 100000.")
+
+def validate_educational_level(value):
+    if value in [0, 1, 2, 3]:
+        return value
+    raise ValueError("Educational level must be 0, 1, 2, or 3.")
+
+def parse_date_of_birth(value):
+    try:
+        dob = parse_date(value)
+    except Exception:
+        raise ValueError("Date of birth must be in dd/MM/yyyy format.")
+    if (Clock.today() - dob).days >= 18 * 365:
+        return dob
+    raise ValueError("Employee must be at least 18 years old.")
+
+def parse_date_of_employment(value):
+    try:
+        doe = parse_date(value)
+    except Exception:
+        raise ValueError("Date of employment must be in dd/MM/yyyy format.")
+    if doe <= Clock.today():
+        return doe
+    raise ValueError("Date of employment cannot be in the future.")
+
+def validate_country(value):
+    if isinstance(value, str) and value:
+        return value
+    raise ValueError("Country must be a non-empty string.")
+
+def seniority_discount(employment_ordinal, today_ordinal):
+    # 0.5 per full 365 days of employment
+    return (today_ordinal - employment_ordinal) // 365 * 0.5
+
+def shipping_cost(country):
+    if country in NORDIC_FREE:
+        return 0
+    elif country in NORDIC_HALF:
+        return 50
+    else:
+        return 100
+
 
 class Employee:
+    # Callables notified before a setter changes a field, see add_listener
+    _listeners = ()
+
     def __init__(self, cpr, first_name, last_name, department, base_salary, educational_level, date_of_birth, date_of_employment, country):
         self.set_cpr(cpr)
         self.set_first_name(first_name)
@@ -12,117 +105,103 @@ class Employee:
         self.set_date_of_employment(date_of_employment)
         self.set_country(country)
 
+    # Change listeners
+    def add_listener(self, listener):
+        """
+        Call listener(employee, field, old, new) before a setter changes a
+        field (after the new value is validated). A listener can veto the
+        change by raising ValueError; listeners that already ran are then
+        called again with old and new swapped, while the field holds new.
+        """
+        self._listeners = self._listeners + (listener,)
+    def remove_listener(self, listener):
+        self._listeners = tuple(item for item in self._listeners if item != listener)
+    def _assign(self, field, value):
+        attribute = f"_Employee__{field}"
+        if self._listeners:
+            old = getattr(self, attribute)
+            for index, listener in enumerate(self._listeners):
+                try:
+                    listener(self, field, old, value)
+                except ValueError:
+                    # The field holds the new value during the undo calls, so
+                    # each one sees the state the inverse change starts from
+                    setattr(self, attribute, value)
+                    try:
+                        for notified in reversed(self._listeners[:index]):
+                            notified(self, field, value, old)
+                    finally:
+                        setattr(self, attribute, old)
+                    raise
+        setattr(self, attribute, value)
+
     # CPR
     def get_cpr(self):
         return self.__cpr
     def set_cpr(self, value):
-        if isinstance(value, str) and value.isdigit() and len(value) == 10:
-            self.__cpr = value
-        else:
-            raise ValueError("CPR must be a string of 10 digits.")
+        self._assign("cpr", validate_cpr(value))
 
     # First name
     def get_first_name(self):
         return self.__first_name
     def set_first_name(self, value):
-        if isinstance(value, str) and 1 <= len(value) <= 30 and all(c.isalpha() or c in [' ', '-'] for c in value):
-            self.__first_name = value
-        else:
-            raise ValueError("First name must be 1-30 alphabetic characters, spaces or dashes.")
+        self._assign("first_name", validate_name(value, "First name"))
 
     # Last name
     def get_last_name(self):
         return self.__last_name
     def set_last_name(self, value):
-        if isinstance(value, str) and 1 <= len(value) <= 30 and all(c.isalpha() or c in [' ', '-'] for c in value):
-            self.__last_name = value
-        else:
-            raise ValueError("Last name must be 1-30 alphabetic characters, spaces or dashes.")
+        self._assign("last_name", validate_name(value, "Last name"))
 
     # Department
     def get_department(self):
         return self.__department
     def set_department(self, value):
-        allowed = ['HR', 'Finance', 'IT', 'Sales', 'General Services']
-        if value in allowed:
-            self.__department = value
-        else:
-            raise ValueError(f"Department must be one of {allowed}.")
+        self._assign("department", validate_department(value))
 
     # Base salary
     def get_base_salary(self):
         return self.__base_salary
     def set_base_salary(self, value):
-        if isinstance(value, (int, float)) and 20000 <= value <= 100000:
-            self.__base_salary = value
-        else:
-            raise ValueError("Base salary must be between 20000 and 100000.")
+        self._assign("base_salary", validate_base_salary(value))
 
     # Educational level
     def get_educational_level(self):
-        levels = {0: "none", 1: "primary", 2: "secondary", 3: "tertiary"}
-        return levels.get(self.__educational_level, "unknown")
+        return EDUCATION_LEVELS.get(self.__educational_level, "unknown")
+    def get_educational_level_number(self):
+        return self.__educational_level
     def set_educational_level(self, value):
-        if value in [0, 1, 2, 3]:
-            self.__educational_level = value
-        else:
-            raise ValueError("Educational level must be 0, 1, 2, or 3.")
+        self._assign("educational_level", validate_educational_level(value))
 
     # Date of birth
     def get_date_of_birth(self):
         return self.__date_of_birth
     def set_date_of_birth(self, value):
-        try:
-            dob = datetime.strptime(value, "%d/%m/%Y")
-        except Exception:
-            raise ValueError("Date of birth must be in dd/MM/yyyy format.")
-        today = datetime.now()
-        if (today - dob).days >= 18 * 365:
-            self.__date_of_birth = value
-        else:
-            raise ValueError("Employee must be at least 18 years old.")
+        parse_date_of_birth(value)
+        self._assign("date_of_birth", value)
 
     # Date of employment
     def get_date_of_employment(self):
         return self.__date_of_employment
     def set_date_of_employment(self, value):
-        try:
-            doe = datetime.strptime(value, "%d/%m/%Y")
-        except Exception:
-            raise ValueError("Date of employment must be in dd/MM/yyyy format.")
-        today = datetime.now()
-        if doe <= today:
-            self.__date_of_employment = value
-        else:
-            raise ValueError("Date of employment cannot be in the future.")
+        parse_date_of_employment(value)
+        self._assign("date_of_employment", value)
 
     # Country
     def get_country(self):
         return self.__country
     def set_country(self, value):
-        if isinstance(value, str) and value:
-            self.__country = value
-        else:
-            raise ValueError("Country must be a non-empty string.")
+        self._assign("country", validate_country(value))
 
     # Actual salary
     def getSalary(self):
-        return self.__base_salary + (self.__educational_level * 1220)
+        return self.__base_salary + (self.__educational_level * SALARY_PER_EDUCATION_LEVEL)
 
     # Discount
     def getDiscount(self):
-        doe = datetime.strptime(self.__date_of_employment, "%d/%m/%Y")
-        today = datetime.now()
-        years = (today - doe).days // 365
-        return years * 0.5
+        doe = parse_date(self.__date_of_employment)
+        return seniority_discount(doe.toordinal(), Clock.today().toordinal())
 
     # Shipping costs
     def getShippingCosts(self):
-        nordic_free = ["Denmark", "Norway", "Sweden"]
-        nordic_half = ["Iceland", "Finland"]
-        if self.__country in nordic_free:
-            return 0
-        elif self.__country in nordic_half:
-            return 50
-        else:
-            return 100
+        return shipping_cost(self.__country)
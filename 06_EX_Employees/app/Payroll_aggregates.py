@@ -0,0 +1,166 @@
+import math
+from collections import Counter
+from heapq import heappop, heappush
+
+from app.Employees import SALARY_PER_EDUCATION_LEVEL, Employee
+
+
+class SalaryGroup:
+    """
+    Running total, count, minimum and maximum of getSalary for one
+    department or country.
+
+    Salaries are kept in a Counter. Minimum and maximum come from two heaps
+    whose stale entries are dropped when they reach the top, so updates
+    are O(log n) and reads amortised O(1).
+    """
+
+    __slots__ = ("total", "count", "_salaries", "_low", "_high")
+
+    def __init__(self):
+        self.total = 0
+        self.count = 0
+        self._salaries = Counter()
+        self._low = []
+        self._high = []
+
+    def add(self, salary):
+        self.total += salary
+        self.count += 1
+        self._salaries[salary] += 1
+        if self._salaries[salary] == 1:
+            heappush(self._low, salary)
+            heappush(self._high, -salary)
+        if len(self._low) > 2 * len(self._salaries) + 16:
+            self._compact()
+
+    def remove(self, salary):
+        if self._salaries[salary] <= 0:
+            raise ValueError(f"Salary {salary} is not in the group.")
+        self.total -= salary
+        self.count -= 1
+        self._salaries[salary] -= 1
+        if not self._salaries[salary]:
+            del self._salaries[salary]
+
+    def _compact(self):
+        self._low = sorted(self._salaries)
+        self._high = sorted(-salary for salary in self._salaries)
+
+    @property
+    def average(self):
+        return self.total / self.count if self.count else None
+
+    @property
+    def minimum(self):
+        while self._low and self._low[0] not in self._salaries:
+            heappop(self._low)
+        return self._low[0] if self._low else None
+
+    @property
+    def maximum(self):
+        while self._high and -self._high[0] not in self._salaries:
+            heappop(self._high)
+        return -self._high[0] if self._high else None
+
+
+class PayrollAggregates:
+    """
+    Salary aggregates per department and per country, kept up to date as
+    employees are added, removed or changed through their setters.
+
+    Reads such as aggregates.group("department", "IT").average do not touch
+    the roster; check() compares everything against a full recomputation.
+    """
+
+    DIMENSIONS = {"department": Employee.get_department, "country": Employee.get_country}
+
+    def __init__(self, employees=()):
+        self._employees = {}
+        self._groups = {dimension: {} for dimension in self.DIMENSIONS}
+        for employee in employees:
+            self.add(employee)
+
+    def __len__(self):
+        return len(self._employees)
+
+    def add(self, employee):
+        if not isinstance(employee, Employee):
+            raise TypeError("PayrollAggregates tracks Employee objects.")
+        if id(employee) in self._employees:
+            raise ValueError("Employee is already tracked.")
+        self._employees[id(employee)] = employee
+        salary = employee.getSalary()
+        for dimension, getter in self.DIMENSIONS.items():
+            self._add(dimension, getter(employee), salary)
+        employee.add_listener(self._on_change)
+
+    def remove(self, employee):
+        if self._employees.pop(id(employee), None) is None:
+            raise ValueError("Employee is not tracked.")
+        employee.remove_listener(self._on_change)
+        salary = employee.getSalary()
+        for dimension, getter in self.DIMENSIONS.items():
+            self._remove(dimension, getter(employee), salary)
+
+    def _add(self, dimension, key, salary):
+        groups = self._groups[dimension]
+        if key not in groups:
+            groups[key] = SalaryGroup()
+        groups[key].add(salary)
+
+    def _remove(self, dimension, key, salary):
+        group = self._groups[dimension][key]
+        group.remove(salary)
+        if not group.count:
+            del self._groups[dimension][key]
+
+    def _on_change(self, employee, field, old, new):
+        # Called before the field changes, so the getters still give old values
+        if old == new:
+            return
+        salary = employee.getSalary()
+        if field in self.DIMENSIONS:
+            self._remove(field, old, salary)
+            self._add(field, new, salary)
+            return
+        if field == "base_salary":
+            new_salary = new + employee.get_educational_level_number() * SALARY_PER_EDUCATION_LEVEL
+        elif field == "educational_level":
+            new_salary = employee.get_base_salary() + new * SALARY_PER_EDUCATION_LEVEL
+        else:
+            return
+        for dimension, getter in self.DIMENSIONS.items():
+            self._remove(dimension, getter(employee), salary)
+            self._add(dimension, getter(employee), new_salary)
+
+    # Reads
+    def group(self, dimension, key):
+        """The SalaryGroup for e.g. ("department", "IT"), or None if empty."""
+        return self._groups[dimension].get(key)
+
+    def groups(self, dimension):
+        return dict(self._groups[dimension])
+
+    def check(self):
+        """
+        Recompute every group from the tracked employees and return a list
+        of mismatches (empty when the aggregates are consistent).
+        """
+        mismatches = []
+        for dimension, getter in self.DIMENSIONS.items():
+            expected = {}
+            for employee in self._employees.values():
+                expected.setdefault(getter(employee), []).append(employee.getSalary())
+            groups = self._groups[dimension]
+            for key in expected.keys() | groups.keys():
+                salaries = expected.get(key, [])
+                group = groups.get(key)
+                actual = (group.count, group.total, group.minimum, group.maximum) if group else (0, 0, None, None)
+                count, total, minimum, maximum = actual
+                if (count != len(salaries)
+                        or not math.isclose(total, math.fsum(salaries), rel_tol=1e-9)
+                        or minimum != min(salaries, default=None)
+                        or maximum != max(salaries, default=None)):
+                    mismatches.append(f"{dimension} {key!r}: count, total, min, max {actual}")
+        return mismatches
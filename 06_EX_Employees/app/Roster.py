@@ -0,0 +1,138 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from itertools import count
+
+from app.Employees import Employee, parse_date
+
+
+def _employment_ordinal(value):
+    if isinstance(value, date):
+        return value.toordinal()
+    return parse_date(value).toordinal()
+
+
+class Roster:
+    """
+    Employees indexed for lookups without scanning the whole roster.
+
+    - CPR: unique hash index (adding or changing to a CPR already in the
+      roster raises ValueError)
+    - department, country, educational level: inverted indexes from value
+      to the set of rows
+    - date of employment: sorted (ordinal, row) list for range queries
+
+    The roster registers itself as a listener on every employee it holds,
+    so the indexes follow changes made through the Employee setters.
+    Query results are in the order employees were added.
+    """
+
+    _INVERTED = {
+        "department": Employee.get_department,
+        "country": Employee.get_country,
+        "educational_level": Employee.get_educational_level_number,
+    }
+
+    def __init__(self, employees=()):
+        self._next_row = count()
+        self._employees = {}   # row -> employee
+        self._rows = {}        # id(employee) -> row
+        self._by_cpr = {}
+        self._inverted = {field: {} for field in self._INVERTED}
+        self._by_employment = []
+        for employee in employees:
+            self.add(employee)
+
+    def __len__(self):
+        return len(self._employees)
+
+    def __iter__(self):
+        return iter(list(self._employees.values()))
+
+    def __contains__(self, employee):
+        return id(employee) in self._rows
+
+    # Maintenance
+    def add(self, employee):
+        if not isinstance(employee, Employee):
+            raise TypeError("Roster holds Employee objects.")
+        if id(employee) in self._rows:
+            raise ValueError("Employee is already in the roster.")
+        cpr = employee.get_cpr()
+        if cpr in self._by_cpr:
+            raise ValueError(f"An employee with CPR {cpr} is already in the roster.")
+        row = next(self._next_row)
+        self._employees[row] = employee
+        self._rows[id(employee)] = row
+        self._by_cpr[cpr] = row
+        for field, getter in self._INVERTED.items():
+            self._inverted[field].setdefault(getter(employee), set()).add(row)
+        insort(self._by_employment, (_employment_ordinal(employee.get_date_of_employment()), row))
+        employee.add_listener(self._on_change)
+
+    def remove(self, employee):
+        row = self._rows.pop(id(employee), None)
+        if row is None:
+            raise ValueError("Employee is not in the roster.")
+        employee.remove_listener(self._on_change)
+        del self._employees[row]
+        del self._by_cpr[employee.get_cpr()]
+        for field, getter in self._INVERTED.items():
+            self._discard(field, getter(employee), row)
+        self._by_employment.remove((_employment_ordinal(employee.get_date_of_employment()), row))
+
+    def _discard(self, field, value, row):
+        rows = self._inverted[field][value]
+        rows.discard(row)
+        if not rows:
+            del self._inverted[field][value]
+
+    def _on_change(self, employee, field, old, new):
+        if old == new:
+            return
+        row = self._rows[id(employee)]
+        if field == "cpr":
+            if new in self._by_cpr:
+                raise ValueError(f"An employee with CPR {new} is already in the roster.")
+            del self._by_cpr[old]
+            self._by_cpr[new] = row
+        elif field in self._inverted:
+            self._discard(field, old, row)
+            self._inverted[field].setdefault(new, set()).add(row)
+        elif field == "date_of_employment":
+            self._by_employment.remove((_employment_ordinal(old), row))
+            insort(self._by_employment, (_employment_ordinal(new), row))
+
+    # Queries
+    def get(self, cpr, default=None):
+        row = self._by_cpr.get(cpr)
+        return default if row is None else self._employees[row]
+
+    def _employed_rows(self, employed_from, employed_to):
+        low = 0
+        high = len(self._by_employment)
+        if employed_from is not None:
+            low = bisect_left(self._by_employment, (_employment_ordinal(employed_from),))
+        if employed_to is not None:
+            high = bisect_right(self._by_employment, (_employment_ordinal(employed_to) + 1,))
+        return {row for _, row in self._by_employment[low:high]}
+
+    def query(self, department=None, country=None, educational_level=None, employed_from=None, employed_to=None):
+        """
+        Employees matching all given conditions. employed_from and
+        employed_to (dates or dd/mm/yyyy strings) are inclusive bounds on the
+        date of employment.
+        """
+        candidates = []
+        for field, value in (("department", department), ("country", country), ("educational_level", educational_level)):
+            if value is not None:
+                candidates.append(self._inverted[field].get(value, set()))
+        if employed_from is not None or employed_to is not None:
+            candidates.append(self._employed_rows(employed_from, employed_to))
+        if not candidates:
+            return list(self._employees.values())
+        candidates.sort(key=len)
+        rows = candidates[0].intersection(*candidates[1:])
+        return [self._employees[row] for row in sorted(rows)]
+
+    def count(self, **conditions):
+        return len(self.query(**conditions))
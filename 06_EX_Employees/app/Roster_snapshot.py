@@ -0,0 +1,130 @@
+# Fixed-width binary roster snapshots, opened with mmap and decoded on access
+import mmap
+import struct
+from array import array
+
+from app.Compact_employee import CompactEmployee, validated_fields
+from app.Employees import DEPARTMENTS, SALARY_PER_EDUCATION_LEVEL
+
+# magic, number of records, offset of the string pool
+_HEADER = struct.Struct("<8sQQ")
+_MAGIC = b"EMPSNAP1"
+# cpr, first name (pool offset, length), last name (offset, length),
+# department code, educational level, base salary, birth ordinal,
+# employment ordinal, country (offset, length)
+_RECORD = struct.Struct("<10sIHIHBBdIIIH")
+_LEVEL_FIELD, _SALARY_FIELD = 6, 7
+_RECORDS_PER_READ = 4096
+_DEPARTMENT_CODES = {department: code for code, department in enumerate(DEPARTMENTS)}
+
+
+def write_snapshot(path, employees):
+    """Write Employee/CompactEmployee objects to a snapshot file; returns the record count."""
+    return write_snapshot_rows(path, map(validated_fields, employees))
+
+
+def write_snapshot_rows(path, rows):
+    """
+    Write validated field tuples (CompactEmployee.from_validated order) to a
+    snapshot file. Names and countries are stored once each in a string pool.
+    :return: int, number of records written
+    """
+    records = bytearray()
+    pool = bytearray()
+    pooled = {}
+
+    def intern(text):
+        if text not in pooled:
+            encoded = text.encode("utf-8")
+            pooled[text] = (len(pool), len(encoded))
+            pool.extend(encoded)
+        return pooled[text]
+
+    count = 0
+    for cpr, first_name, last_name, department, base_salary, educational_level, birth, employment, country in rows:
+        records += _RECORD.pack(
+            cpr.encode("ascii"), *intern(first_name), *intern(last_name),
+            _DEPARTMENT_CODES[department], educational_level, base_salary,
+            birth, employment, *intern(country),
+        )
+        count += 1
+    with open(path, "wb") as snapshot:
+        snapshot.write(_HEADER.pack(_MAGIC, count, _HEADER.size + len(records)))
+        snapshot.write(records)
+        snapshot.write(pool)
+    return count
+
+
+class RosterSnapshot:
+    """
+    Read-only roster backed by a memory-mapped snapshot file.
+
+    Opening only maps the file, and every process that opens the same file
+    shares its pages through the page cache. snapshot[i] decodes one record
+    into a CompactEmployee; pooled strings are decoded once per process.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as snapshot:
+            self._data = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._data) < _HEADER.size:
+            self._data.close()
+            raise ValueError("Not a roster snapshot file.")
+        magic, self._count, self._pool_offset = _HEADER.unpack_from(self._data)
+        if magic != _MAGIC or self._pool_offset != _HEADER.size + self._count * _RECORD.size \
+                or len(self._data) < self._pool_offset:
+            self._data.close()
+            raise ValueError("Not a roster snapshot file.")
+        self._strings = {}
+
+    def __len__(self):
+        return self._count
+
+    def _string(self, offset, length):
+        text = self._strings.get(offset)
+        if text is None:
+            start = self._pool_offset + offset
+            text = self._strings[offset] = self._data[start:start + length].decode("utf-8")
+        return text
+
+    def _decode(self, record):
+        (cpr, first_offset, first_length, last_offset, last_length, department, educational_level,
+            base_salary, birth, employment, country_offset, country_length) = record
+        if base_salary.is_integer():
+            base_salary = int(base_salary)
+        return CompactEmployee.from_validated(
+            cpr.decode("ascii"), self._string(first_offset, first_length),
+            self._string(last_offset, last_length), DEPARTMENTS[department], base_salary,
+            educational_level, birth, employment, self._string(country_offset, country_length),
+        )
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Snapshot index out of range.")
+        return self._decode(_RECORD.unpack_from(self._data, _HEADER.size + index * _RECORD.size))
+
+    def _records(self):
+        # Unpacked a slice at a time, so only one slice is copied out of the map
+        step = _RECORDS_PER_READ * _RECORD.size
+        for start in range(_HEADER.size, self._pool_offset, step):
+            yield from _RECORD.iter_unpack(self._data[start:min(start + step, self._pool_offset)])
+
+    def __iter__(self):
+        return map(self._decode, self._records())
+
+    def salaries(self):
+        """getSalary for every record, read straight from the records."""
+        return array('d', [
+            record[_SALARY_FIELD] + record[_LEVEL_FIELD] * SALARY_PER_EDUCATION_LEVEL for record in self._records()
+        ])
+
+    def close(self):
+        self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,46 @@
+"""
+Date validation for a roster: strptime and date.today() on every call
+against the cached parse_date under a single as_of date.
+
+Run from the exercise folder:  python -m benchmarks.bench_Clock [employees]
+"""
+import random
+import sys
+import time
+from datetime import date, datetime
+
+from app import Clock
+from app.Employees import DATE_FORMAT, parse_date, parse_date_of_birth, parse_date_of_employment
+
+
+def _strptime_validation(births, employments):
+	for birth, employment in zip(births, employments):
+		dob = datetime.strptime(birth, DATE_FORMAT).date()
+		assert (date.today() - dob).days >= 18 * 365
+		assert datetime.strptime(employment, DATE_FORMAT).date() <= date.today()
+
+
+def _clock_validation(births, employments):
+	with Clock.as_of():
+		for birth, employment in zip(births, employments):
+			parse_date_of_birth(birth)
+			parse_date_of_employment(employment)
+
+
+def main(count=1_000_000):
+	births = [f"{random.randint(1, 28):02d}/{random.randint(1, 12):02d}/{random.randint(1960, 2000)}" for _ in range(count)]
+	employments = [f"{random.randint(1, 28):02d}/{random.randint(1, 12):02d}/{random.randint(2001, 2024)}" for _ in range(count)]
+	parse_date.cache_clear()
+	for name, func in [
+		("strptime", _strptime_validation),
+		("parse_date + as_of", _clock_validation),
+	]:
+		start = time.perf_counter()
+		func(births, employments)
+		print(f"{name:>18}: {time.perf_counter() - start:6.2f} s for {count:,} employees")
+	info = parse_date.cache_info()
+	print(f"parse_date cache: {info.hits:,} hits, {info.misses:,} misses")
+
+
+if __name__ == "__main__":
+	main(*(int(arg) for arg in sys.argv[1:2]))
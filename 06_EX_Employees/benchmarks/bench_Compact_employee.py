@@ -0,0 +1,45 @@
+"""
+Memory per instance and getDiscount throughput, Employee against
+CompactEmployee.
+
+Run from the exercise folder:  python -m benchmarks.bench_Compact_employee [employees]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from app.Compact_employee import CompactEmployee
+from app.Employees import DEPARTMENTS, Employee
+
+
+def _rows(count):
+	for i in range(count):
+		yield (
+			f"{i:010d}", random.choice(["Anna", "Bo", "Carl"]), random.choice(["Holm", "Lund"]),
+			random.choice(DEPARTMENTS), random.randint(20000, 100000), random.randint(0, 3),
+			f"{random.randint(1, 28):02d}/{random.randint(1, 12):02d}/{random.randint(1950, 2000)}",
+			f"{random.randint(1, 28):02d}/{random.randint(1, 12):02d}/{random.randint(2001, 2024)}",
+			random.choice(["Denmark", "Finland", "Germany"]),
+		)
+
+
+def main(count=200_000):
+	for cls in (Employee, CompactEmployee):
+		random.seed(0)
+		tracemalloc.start()
+		# Rows are built inside the traced window, so the field values an
+		# instance keeps alive are counted along with the instance
+		employees = [cls(*row) for row in _rows(count)]
+		per_instance = tracemalloc.get_traced_memory()[0] / count
+		tracemalloc.stop()
+		start = time.perf_counter()
+		for employee in employees:
+			employee.getDiscount()
+		rate = count / (time.perf_counter() - start)
+		print(f"{cls.__name__:>16}: {per_instance:>6.0f} bytes/employee, getDiscount {rate:>12,.0f}/s")
+		del employees
+
+
+if __name__ == "__main__":
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,41 @@
+"""
+A year of nightly discount runs: getDiscount for the whole roster every
+night against DiscountScheduler.advance_to, which only touches employees
+with an anniversary that day.
+
+Run from the exercise folder:  python -m benchmarks.bench_Discount_scheduler [employees] [nights]
+"""
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from app import Clock
+from app.Discount_scheduler import DiscountScheduler
+from app.Employees import Employee
+
+
+def main(count=100_000, nights=30):
+	employees = [
+		Employee(f"{i:010d}", "Anna", "Holm", "IT", 50000, 2, "01/01/1980", f"{random.randint(1, 28):02d}/{random.randint(1, 12):02d}/{random.randint(2001, 2023)}", "Denmark")
+		for i in range(count)
+	]
+	start_day = date(2024, 1, 1)
+	days = [start_day + timedelta(days=night) for night in range(nights)]
+
+	start = time.perf_counter()
+	for day in days:
+		with Clock.as_of(day):
+			[employee.getDiscount() for employee in employees]
+	print(f"  recompute: {nights / (time.perf_counter() - start):>10,.1f} nights/s")
+
+	scheduler = DiscountScheduler(employees, today=start_day)
+	changed = 0
+	start = time.perf_counter()
+	for day in days:
+		changed += len(scheduler.advance_to(day))
+	print(f"  scheduler: {nights / (time.perf_counter() - start):>10,.1f} nights/s ({changed:,} discounts changed)")
+
+
+if __name__ == "__main__":
+	main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,59 @@
+"""
+Importing a CSV roster: one Employee(**row) per row against import_employees,
+serial and on a process pool.
+
+Run from the exercise folder:  python -m benchmarks.bench_Employee_import [rows] [workers]
+"""
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+from app.Employee_import import FIELDS, import_employees
+from app.Employees import DEPARTMENTS, Employee
+
+
+def _write(path, count):
+	with open(path, "w", newline="", encoding="utf-8") as file:
+		writer = csv.writer(file)
+		writer.writerow(FIELDS)
+		for i in range(count):
+			writer.writerow([
+				f"{i:010d}", "Anna", "Holm" if i % 50 else "Holm2", random.choice(DEPARTMENTS),
+				random.randint(20000, 100000), random.randint(0, 3), "01/01/1980",
+				f"01/{random.randint(1, 12):02d}/{random.randint(2001, 2024)}", "Denmark",
+			])
+
+
+def _per_object(path):
+	employees = []
+	with open(path, newline="", encoding="utf-8") as file:
+		for row in csv.DictReader(file):
+			row["base_salary"] = int(row["base_salary"])
+			row["educational_level"] = int(row["educational_level"])
+			try:
+				employees.append(Employee(**row))
+			except ValueError:
+				pass
+	return len(employees)
+
+
+def main(count=200_000, workers=os.cpu_count() or 1):
+	with tempfile.TemporaryDirectory() as folder:
+		path = os.path.join(folder, "staff.csv")
+		errors = os.path.join(folder, "errors.csv")
+		_write(path, count)
+		for name, func in [
+			("Employee(**row)", lambda: _per_object(path)),
+			("import, serial", lambda: import_employees(path, errors)[1]),
+			(f"import, {workers} workers", lambda: import_employees(path, errors, workers=workers)[1]),
+		]:
+			start = time.perf_counter()
+			imported = func()
+			print(f"{name:>20}: {count / (time.perf_counter() - start):>10,.0f} rows/s ({imported:,} imported)")
+
+
+if __name__ == "__main__":
+	main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,37 @@
+"""
+Insert and load throughput of EmployeeStore: batched upserts and a
+streamed load back into CompactEmployee objects.
+
+Run from the exercise folder:  python -m benchmarks.bench_Employee_store [rows] [batch size]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from app.Employee_store import EmployeeStore
+from app.Employees import DEPARTMENTS
+
+
+def main(count=1_000_000, batch_size=50_000):
+	rows = [
+		(f"{i:010d}", "Anna", "Holm", random.choice(DEPARTMENTS), random.randint(20000, 100000), random.randint(0, 3),
+			random.randint(722_000, 730_000), random.randint(730_500, 739_000), random.choice(["Denmark", "Finland", "Germany"]))
+		for i in range(count)
+	]
+	with tempfile.TemporaryDirectory() as folder:
+		with EmployeeStore(os.path.join(folder, "staff.db"), batch_size=batch_size) as store:
+			for name, func in [
+				("insert", lambda: store.upsert_rows(rows)),
+				("upsert", lambda: store.upsert_rows(rows)),
+				("load", lambda: sum(1 for _ in store.load())),
+				("load IT", lambda: sum(1 for _ in store.load(department="IT"))),
+			]:
+				start = time.perf_counter()
+				done = func()
+				print(f"{name:>8}: {done / (time.perf_counter() - start):>10,.0f} rows/s ({done:,} rows)")
+
+
+if __name__ == "__main__":
+	main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,36 @@
+"""
+Payroll over a roster: per-object Employee methods against EmployeeTable
+column passes.
+
+Run from the exercise folder:  python -m benchmarks.bench_Employee_table [employees]
+"""
+import random
+import sys
+import time
+
+from app.Compact_employee import CompactEmployee
+from app.Employee_table import EmployeeTable
+from app.Employees import DEPARTMENTS
+
+
+def main(count=500_000):
+	employees = [
+		CompactEmployee(
+			f"{i:010d}", "Anna", "Holm", random.choice(DEPARTMENTS), random.randint(20000, 100000),
+			random.randint(0, 3), "01/01/1980", f"01/{random.randint(1, 12):02d}/{random.randint(2001, 2024)}",
+			random.choice(["Denmark", "Finland", "Germany"]),
+		)
+		for i in range(count)
+	]
+	table = EmployeeTable.from_employees(employees)
+	for name, func in [
+		("per object", lambda: [(e.getSalary(), e.getDiscount(), e.getShippingCosts()) for e in employees]),
+		("columns", lambda: (table.salaries(), table.discounts(), table.shipping_costs())),
+	]:
+		start = time.perf_counter()
+		func()
+		print(f"{name:>10}: {count / (time.perf_counter() - start):>12,.0f} employees/s")
+
+
+if __name__ == "__main__":
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,52 @@
+"""
+Dashboard refreshes (average salary per department) interleaved with
+salary changes: full recomputation over the roster against
+PayrollAggregates.
+
+Run from the exercise folder:  python -m benchmarks.bench_Payroll_aggregates [employees] [refreshes]
+"""
+import random
+import sys
+import time
+
+from app.Employees import DEPARTMENTS, Employee
+from app.Payroll_aggregates import PayrollAggregates
+
+
+def _recompute(employees):
+	totals = {}
+	for employee in employees:
+		total, count = totals.get(employee.get_department(), (0, 0))
+		totals[employee.get_department()] = (total + employee.getSalary(), count + 1)
+	return {department: total / count for department, (total, count) in totals.items()}
+
+
+def main(count=100_000, refreshes=100):
+	employees = [
+		Employee(f"{i:010d}", "Anna", "Holm", random.choice(DEPARTMENTS), random.randint(20000, 100000), random.randint(0, 3), "01/01/1980", "01/01/2010", "Denmark")
+		for i in range(count)
+	]
+	changes = [(random.choice(employees), random.randint(20000, 100000)) for _ in range(refreshes * 10)]
+
+	def recompute():
+		for refresh in range(refreshes):
+			for employee, salary in changes[refresh * 10:refresh * 10 + 10]:
+				employee.set_base_salary(salary)
+			_recompute(employees)
+
+	def incremental():
+		for refresh in range(refreshes):
+			for employee, salary in changes[refresh * 10:refresh * 10 + 10]:
+				employee.set_base_salary(salary)
+			{department: aggregates.group("department", department).average for department in DEPARTMENTS}
+
+	start = time.perf_counter()
+	recompute()
+	print(f"{'recompute':>12}: {refreshes / (time.perf_counter() - start):>12,.0f} refreshes/s")
+	aggregates = PayrollAggregates(employees)
+	start = time.perf_counter()
+	incremental()
+	print(f"{'incremental':>12}: {refreshes / (time.perf_counter() - start):>12,.0f} refreshes/s")
+
+if __name__ == "__main__":
+	main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,42 @@
+"""
+Lookups and filters over a roster: a linear scan over a list of Employee
+objects against the Roster indexes.
+
+Run from the exercise folder:  python -m benchmarks.bench_Roster [employees] [queries]
+"""
+import random
+import sys
+import time
+
+from app.Employees import DEPARTMENTS, Employee
+from app.Roster import Roster
+
+
+def main(count=100_000, queries=200):
+	employees = [
+		Employee(
+			f"{i:010d}", "Anna", "Holm", random.choice(DEPARTMENTS), 50000, random.randint(0, 3), "01/01/1980",
+			f"01/{random.randint(1, 12):02d}/{random.randint(2001, 2024)}", random.choice(["Denmark", "Finland", "Germany"]),
+		)
+		for i in range(count)
+	]
+	start = time.perf_counter()
+	roster = Roster(employees)
+	print(f"build index: {time.perf_counter() - start:.2f} s for {count:,} employees")
+	cprs = [f"{random.randrange(count):010d}" for _ in range(queries)]
+	for name, func in [
+		("scan, by CPR", lambda: [next(e for e in employees if e.get_cpr() == cpr) for cpr in cprs]),
+		("index, by CPR", lambda: [roster.get(cpr) for cpr in cprs]),
+		("scan, filter", lambda: [
+			[e for e in employees if e.get_department() == "IT" and e.get_country() == "Finland" and e.get_educational_level_number() == 3]
+			for _ in range(queries)
+		]),
+		("index, filter", lambda: [roster.query(department="IT", country="Finland", educational_level=3) for _ in range(queries)]),
+	]:
+		start = time.perf_counter()
+		func()
+		print(f"{name:>14}: {queries / (time.perf_counter() - start):>12,.0f} queries/s")
+
+
+if __name__ == "__main__":
+	main(*(int(arg) for arg in sys.argv[1:3]))
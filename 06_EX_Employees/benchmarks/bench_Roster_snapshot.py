@@ -0,0 +1,96 @@
+"""
+Worker start-up: loading a roster from CSV, from JSON and from a
+memory-mapped snapshot. Each loader runs in a fresh process and reports
+its load time and the resident memory it added.
+
+Run from the exercise folder:  python -m benchmarks.bench_Roster_snapshot [employees]
+"""
+import csv
+import json
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+from app.Compact_employee import CompactEmployee
+from app.Employees import DEPARTMENTS
+from app.Roster_snapshot import RosterSnapshot, write_snapshot_rows
+
+
+def _rss_kb():
+	try:
+		with open("/proc/self/status") as status:
+			for line in status:
+				if line.startswith("VmRSS:"):
+					return int(line.split()[1])
+	except OSError:
+		pass
+	return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _load_csv(path):
+	with open(path, newline="", encoding="utf-8") as file:
+		return [
+			CompactEmployee.from_validated(cpr, first, last, department, float(salary), int(level), int(birth), int(employment), country)
+			for cpr, first, last, department, salary, level, birth, employment, country in csv.reader(file)
+		]
+
+
+def _load_json(path):
+	with open(path, encoding="utf-8") as file:
+		return [CompactEmployee.from_validated(*row) for row in json.load(file)]
+
+
+def _open_snapshot(path):
+	return RosterSnapshot(path)
+
+
+def _snapshot_payroll(path):
+	snapshot = RosterSnapshot(path)
+	return snapshot, snapshot.salaries()
+
+
+_LOADERS = {
+	"CSV": _load_csv,
+	"JSON": _load_json,
+	"snapshot, open": _open_snapshot,
+	"snapshot, payroll": _snapshot_payroll,
+}
+
+
+def _measure(name, path):
+	before = _rss_kb()
+	start = time.perf_counter()
+	roster = _LOADERS[name](path)  # kept alive until RSS is read
+	elapsed = time.perf_counter() - start
+	return elapsed, _rss_kb() - before
+
+
+def main(count=1_000_000):
+	rows = [
+		(f"{i:010d}", random.choice(["Anna", "Mads", "Sofie"]), random.choice(["Holm", "Berg"]), random.choice(DEPARTMENTS),
+			random.randint(20000, 100000), random.randint(0, 3), random.randint(722_000, 730_000),
+			random.randint(730_500, 739_000), random.choice(["Denmark", "Finland", "Germany"]))
+		for i in range(count)
+	]
+	context = multiprocessing.get_context("spawn")
+	with tempfile.TemporaryDirectory() as folder:
+		paths = {name: os.path.join(folder, f"roster.{name}") for name in ("csv", "json", "snap")}
+		with open(paths["csv"], "w", newline="", encoding="utf-8") as file:
+			csv.writer(file).writerows(rows)
+		with open(paths["json"], "w", encoding="utf-8") as file:
+			json.dump(rows, file)
+		write_snapshot_rows(paths["snap"], rows)
+		del rows
+		for name in _LOADERS:
+			path = paths["csv" if name == "CSV" else "json" if name == "JSON" else "snap"]
+			with context.Pool(1) as pool:
+				elapsed, rss = pool.apply(_measure, (name, path))
+			print(f"{name:>18}: {elapsed:7.3f} s, +{rss / 1024:7.1f} MiB resident ({os.path.getsize(path) / 2**20:.0f} MiB file)")
+
+
+if __name__ == "__main__":
+	main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,53 @@
+from datetime import date, datetime
+
+import pytest
+from app import Clock
+from app.Compact_employee import CompactEmployee
+from app.Employee_table import EmployeeTable
+from app.Employees import Employee, parse_date
+
+
+def make_employee(date_of_birth="11/09/1990", date_of_employment="11/09/2020"):
+	return Employee("1234567890", "John", "Doe", "IT", 50000, 2, date_of_birth, date_of_employment, "Denmark")
+
+
+@pytest.mark.parametrize("value, expected", [
+	("11/09/2020", date(2020, 9, 11)),
+	("29/02/2024", date(2024, 2, 29)),
+	("1/2/2020", date(2020, 2, 1)),  # not zero-padded: strptime fallback
+])
+def test_parse_date(value, expected):
+	assert parse_date(value) == expected
+
+@pytest.mark.parametrize("value", ["31/02/2020", "11-09-2020", "aa/bb/cccc", "11/09/20", "١١/٠٩/٢٠٢٠", ""])
+def test_parse_date_rejects(value):
+	with pytest.raises(ValueError):
+		parse_date(value)
+
+def test_fixed_clock_needs_date():
+	with pytest.raises(TypeError):
+		Clock.FixedClock("11/09/2020")
+
+def test_fixed_clock_takes_the_date_of_a_datetime():
+	assert Clock.FixedClock(datetime(2026, 1, 1, 23, 59)).today() == date(2026, 1, 1)
+	with Clock.as_of(datetime(2030, 1, 1, 12)):
+		assert type(Clock.today()) is date
+		assert make_employee(date_of_employment="01/01/2029").getDiscount() == 0.5
+
+def test_as_of_drives_validation_and_discount():
+	with Clock.as_of(date(2030, 1, 1)):
+		emp = make_employee(date_of_employment="01/01/2029")
+		assert emp.getDiscount() == 0.5
+		assert CompactEmployee.from_employee(emp).getDiscount() == 0.5
+		assert list(EmployeeTable.from_employees([emp]).discounts()) == [0.5]
+	assert isinstance(Clock.get_clock(), Clock.SystemClock)
+	with Clock.as_of(date(2000, 1, 1)):
+		with pytest.raises(ValueError):
+			make_employee(date_of_employment="01/01/2001")
+		with pytest.raises(ValueError):
+			make_employee(date_of_birth="01/01/1990")
+
+def test_as_of_defaults_to_one_reading_of_today():
+	with Clock.as_of() as clock:
+		assert clock.today() == date.today()
+		assert Clock.today() is clock.today()
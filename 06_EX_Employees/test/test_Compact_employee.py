@@ -0,0 +1,74 @@
+import pytest
+from app.Compact_employee import CompactEmployee
+from app.Employees import Employee
+from datetime import datetime, timedelta
+
+ARGS = dict(
+	cpr="1234567890",
+	first_name="John",
+	last_name="Doe",
+	department="IT",
+	base_salary=50000,
+	educational_level=2,
+	date_of_birth="11/09/1990",
+	date_of_employment="11/09/2020",
+	country="Iceland"
+)
+
+GETTERS = [
+	"get_cpr", "get_first_name", "get_last_name", "get_department", "get_base_salary",
+	"get_educational_level", "get_date_of_birth", "get_date_of_employment", "get_country",
+	"getSalary", "getDiscount", "getShippingCosts",
+]
+
+@pytest.mark.parametrize("getter", GETTERS)
+def test_same_results_as_employee(getter):
+	assert getattr(CompactEmployee(**ARGS), getter)() == getattr(Employee(**ARGS), getter)()
+
+def test_from_employee():
+	compact = CompactEmployee.from_employee(Employee(**ARGS))
+	assert [getattr(compact, getter)() for getter in GETTERS] == [getattr(Employee(**ARGS), getter)() for getter in GETTERS]
+
+def test_has_no_instance_dict():
+	emp = CompactEmployee(**ARGS)
+	assert not hasattr(emp, "__dict__")
+	with pytest.raises(AttributeError):
+		emp.nickname = "Johnny"
+
+@pytest.mark.parametrize("years", [0, 1, 5, 10])
+def test_get_discount(years):
+	date = (datetime.now() - timedelta(days=years*365)).strftime("%d/%m/%Y")
+	emp = CompactEmployee(**ARGS)
+	emp.set_date_of_employment(date)
+	assert emp.getDiscount() == years * 0.5
+
+@pytest.mark.parametrize("field, value", [
+	("cpr", "123"),
+	("first_name", "John123"),
+	("department", "Marketing"),
+	("base_salary", 19999),
+	("educational_level", 4),
+	("date_of_birth", "31/02/1990"),
+	("date_of_employment", "11/09/2999"),
+	("country", ""),
+])
+def test_same_validation_as_employee(field, value):
+	with pytest.raises(ValueError) as compact_error:
+		CompactEmployee(**{**ARGS, field: value})
+	with pytest.raises(ValueError) as employee_error:
+		Employee(**{**ARGS, field: value})
+	assert str(compact_error.value) == str(employee_error.value)
+
+@pytest.mark.parametrize("date_of_birth, date_of_employment", [
+	("1/1/1990", "5/3/2020"),
+	("01/1/1990", "05/03/2020"),
+])
+def test_dates_are_returned_as_given(date_of_birth, date_of_employment):
+	args = {**ARGS, "date_of_birth": date_of_birth, "date_of_employment": date_of_employment}
+	employee = Employee(**args)
+	for compact in (CompactEmployee(**args), CompactEmployee.from_employee(employee)):
+		assert compact.get_date_of_birth() == employee.get_date_of_birth() == date_of_birth
+		assert compact.get_date_of_employment() == employee.get_date_of_employment() == date_of_employment
+		assert compact.getDiscount() == employee.getDiscount()
+	compact.set_date_of_birth("11/09/1990")
+	assert compact.get_date_of_birth() == "11/09/1990"
@@ -0,0 +1,70 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+from app import Clock
+from app.Discount_scheduler import DiscountScheduler
+from app.Employees import Employee
+
+
+def make_employee(cpr, date_of_employment):
+	return Employee(cpr, "John", "Doe", "IT", 50000, 2, "11/09/1990", date_of_employment, "Denmark")
+
+
+def test_discount_changes_on_anniversary():
+	employee = make_employee("0000000001", "01/01/2020")
+	scheduler = DiscountScheduler([employee], today=date(2020, 12, 30))
+	assert scheduler.discount(employee) == 0
+	assert scheduler.advance_to(date(2020, 12, 31)) == [employee]  # 365 days later
+	assert scheduler.discount(employee) == 0.5
+	assert scheduler.advance_to(date(2021, 12, 30)) == []
+	assert scheduler.advance_to(date(2026, 1, 1)) == [employee]
+	assert scheduler.discount(employee) == 3.0
+
+def test_matches_getDiscount_every_day():
+	rng = random.Random(3)
+	start = date(2024, 1, 1)
+	employees = [make_employee(f"{i:010d}", (start - timedelta(days=rng.randint(0, 4000))).strftime("%d/%m/%Y")) for i in range(50)]
+	scheduler = DiscountScheduler(employees, today=start)
+	for offset in range(0, 800, 7):
+		day = start + timedelta(days=offset)
+		scheduler.advance_to(day)
+		with Clock.as_of(day):
+			assert [scheduler.discount(e) for e in employees] == [e.getDiscount() for e in employees]
+
+def test_employment_date_change_reschedules():
+	employee = make_employee("0000000001", "01/01/2020")
+	scheduler = DiscountScheduler([employee], today=date(2024, 6, 1))
+	employee.set_date_of_employment("01/01/2010")
+	assert scheduler.discount(employee) == 7.0
+	assert scheduler.advance_to(date(2024, 12, 27)) == []
+	assert scheduler.advance_to(date(2024, 12, 28)) == [employee]  # 15 * 365 days after 01/01/2010
+	assert scheduler.discount(employee) == 7.5
+	assert scheduler.advance_to(date(2024, 12, 31)) == []  # the entry for the old date is stale
+
+def test_vetoed_change_keeps_discount():
+	employee = make_employee("0000000001", "01/01/2020")
+	scheduler = DiscountScheduler([employee], today=date(2024, 6, 1))
+
+	def veto(employee, field, old, new):
+		raise ValueError("Vetoed.")
+
+	employee.add_listener(veto)
+	with pytest.raises(ValueError):
+		employee.set_date_of_employment("01/01/2010")
+	assert scheduler.discount(employee) == 2.0
+
+def test_remove_and_readd():
+	employee = make_employee("0000000001", "01/01/2020")
+	scheduler = DiscountScheduler([employee], today=date(2024, 6, 1))
+	scheduler.remove(employee)
+	scheduler.add(employee)
+	assert len(scheduler) == 1
+	assert scheduler.advance_to(date(2025, 1, 1)) == [employee]
+	with pytest.raises(ValueError):
+		scheduler.add(employee)
+
+def test_cannot_go_back():
+	scheduler = DiscountScheduler(today=date(2024, 6, 1))
+	with pytest.raises(ValueError):
+		scheduler.advance_to(date(2024, 5, 31))
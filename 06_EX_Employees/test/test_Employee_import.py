@@ -0,0 +1,104 @@
+import csv
+import json
+import multiprocessing
+from datetime import date
+
+import pytest
+from app import Clock
+from app.Employee_import import FIELDS, import_employees, validate_record
+from app.Employees import Employee
+
+VALID = {
+	"cpr": "1234567890", "first_name": "John", "last_name": "Doe", "department": "IT",
+	"base_salary": 50000, "educational_level": 2, "date_of_birth": "11/09/1990",
+	"date_of_employment": "11/09/2020", "country": "Denmark",
+}
+
+def _write_csv(path, records):
+	with open(path, "w", newline="", encoding="utf-8") as file:
+		writer = csv.DictWriter(file, fieldnames=FIELDS)
+		writer.writeheader()
+		writer.writerows(records)
+
+def _read_errors(path):
+	with open(path, newline="", encoding="utf-8") as file:
+		return [(int(row["row"]), row["field"], row["message"]) for row in csv.DictReader(file)]
+
+
+def test_validate_record_collects_every_error():
+	fields, errors = validate_record({**VALID, "cpr": "12", "country": "", "department": "Marketing"})
+	assert [field for field, _ in errors] == ["cpr", "department", "country"]
+	assert errors[0][1] == "CPR must be a string of 10 digits."
+
+def test_validate_record_missing_field():
+	record = dict(VALID)
+	del record["country"]
+	assert validate_record(record)[1] == [("country", "Missing field.")]
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 2), (2, 2), (1, 5000)])
+def test_csv_import(tmp_path, workers, chunk_size):
+	records = [{**VALID, "cpr": f"{i:010d}"} for i in range(5)]
+	records[1]["first_name"] = "John123"
+	records[3]["base_salary"] = "lots"
+	records[3]["date_of_birth"] = "31/02/1990"
+	_write_csv(tmp_path / "staff.csv", records)
+	roster, imported, rejected = import_employees(tmp_path / "staff.csv", tmp_path / "errors.csv", workers=workers, chunk_size=chunk_size)
+	assert (imported, rejected) == (3, 2)
+	assert roster.cpr == ["0000000000", "0000000002", "0000000004"]
+	assert list(roster.salaries()) == [Employee(**VALID).getSalary()] * 3
+	assert _read_errors(tmp_path / "errors.csv") == [
+		(2, "first_name", "First name must be 1-30 alphabetic characters, spaces or dashes."),
+		(4, "base_salary", "Base salary must be between 20000 and 100000."),
+		(4, "date_of_birth", "Date of birth must be in dd/MM/yyyy format."),
+	]
+
+def test_jsonl_import_keeps_json_types(tmp_path):
+	lines = [json.dumps(VALID), json.dumps({**VALID, "base_salary": "50000"}), "[1, 2]", "{broken", ""]
+	(tmp_path / "staff.jsonl").write_text("\n".join(lines), encoding="utf-8")
+	roster, imported, rejected = import_employees(tmp_path / "staff.jsonl", tmp_path / "errors.csv")
+	assert (imported, rejected) == (1, 3)
+	assert [(row, field) for row, field, _ in _read_errors(tmp_path / "errors.csv")] == [(2, "base_salary"), (3, "row"), (4, "row")]
+
+def test_csv_wrong_column_count(tmp_path):
+	path = tmp_path / "staff.csv"
+	path.write_text(",".join(FIELDS) + "\n1234567890,John\n", encoding="utf-8")
+	_, imported, rejected = import_employees(path, tmp_path / "errors.csv")
+	assert (imported, rejected) == (0, 1)
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_undecodable_rows_are_rejected(tmp_path, workers):
+	path = tmp_path / "staff.csv"
+	_write_csv(path, [{**VALID, "cpr": f"{i:010d}"} for i in range(3)])
+	path.write_bytes(path.read_bytes().replace(b"0000000001,John", b"0000000001,J\xf8hn"))
+	_, imported, rejected = import_employees(path, tmp_path / "errors.csv", workers=workers, chunk_size=2)
+	assert (imported, rejected) == (2, 1)
+	assert _read_errors(tmp_path / "errors.csv") == [(2, "row", "Row is not valid UTF-8.")]
+
+def test_undecodable_jsonl_line_is_rejected(tmp_path):
+	path = tmp_path / "staff.jsonl"
+	path.write_bytes(json.dumps(VALID).encode() + b"\n" + json.dumps(VALID).encode().replace(b"John", b"J\xf8hn") + b"\n")
+	_, imported, rejected = import_employees(path, tmp_path / "errors.csv")
+	assert (imported, rejected) == (1, 1)
+	assert _read_errors(tmp_path / "errors.csv") == [(2, "row", "Row is not valid UTF-8.")]
+
+def test_csv_missing_header_column(tmp_path):
+	path = tmp_path / "staff.csv"
+	path.write_text("cpr,first_name\n", encoding="utf-8")
+	with pytest.raises(ValueError):
+		import_employees(path, tmp_path / "errors.csv")
+
+@pytest.fixture
+def spawn_workers():
+	# Spawned workers start without the parent's clock, as on macOS and Windows
+	method = multiprocessing.get_start_method()
+	multiprocessing.set_start_method("spawn", force=True)
+	yield
+	multiprocessing.set_start_method(method, force=True)
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_workers_use_the_as_of_date(tmp_path, spawn_workers, workers):
+	records = [{**VALID, "cpr": f"{i:010d}", "date_of_employment": "01/06/2029"} for i in range(4)]
+	_write_csv(tmp_path / "staff.csv", records)
+	with Clock.as_of(date(2030, 1, 1)):
+		_, imported, rejected = import_employees(tmp_path / "staff.csv", tmp_path / "errors.csv", workers=workers, chunk_size=1)
+	assert (imported, rejected) == (4, 0)
@@ -0,0 +1,55 @@
+import sqlite3
+import types
+
+import pytest
+from app.Compact_employee import CompactEmployee
+from app.Employee_store import EmployeeStore
+from app.Employees import Employee
+
+
+def make_employee(cpr, department="IT", country="Denmark", base_salary=50000):
+	return Employee(cpr, "John", "Doe", department, base_salary, 2, "11/09/1990", "11/09/2020", country)
+
+@pytest.fixture
+def store(tmp_path):
+	with EmployeeStore(tmp_path / "staff.db", batch_size=2) as store:
+		yield store
+
+
+def test_round_trip(store):
+	employee = make_employee("0000000001")
+	assert store.upsert([employee]) == 1
+	loaded = store.get("0000000001")
+	assert isinstance(loaded, CompactEmployee)
+	assert loaded.get_date_of_employment() == employee.get_date_of_employment()
+	assert loaded.getSalary() == employee.getSalary()
+	assert loaded.get_educational_level() == employee.get_educational_level()
+	assert store.get("0000000009") is None
+
+def test_upsert_replaces_by_cpr(store):
+	store.upsert([make_employee(f"{i:010d}") for i in range(5)])
+	store.upsert([make_employee("0000000003", department="HR", base_salary=70000), make_employee("0000000005")])
+	assert len(store) == 6
+	assert store.get("0000000003").get_base_salary() == 70000
+	assert [e.get_cpr() for e in store.load(department="HR")] == ["0000000003"]
+
+def test_load_is_lazy_and_filtered(store):
+	store.upsert([make_employee(f"{i:010d}", country="Sweden" if i % 2 else "Denmark") for i in range(5)])
+	loaded = store.load(country="Sweden", department="IT")
+	assert isinstance(loaded, types.GeneratorType)
+	assert [e.get_cpr() for e in loaded] == ["0000000001", "0000000003"]
+	assert len(list(store.load())) == 5
+
+def test_compact_employees_and_delete(store):
+	store.upsert([CompactEmployee.from_employee(make_employee("0000000001"))])
+	assert store.delete("0000000001")
+	assert not store.delete("0000000001")
+	assert len(store) == 0
+
+def test_wal_mode_and_indexes(tmp_path):
+	EmployeeStore(tmp_path / "staff.db").close()
+	connection = sqlite3.connect(tmp_path / "staff.db")
+	assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+	indexes = {row[1] for row in connection.execute("PRAGMA index_list(employees)")}
+	assert {"employees_department", "employees_country"} <= indexes
+	connection.close()
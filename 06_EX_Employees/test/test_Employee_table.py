@@ -0,0 +1,99 @@
+import random
+
+import pytest
+from app import Employee_table
+from app.Compact_employee import CompactEmployee
+from app.Employee_table import EmployeeTable
+from app.Employees import DEPARTMENTS, Employee
+from datetime import date
+
+
+@pytest.fixture(autouse=True, params=["numpy", "array"])
+def column_path(request, monkeypatch):
+	# Every test runs on the NumPy path and on the plain array fallback
+	if request.param == "numpy":
+		pytest.importorskip("numpy")
+	else:
+		monkeypatch.setattr(Employee_table, "numpy", None)
+	return request.param
+
+
+def roster(count=200):
+	random.seed(5)
+	employees = []
+	for i in range(count):
+		employees.append(Employee(
+			cpr=f"{i:010d}",
+			first_name=random.choice(["Anna", "Bo", "Carl-Erik"]),
+			last_name=random.choice(["Holm", "Lund"]),
+			department=random.choice(DEPARTMENTS),
+			base_salary=random.choice([20000, 35500.5, 100000, random.randint(20000, 100000)]),
+			educational_level=random.randint(0, 3),
+			date_of_birth=f"{random.randint(1, 28):02d}/{random.randint(1, 12):02d}/{random.randint(1950, 2000)}",
+			date_of_employment=f"{random.randint(1, 28):02d}/{random.randint(1, 12):02d}/{random.randint(2001, 2024)}",
+			country=random.choice(["Denmark", "Norway", "Sweden", "Iceland", "Finland", "Germany", "USA"]),
+		))
+	return employees
+
+
+def test_vectorized_results_match_per_object_methods():
+	employees = roster()
+	table = EmployeeTable.from_employees(employees)
+	assert len(table) == len(employees)
+	assert list(table.salaries()) == [employee.getSalary() for employee in employees]
+	assert list(table.discounts()) == [employee.getDiscount() for employee in employees]
+	assert list(table.shipping_costs()) == [employee.getShippingCosts() for employee in employees]
+
+def test_discounts_as_of_a_given_day():
+	table = EmployeeTable.from_employees(roster(1))
+	employed = table.employment_ordinal[0]
+	assert list(table.discounts(date.fromordinal(employed + 364))) == [0.0]
+	assert list(table.discounts(date.fromordinal(employed + 365 * 3))) == [1.5]
+
+def test_rows_round_trip():
+	employees = roster(20)
+	table = EmployeeTable.from_employees(CompactEmployee.from_employee(employee) for employee in employees)
+	for employee, row in zip(employees, table):
+		assert row.get_cpr() == employee.get_cpr()
+		assert row.get_department() == employee.get_department()
+		assert row.get_country() == employee.get_country()
+		assert row.get_date_of_employment() == employee.get_date_of_employment()
+		assert row.getSalary() == employee.getSalary()
+
+def test_where_and_filter():
+	employees = roster()
+	table = EmployeeTable.from_employees(employees)
+	mask = table.where(department="IT", country="Denmark")
+	it_in_denmark = table.filter(mask)
+	expected = [e.get_cpr() for e in employees if e.get_department() == "IT" and e.get_country() == "Denmark"]
+	assert it_in_denmark.cpr == expected
+	assert list(it_in_denmark.shipping_costs()) == [0] * len(expected)
+
+def test_where_unknown_value_matches_nothing():
+	table = EmployeeTable.from_employees(roster(10))
+	assert not any(table.where(country="Atlantis"))
+	assert not any(table.where(department="Marketing"))
+
+def test_where_educational_level():
+	employees = roster()
+	table = EmployeeTable.from_employees(employees)
+	assert sum(table.where(educational_level=3)) == sum(e.get_educational_level() == "tertiary" for e in employees)
+
+def test_slicing_and_take():
+	employees = roster(10)
+	table = EmployeeTable.from_employees(employees)
+	assert table[2:5].cpr == [e.get_cpr() for e in employees[2:5]]
+	assert list(table[::-1].salaries()) == [e.getSalary() for e in reversed(employees)]
+	assert table.take([7, 1]).cpr == [employees[7].get_cpr(), employees[1].get_cpr()]
+	assert table[3].get_cpr() == employees[3].get_cpr()
+
+def test_empty_table():
+	table = EmployeeTable()
+	assert len(table) == 0
+	assert list(table.salaries()) == []
+
+def test_append_after_column_passes():
+	table = EmployeeTable.from_employees(roster(3))
+	table.salaries(), table.discounts(), table.shipping_costs(), table.where(country="Denmark"), table[1:]
+	table.append(roster(1)[0])
+	assert len(table.salaries()) == 4
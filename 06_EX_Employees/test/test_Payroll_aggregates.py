@@ -0,0 +1,107 @@
+import random
+
+import pytest
+from app.Employees import DEPARTMENTS, Employee
+from app.Payroll_aggregates import PayrollAggregates, SalaryGroup
+from app.Roster import Roster
+
+
+def make_employee(cpr, department="IT", base_salary=50000, educational_level=0, country="Denmark"):
+	return Employee(cpr, "John", "Doe", department, base_salary, educational_level, "11/09/1990", "11/09/2020", country)
+
+@pytest.fixture
+def employees():
+	return [
+		make_employee("0000000001", "IT", 40000, 0, "Denmark"),
+		make_employee("0000000002", "IT", 60000, 1, "Sweden"),
+		make_employee("0000000003", "HR", 30000, 2, "Denmark"),
+	]
+
+
+def test_initial_aggregates(employees):
+	aggregates = PayrollAggregates(employees)
+	it = aggregates.group("department", "IT")
+	assert (it.count, it.total, it.minimum, it.maximum) == (2, 101220, 40000, 61220)
+	assert it.average == 50610
+	assert aggregates.group("country", "Denmark").total == 40000 + 32440
+	assert aggregates.group("department", "Sales") is None
+	assert aggregates.check() == []
+
+def test_setters_update_aggregates(employees):
+	aggregates = PayrollAggregates(employees)
+	employees[1].set_base_salary(20000)
+	employees[1].set_educational_level(3)
+	assert aggregates.group("department", "IT").maximum == 40000
+	assert aggregates.group("department", "IT").minimum == 23660
+	employees[0].set_department("HR")
+	employees[2].set_country("Norway")
+	assert aggregates.group("department", "IT").count == 1
+	assert aggregates.group("department", "HR").total == 40000 + 32440
+	assert aggregates.group("country", "Norway").total == 32440
+	assert set(aggregates.groups("country")) == {"Denmark", "Sweden", "Norway"}
+	assert aggregates.check() == []
+
+def test_remove_and_empty_groups(employees):
+	aggregates = PayrollAggregates(employees)
+	aggregates.remove(employees[2])
+	employees[2].set_base_salary(90000)
+	assert aggregates.group("department", "HR") is None
+	assert len(aggregates) == 2
+	with pytest.raises(ValueError):
+		aggregates.remove(employees[2])
+	assert aggregates.check() == []
+
+def test_vetoed_change_is_rolled_back(employees):
+	aggregates = PayrollAggregates(employees)
+	Roster(employees)
+	with pytest.raises(ValueError):
+		employees[0].set_cpr("0000000002")
+	employees[0].set_department("Sales")
+	assert aggregates.check() == []
+
+@pytest.mark.parametrize("field, value", [("base_salary", 50000), ("educational_level", 3)])
+def test_vetoed_salary_change_is_rolled_back(employees, field, value):
+	aggregates = PayrollAggregates(employees)
+	def veto(employee, changed, old, new):
+		if changed == field:
+			raise ValueError("Vetoed")
+	employees[2].add_listener(veto)
+	with pytest.raises(ValueError, match="Vetoed"):
+		getattr(employees[2], f"set_{field}")(value)
+	assert employees[2].get_base_salary() == 30000
+	assert aggregates.check() == []
+	assert aggregates.group("department", "HR").total == employees[2].getSalary()
+
+def test_check_reports_drift(employees):
+	aggregates = PayrollAggregates(employees)
+	aggregates.group("department", "HR").total += 1
+	assert len(aggregates.check()) == 1
+
+def test_random_changes_match_recomputation():
+	rng = random.Random(7)
+	employees = [make_employee(f"{i:010d}", rng.choice(DEPARTMENTS), rng.randint(20000, 100000)) for i in range(200)]
+	aggregates = PayrollAggregates(employees)
+	for _ in range(2000):
+		employee = rng.choice(employees)
+		change = rng.randrange(4)
+		if change == 0:
+			employee.set_base_salary(rng.choice([rng.randint(20000, 100000), 20000.5]))
+		elif change == 1:
+			employee.set_educational_level(rng.randint(0, 3))
+		elif change == 2:
+			employee.set_department(rng.choice(DEPARTMENTS))
+		else:
+			employee.set_country(rng.choice(["Denmark", "Iceland", "Germany"]))
+	assert aggregates.check() == []
+
+def test_salary_group_min_max_after_removals():
+	group = SalaryGroup()
+	for salary in [5, 1, 9, 1]:
+		group.add(salary)
+	group.remove(1)
+	assert (group.minimum, group.maximum) == (1, 9)
+	group.remove(1)
+	group.remove(9)
+	assert (group.minimum, group.maximum, group.count) == (5, 5, 1)
+	with pytest.raises(ValueError):
+		group.remove(9)
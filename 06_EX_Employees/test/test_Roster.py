@@ -0,0 +1,80 @@
+from datetime import date
+
+import pytest
+from app.Employees import Employee
+from app.Roster import Roster
+
+
+def make_employee(cpr, department="IT", country="Denmark", educational_level=2, date_of_employment="11/09/2020"):
+	return Employee(cpr, "John", "Doe", department, 50000, educational_level, "11/09/1990", date_of_employment, country)
+
+@pytest.fixture
+def roster():
+	return Roster([
+		make_employee("0000000001", "IT", "Denmark", 1, "01/01/2010"),
+		make_employee("0000000002", "HR", "Denmark", 2, "01/01/2015"),
+		make_employee("0000000003", "IT", "Sweden", 2, "01/01/2020"),
+		make_employee("0000000004", "IT", "Denmark", 2, "01/06/2020"),
+	])
+
+def cprs(employees):
+	return [employee.get_cpr() for employee in employees]
+
+
+def test_get_by_cpr(roster):
+	assert roster.get("0000000003").get_country() == "Sweden"
+	assert roster.get("9999999999") is None
+	assert len(roster) == 4
+
+def test_query_intersects_conditions(roster):
+	assert cprs(roster.query(department="IT")) == ["0000000001", "0000000003", "0000000004"]
+	assert cprs(roster.query(department="IT", country="Denmark", educational_level=2)) == ["0000000004"]
+	assert cprs(roster.query(department="Sales")) == []
+	assert roster.count() == 4
+
+def test_query_employment_range_is_inclusive(roster):
+	assert cprs(roster.query(employed_from="01/01/2015", employed_to="01/01/2020")) == ["0000000002", "0000000003"]
+	assert cprs(roster.query(employed_from=date(2020, 1, 2), country="Denmark")) == ["0000000004"]
+	assert cprs(roster.query(employed_to="31/12/2009")) == []
+
+def test_duplicate_cpr_rejected(roster):
+	with pytest.raises(ValueError):
+		roster.add(make_employee("0000000001"))
+	with pytest.raises(TypeError):
+		roster.add("0000000005")
+
+def test_indexes_follow_setters(roster):
+	employee = roster.get("0000000001")
+	employee.set_department("Sales")
+	employee.set_country("Norway")
+	employee.set_educational_level(3)
+	employee.set_date_of_employment("01/01/2021")
+	employee.set_cpr("0000000009")
+	assert cprs(roster.query(department="IT")) == ["0000000003", "0000000004"]
+	assert cprs(roster.query(department="Sales", country="Norway", educational_level=3, employed_from="01/01/2021")) == ["0000000009"]
+	assert roster.get("0000000001") is None
+	assert roster.get("0000000009") is employee
+
+def test_setter_cannot_create_duplicate_cpr(roster):
+	employee = roster.get("0000000001")
+	with pytest.raises(ValueError):
+		employee.set_cpr("0000000002")
+	assert employee.get_cpr() == "0000000001"
+	assert roster.get("0000000001") is employee
+
+def test_veto_rolls_back_earlier_rosters():
+	shared = make_employee("0000000001")
+	first = Roster([shared])
+	second = Roster([shared, make_employee("0000000002")])
+	with pytest.raises(ValueError):
+		shared.set_cpr("0000000002")
+	assert first.get("0000000001") is shared
+	assert first.get("0000000002") is None
+
+def test_remove_stops_tracking(roster):
+	employee = roster.get("0000000002")
+	roster.remove(employee)
+	employee.set_department("IT")
+	assert employee not in roster
+	assert cprs(roster.query(department="HR")) == []
+	assert len(roster.query(department="IT")) == 3
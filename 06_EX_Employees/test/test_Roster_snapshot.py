@@ -0,0 +1,50 @@
+import pytest
+from app.Compact_employee import validated_fields
+from app.Employee_table import EmployeeTable
+from app.Employees import Employee
+from app.Roster_snapshot import RosterSnapshot, write_snapshot, write_snapshot_rows
+
+
+def make_employee(cpr, first_name="John", department="IT", base_salary=50000, country="Denmark"):
+	return Employee(cpr, first_name, "Doe", department, base_salary, 2, "11/09/1990", "11/09/2020", country)
+
+@pytest.fixture
+def employees():
+	return [
+		make_employee("0000000001"),
+		make_employee("0000000002", "Åse", "HR", 61000.5, "Ísland"),
+		make_employee("0000000003", "Anna-Marie", "Sales", 20000, "Denmark"),
+	]
+
+
+def test_round_trip(tmp_path, employees):
+	assert write_snapshot(tmp_path / "roster.snap", employees) == 3
+	with RosterSnapshot(tmp_path / "roster.snap") as snapshot:
+		assert len(snapshot) == 3
+		assert [validated_fields(e) for e in snapshot] == [validated_fields(e) for e in employees]
+		assert snapshot[-1].get_first_name() == "Anna-Marie"
+		assert snapshot[1].get_date_of_employment() == "11/09/2020"
+		assert snapshot[0].getSalary() == employees[0].getSalary()
+		assert list(snapshot.salaries()) == [e.getSalary() for e in employees]
+		with pytest.raises(IndexError):
+			snapshot[3]
+
+def test_strings_are_pooled(tmp_path):
+	rows = [validated_fields(make_employee(f"{i:010d}")) for i in range(10_000)]
+	write_snapshot_rows(tmp_path / "roster.snap", rows)
+	size = (tmp_path / "roster.snap").stat().st_size
+	assert size < 10_000 * 50
+	with RosterSnapshot(tmp_path / "roster.snap") as snapshot:
+		assert list(EmployeeTable.from_employees(snapshot).salaries()) == list(snapshot.salaries())
+		assert snapshot[9999].get_cpr() == "0000009999"
+
+def test_empty_snapshot(tmp_path):
+	write_snapshot(tmp_path / "roster.snap", [])
+	with RosterSnapshot(tmp_path / "roster.snap") as snapshot:
+		assert list(snapshot) == []
+
+@pytest.mark.parametrize("content", [b"", b"EMPSNAP1" + bytes(16), b"NOTSNAP!" + bytes(16)])
+def test_rejects_other_files(tmp_path, content):
+	(tmp_path / "roster.snap").write_bytes(content)
+	with pytest.raises(ValueError):
+		RosterSnapshot(tmp_path / "roster.snap")
@@ -1,4 +1,13 @@
 # Decision logic for driver's license evaluation
+try:
+	import numpy
+except ImportError:  # NumPy is optional, evaluate_candidates falls back to plain Python
+	numpy = None
+
+THEORY_PASS_SCORE = 85
+THEORY_MAX_SCORE = 100
+PRACTICAL_MAX_ERRORS = 2
+
 def evaluate_candidate(theory, practical):
 	# Handle invalid values
 	if theory < 0 or practical < 0:
@@ -23,3 +32,46 @@ def evaluate_candidate(theory, practical):
 		"repeat_practical": repeat_practical,
 		"extra_lessons": extra_lessons
 	}
+
+def evaluate_candidates(theory, practical):
+	"""
+	Evaluate many candidates at once, with the same rules as evaluate_candidate.
+	:param theory: sequence of theory scores, or a NumPy array
+	:param practical: sequence of practical error counts, or a NumPy array
+	:return: dict with the evaluate_candidate keys, each mapped to a list of
+		bools (or a NumPy bool array when given NumPy arrays), one per candidate
+	"""
+	if len(theory) != len(practical):
+		raise ValueError("theory and practical must have the same length")
+	if numpy is not None and (isinstance(theory, numpy.ndarray) or isinstance(practical, numpy.ndarray)):
+		return _evaluate_candidates_ndarray(numpy.asarray(theory), numpy.asarray(practical))
+	# Invalid candidates (a negative score) get no license, practical repeat or
+	# extra lessons. Validity is "not negative" rather than ">= 0" so that NaN
+	# scores behave exactly as in evaluate_candidate.
+	valid = [not (t < 0 or p < 0) for t, p in zip(theory, practical)]
+	repeat_theory = [t < THEORY_PASS_SCORE for t in theory]
+	repeat_practical = [v and p > PRACTICAL_MAX_ERRORS for v, p in zip(valid, practical)]
+	extra_lessons = [rp and rt for rp, rt in zip(repeat_practical, repeat_theory)]
+	# Theory above the maximum still counts as passing, even with too many practical errors
+	license_granted = [
+		v and (t > THEORY_MAX_SCORE or (t >= THEORY_PASS_SCORE and p <= PRACTICAL_MAX_ERRORS))
+		for v, t, p in zip(valid, theory, practical)
+	]
+	return {
+		"license_granted": license_granted,
+		"repeat_theory": repeat_theory,
+		"repeat_practical": repeat_practical,
+		"extra_lessons": extra_lessons
+	}
+
+def _evaluate_candidates_ndarray(theory, practical):
+	valid = ~((theory < 0) | (practical < 0))
+	repeat_theory = theory < THEORY_PASS_SCORE
+	repeat_practical = valid & (practical > PRACTICAL_MAX_ERRORS)
+	passed = ((theory >= THEORY_PASS_SCORE) & (practical <= PRACTICAL_MAX_ERRORS)) | (theory > THEORY_MAX_SCORE)
+	return {
+		"license_granted": valid & passed,
+		"repeat_theory": repeat_theory,
+		"repeat_practical": repeat_practical,
+		"extra_lessons": repeat_practical & repeat_theory
+	}
@@ -0,0 +1,263 @@
+# Streaming processing of exam results: rolling outcome counts per test centre
+import csv
+import json
+import math
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from app.Drivers_license import evaluate_candidate
+
+FLAGS = ("license_granted", "repeat_theory", "repeat_practical", "extra_lessons")
+
+
+class ScoreHistogram:
+	"""
+	Mergeable histogram of theory scores with unit-width bins.
+
+	Memory depends on the range of scores seen, not on the number of
+	results. Quantiles are exact to within one score point.
+	"""
+
+	def __init__(self):
+		self.bins = Counter()
+		self.count = 0
+
+	def add(self, score):
+		self.bins[math.floor(score)] += 1
+		self.count += 1
+
+	def merge(self, other):
+		self.bins.update(other.bins)
+		self.count += other.count
+
+	def quantile(self, q):
+		"""Lower edge of the bin holding the q-quantile (0 <= q <= 1), or None if empty."""
+		if not 0 <= q <= 1:
+			raise ValueError("q must be between 0 and 1")
+		if not self.count:
+			return None
+		rank = max(1, math.ceil(q * self.count))
+		seen = 0
+		for score in sorted(self.bins):
+			seen += self.bins[score]
+			if seen >= rank:
+				return score
+
+
+class _CentreWindow:
+	# A ring of buckets; slot i holds bucket id b with b % len(ids) == i
+	__slots__ = ("ids", "counts")
+
+	def __init__(self, buckets):
+		self.ids = [None] * buckets
+		self.counts = [None] * buckets
+
+	def add(self, bucket, flags):
+		slot = bucket % len(self.ids)
+		if self.ids[slot] != bucket:
+			if self.ids[slot] is not None and self.ids[slot] > bucket:
+				return False  # the slot already holds a newer bucket
+			self.ids[slot] = bucket
+			self.counts[slot] = [0] * (len(FLAGS) + 1)
+		counts = self.counts[slot]
+		counts[0] += 1
+		for index, flag in enumerate(flags, start=1):
+			counts[index] += flag
+		return True
+
+	def merge(self, other):
+		for slot, bucket in enumerate(other.ids):
+			if bucket is None:
+				continue
+			if self.ids[slot] == bucket:
+				self.counts[slot] = [a + b for a, b in zip(self.counts[slot], other.counts[slot])]
+			elif self.ids[slot] is None or self.ids[slot] < bucket:
+				self.ids[slot] = bucket
+				self.counts[slot] = list(other.counts[slot])
+
+	def totals(self, oldest_bucket):
+		totals = [0] * (len(FLAGS) + 1)
+		for bucket, counts in zip(self.ids, self.counts):
+			if bucket is not None and bucket >= oldest_bucket:
+				totals = [a + b for a, b in zip(totals, counts)]
+		return totals
+
+
+class ExamStream:
+	"""
+	Live statistics over a stream of exam results.
+
+	Each record is a mapping with "centre", "timestamp" (seconds), "theory"
+	and "practical". Records are evaluated with evaluate_candidate, and the
+	outcome flags are counted per centre in a sliding window of
+	window_seconds, split into buckets of bucket_seconds. Memory is
+	constant per centre. Records older than the window are counted as late
+	and ignored. Theory scores also go into a ScoreHistogram for quantiles;
+	missing (NaN) scores are evaluated but left out of the histogram.
+	Malformed records (a missing field, a non-numeric score or a timestamp
+	that is not a finite number) are counted as rejected and change nothing
+	else, so one bad record never stops the stream.
+
+	Streams built with the same window settings can be merged, e.g. after
+	processing partitions of the results in separate processes.
+	"""
+
+	def __init__(self, window_seconds=3600, bucket_seconds=60):
+		if bucket_seconds <= 0 or window_seconds < bucket_seconds:
+			raise ValueError("Need 0 < bucket_seconds <= window_seconds")
+		self.window_seconds = window_seconds
+		self.bucket_seconds = bucket_seconds
+		self._buckets = math.ceil(window_seconds / bucket_seconds)
+		self._centres = {}
+		self.theory_scores = ScoreHistogram()
+		self.records = 0
+		self.late = 0
+		self.rejected = 0
+		self.latest_bucket = None
+
+	def add(self, record):
+		# Everything that can fail runs before any state changes
+		try:
+			theory = record["theory"]
+			result = evaluate_candidate(theory, record["practical"])
+			bucket = math.floor(record["timestamp"] / self.bucket_seconds)
+			centre = record["centre"]
+			window = self._centres.get(centre)
+			scored = math.isfinite(theory)
+		except (KeyError, TypeError, ValueError, OverflowError):
+			self.rejected += 1
+			return
+		self.records += 1
+		if scored:
+			self.theory_scores.add(theory)
+		if self.latest_bucket is None or bucket > self.latest_bucket:
+			self.latest_bucket = bucket
+		elif bucket <= self.latest_bucket - self._buckets:
+			self.late += 1
+			return
+		if window is None:
+			window = self._centres[centre] = _CentreWindow(self._buckets)
+		if not window.add(bucket, [result[flag] for flag in FLAGS]):
+			self.late += 1
+
+	def process(self, records, snapshot_every=10_000):
+		"""
+		Add every record and yield a snapshot after each snapshot_every
+		records, plus a final one if records were added since the last.
+		"""
+		if snapshot_every <= 0:
+			raise ValueError("snapshot_every must be positive")
+		return self._process(records, snapshot_every)
+
+	def _process(self, records, snapshot_every):
+		pending = 0
+		for record in records:
+			self.add(record)
+			pending += 1
+			if pending == snapshot_every:
+				pending = 0
+				yield self.snapshot()
+		if pending:
+			yield self.snapshot()
+
+	def merge(self, other):
+		if (other.window_seconds, other.bucket_seconds) != (self.window_seconds, self.bucket_seconds):
+			raise ValueError("Only streams with the same window settings can be merged")
+		for centre, window in other._centres.items():
+			if centre in self._centres:
+				self._centres[centre].merge(window)
+			else:
+				merged = self._centres[centre] = _CentreWindow(self._buckets)
+				merged.merge(window)
+		self.theory_scores.merge(other.theory_scores)
+		self.records += other.records
+		self.late += other.late
+		self.rejected += other.rejected
+		if other.latest_bucket is not None and (self.latest_bucket is None or other.latest_bucket > self.latest_bucket):
+			self.latest_bucket = other.latest_bucket
+		return self
+
+	def centre_counts(self, centre):
+		"""Counts in the current window: {"records": n, "license_granted": n, ...}."""
+		window = self._centres.get(centre)
+		if window is None or self.latest_bucket is None:
+			totals = [0] * (len(FLAGS) + 1)
+		else:
+			totals = window.totals(self.latest_bucket - self._buckets + 1)
+		return dict(zip(("records",) + FLAGS, totals))
+
+	def snapshot(self, quantiles=(0.1, 0.5, 0.9)):
+		centres = {}
+		for centre in self._centres:
+			counts = self.centre_counts(centre)
+			if counts["records"]:
+				counts["pass_rate"] = counts["license_granted"] / counts["records"]
+				centres[centre] = counts
+		return {
+			"records": self.records,
+			"late": self.late,
+			"rejected": self.rejected,
+			"window_end": None if self.latest_bucket is None else (self.latest_bucket + 1) * self.bucket_seconds,
+			"centres": centres,
+			"theory_quantiles": {q: self.theory_scores.quantile(q) for q in quantiles},
+		}
+
+
+def _number(value):
+	try:
+		number = float(value)
+	except ValueError:
+		return value  # left as text, so ExamStream.add rejects the record
+	return int(number) if number.is_integer() else number
+
+def _timestamp(value):
+	try:
+		return float(value)
+	except ValueError:
+		return value
+
+def read_results(path):
+	"""
+	Yield result records from a CSV file (header: centre, timestamp, theory,
+	practical) or a JSONL file with one object per line. Values or lines that
+	cannot be parsed are passed on as they are, for ExamStream to reject.
+	"""
+	with open(path, newline="", encoding="utf-8") as file:
+		if str(path).lower().endswith(".csv"):
+			for row in csv.DictReader(file):
+				yield {
+					"centre": row["centre"],
+					"timestamp": _timestamp(row["timestamp"]),
+					"theory": _number(row["theory"]),
+					"practical": _number(row["practical"]),
+				}
+		else:
+			for line in file:
+				if line.strip():
+					try:
+						yield json.loads(line)
+					except ValueError:
+						yield line
+
+
+def _process_file(path, window_seconds, bucket_seconds):
+	stream = ExamStream(window_seconds, bucket_seconds)
+	for record in read_results(path):
+		stream.add(record)
+	return stream
+
+def process_files(paths, window_seconds=3600, bucket_seconds=60, workers=None):
+	"""
+	Process each file into its own ExamStream, on a process pool when
+	workers > 1, and return the merged stream.
+	"""
+	paths = list(paths)
+	merged = ExamStream(window_seconds, bucket_seconds)
+	if workers is None or workers <= 1:
+		for path in paths:
+			merged.merge(_process_file(path, window_seconds, bucket_seconds))
+		return merged
+	with ProcessPoolExecutor(max_workers=workers) as pool:
+		for stream in pool.map(_process_file, paths, [window_seconds] * len(paths), [bucket_seconds] * len(paths)):
+			merged.merge(stream)
+	return merged
@@ -0,0 +1,37 @@
+"""
+Evaluating a national batch of exam results: evaluate_candidate per
+candidate against evaluate_candidates on lists and on NumPy arrays.
+
+Run from the exercise folder:  python -m benchmarks.bench_Drivers_license [candidates]
+"""
+import random
+import sys
+import time
+
+from app.Drivers_license import evaluate_candidate, evaluate_candidates
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+
+def main(count=1_000_000):
+	theory = [random.randint(-1, 110) for _ in range(count)]
+	practical = [random.randint(-1, 6) for _ in range(count)]
+	runs = [
+		("per candidate", lambda: [evaluate_candidate(t, p) for t, p in zip(theory, practical)]),
+		("lists", lambda: evaluate_candidates(theory, practical)),
+	]
+	if numpy is not None:
+		theory_array = numpy.array(theory)
+		practical_array = numpy.array(practical)
+		runs.append(("NumPy", lambda: evaluate_candidates(theory_array, practical_array)))
+	for name, func in runs:
+		start = time.perf_counter()
+		func()
+		print(f"{name:>14}: {count / (time.perf_counter() - start):>14,.0f} candidates/s")
+
+
+if __name__ == "__main__":
+	main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,38 @@
+"""
+Throughput of ExamStream over a day of results from many test centres,
+with periodic snapshots, and the cost of merging partitioned streams.
+
+Run from the exercise folder:  python -m benchmarks.bench_Exam_stream [records] [centres]
+"""
+import random
+import sys
+import time
+
+from app.Exam_stream import ExamStream
+
+
+def main(count=1_000_000, centres=50):
+	names = [f"Centre {i}" for i in range(centres)]
+	records = [
+		{"centre": random.choice(names), "timestamp": i * 86_400 / count, "theory": random.randint(40, 100), "practical": random.randint(0, 5)}
+		for i in range(count)
+	]
+	stream = ExamStream(window_seconds=3600, bucket_seconds=60)
+	start = time.perf_counter()
+	snapshots = sum(1 for _ in stream.process(records, snapshot_every=10_000))
+	elapsed = time.perf_counter() - start
+	print(f"   stream: {count / elapsed:>10,.0f} records/s ({snapshots} snapshots)")
+
+	parts = [ExamStream(window_seconds=3600, bucket_seconds=60) for _ in range(4)]
+	for index, record in enumerate(records):
+		parts[index % 4].add(record)
+	start = time.perf_counter()
+	merged = ExamStream(window_seconds=3600, bucket_seconds=60)
+	for part in parts:
+		merged.merge(part)
+	print(f"    merge: {(time.perf_counter() - start) * 1000:>10.1f} ms for 4 partitions")
+	assert merged.snapshot()["centres"] == stream.snapshot()["centres"]
+
+
+if __name__ == "__main__":
+	main(*(int(arg) for arg in sys.argv[1:3]))
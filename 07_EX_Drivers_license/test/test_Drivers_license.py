@@ -1,5 +1,8 @@
+import itertools
+import math
+
 import pytest
-from app.Drivers_license import evaluate_candidate
+from app.Drivers_license import evaluate_candidate, evaluate_candidates
 
 @pytest.mark.parametrize("theory, practical, expected", [
 	# Decision table cases
@@ -23,3 +26,27 @@ from app.Drivers_license import evaluate_candidate
 def test_evaluate_candidate(theory, practical, expected):
 	result = evaluate_candidate(theory, practical)
 	assert result == expected
+
+SCORES = [-5, -1, 0, 2, 3, 50, 84, 84.5, 85, 86, 100, 101, 150, math.nan]  # NaN marks a missing score
+PAIRS = list(itertools.product(SCORES, SCORES))
+
+def _rows(batch):
+	return [{key: bool(values[i]) for key, values in batch.items()} for i in range(len(PAIRS))]
+
+def test_evaluate_candidates_matches_evaluate_candidate():
+	theory, practical = zip(*PAIRS)
+	batch = evaluate_candidates(list(theory), list(practical))
+	assert all(type(value) is bool for values in batch.values() for value in values)
+	assert _rows(batch) == [evaluate_candidate(t, p) for t, p in PAIRS]
+
+def test_evaluate_candidates_ndarray():
+	numpy = pytest.importorskip("numpy")
+	theory, practical = zip(*PAIRS)
+	batch = evaluate_candidates(numpy.array(theory), numpy.array(practical))
+	assert all(values.dtype == bool for values in batch.values())
+	assert _rows(batch) == [evaluate_candidate(t, p) for t, p in PAIRS]
+
+def test_evaluate_candidates_empty_and_length_mismatch():
+	assert evaluate_candidates([], []) == {"license_granted": [], "repeat_theory": [], "repeat_practical": [], "extra_lessons": []}
+	with pytest.raises(ValueError):
+		evaluate_candidates([85, 90], [0])
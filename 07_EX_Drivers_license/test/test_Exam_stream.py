@@ -0,0 +1,125 @@
+import json
+import pickle
+import random
+
+import pytest
+from app.Drivers_license import evaluate_candidate
+from app.Exam_stream import ExamStream, ScoreHistogram, process_files, read_results
+
+
+def record(centre, timestamp, theory=90, practical=0):
+	return {"centre": centre, "timestamp": timestamp, "theory": theory, "practical": practical}
+
+
+def test_counts_per_centre():
+	stream = ExamStream(window_seconds=600, bucket_seconds=60)
+	stream.add(record("Aarhus", 0))
+	stream.add(record("Aarhus", 10, theory=70, practical=5))
+	stream.add(record("Odense", 20, theory=101, practical=4))
+	assert stream.centre_counts("Aarhus") == {"records": 2, "license_granted": 1, "repeat_theory": 1, "repeat_practical": 1, "extra_lessons": 1}
+	assert stream.centre_counts("Odense")["license_granted"] == 1
+	assert stream.centre_counts("Vejle")["records"] == 0
+
+def test_window_slides_and_late_records_are_dropped():
+	stream = ExamStream(window_seconds=300, bucket_seconds=60)
+	for minute in range(10):
+		stream.add(record("Aarhus", minute * 60))
+	assert stream.centre_counts("Aarhus")["records"] == 5  # minutes 5 to 9
+	stream.add(record("Aarhus", 4 * 60))
+	assert stream.late == 1
+	stream.add(record("Aarhus", 5 * 60 + 1))  # out of order but inside the window
+	assert stream.centre_counts("Aarhus")["records"] == 6
+	assert stream.records == 12
+
+def test_histogram_quantiles_and_merge():
+	first, second = ScoreHistogram(), ScoreHistogram()
+	for score in range(0, 50):
+		first.add(score)
+	for score in range(50, 100):
+		second.add(score + 0.5)
+	first.merge(second)
+	assert first.count == 100
+	assert first.quantile(0.5) == 49
+	assert first.quantile(0.9) == 89
+	assert first.quantile(0) == 0
+	assert first.quantile(1) == 99
+	assert ScoreHistogram().quantile(0.5) is None
+	with pytest.raises(ValueError):
+		first.quantile(1.5)
+
+def test_merge_equals_single_stream():
+	rng = random.Random(5)
+	records = [record(rng.choice("ABC"), rng.uniform(0, 3600), rng.randint(-1, 110), rng.randint(-1, 6)) for _ in range(3000)]
+	records.sort(key=lambda r: r["timestamp"])
+	whole = ExamStream(window_seconds=900, bucket_seconds=60)
+	for item in records:
+		whole.add(item)
+	parts = [ExamStream(window_seconds=900, bucket_seconds=60) for _ in range(3)]
+	for index, item in enumerate(records):
+		parts[index % 3].add(item)
+	merged = pickle.loads(pickle.dumps(parts[0])).merge(parts[1]).merge(parts[2])
+	assert merged.snapshot() == whole.snapshot()
+	expected_granted = sum(evaluate_candidate(r["theory"], r["practical"])["license_granted"] for r in records if r["centre"] == "A" and r["timestamp"] >= 2700)
+	assert merged.centre_counts("A")["license_granted"] == expected_granted
+	with pytest.raises(ValueError):
+		merged.merge(ExamStream(window_seconds=600, bucket_seconds=60))
+
+def test_process_yields_periodic_snapshots():
+	stream = ExamStream()
+	snapshots = list(stream.process((record("Aarhus", second) for second in range(25)), snapshot_every=10))
+	assert [snapshot["records"] for snapshot in snapshots] == [10, 20, 25]
+	assert snapshots[-1]["centres"]["Aarhus"]["pass_rate"] == 1.0
+	assert snapshots[-1]["theory_quantiles"][0.5] == 90
+	assert snapshots[-1]["window_end"] == 60
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_read_and_process_files(tmp_path, workers):
+	(tmp_path / "a.csv").write_text("centre,timestamp,theory,practical\nAarhus,0,90,0\nAarhus,5,84.5,3\n", encoding="utf-8")
+	(tmp_path / "b.jsonl").write_text(json.dumps(record("Odense", 7, 70, 1)) + "\n\n", encoding="utf-8")
+	assert list(read_results(tmp_path / "a.csv"))[1] == record("Aarhus", 5.0, 84.5, 3)
+	stream = process_files([tmp_path / "a.csv", tmp_path / "b.jsonl"], workers=workers)
+	snapshot = stream.snapshot()
+	assert snapshot["records"] == 3
+	assert snapshot["centres"]["Aarhus"]["extra_lessons"] == 1
+	assert snapshot["centres"]["Odense"]["repeat_theory"] == 1
+
+def test_malformed_records_are_rejected_without_side_effects():
+	stream = ExamStream(window_seconds=600, bucket_seconds=60)
+	stream.add(record("Aarhus", 0))
+	before = stream.snapshot()
+	bad = [
+		{"centre": "Aarhus", "timestamp": 5, "theory": 90},
+		record("Aarhus", "soon"),
+		record("Aarhus", float("nan")),
+		record("Aarhus", float("inf")),
+		record("Aarhus", 5, theory="90"),
+		record(["Aarhus"], 5),
+		"not a record",
+	]
+	for item in bad:
+		stream.add(item)
+	assert stream.rejected == len(bad)
+	assert {**stream.snapshot(), "rejected": 0} == {**before, "rejected": 0}
+
+def test_nan_theory_is_evaluated_but_not_in_histogram():
+	stream = ExamStream()
+	stream.add(record("Aarhus", 0, theory=float("nan"), practical=0))
+	stream.add(record("Aarhus", 1, theory=70, practical=0))
+	assert (stream.records, stream.rejected) == (2, 0)
+	assert stream.theory_scores.count == 1
+	assert stream.centre_counts("Aarhus")["records"] == 2
+
+def test_rejected_counts_merge_and_survive_file_parsing(tmp_path):
+	(tmp_path / "a.csv").write_text("centre,timestamp,theory,practical\nAarhus,0,90,0\nAarhus,x,90,0\nAarhus,5,?,0\n", encoding="utf-8")
+	(tmp_path / "b.jsonl").write_text(json.dumps(record("Odense", 7)) + "\n{broken\n", encoding="utf-8")
+	stream = process_files([tmp_path / "a.csv", tmp_path / "b.jsonl"], workers=2)
+	assert (stream.records, stream.rejected) == (2, 3)
+	assert stream.snapshot()["rejected"] == 3
+
+def test_process_rejects_non_positive_snapshot_every():
+	with pytest.raises(ValueError):
+		ExamStream().process([], snapshot_every=0)
+
+def test_invalid_window():
+	with pytest.raises(ValueError):
+		ExamStream(window_seconds=30, bucket_seconds=60)